@@ -24,7 +24,8 @@ To add a new plugin to the server, follow these steps:
 EXAMPLE: Adding a Database Query Plugin
 ---------------------------------------
 
-Step 1: Import the plugin (add near other imports):
+Step 1: Import the plugin inside main(), next to the other plugin imports
+(plugins are imported lazily so --help/--version never load them):
 
     from src.plugins.dbquery import DBQueryPlugin
 
@@ -70,14 +71,143 @@ for an example of how to mock external dependencies.
 from __future__ import annotations
 
 import argparse
+import errno
+import os
+import socket
+import stat
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.plugins.bugtracker import BugTrackerPlugin
-from src.plugins.figma_stories import FigmaStoriesPlugin
-from src.plugins.websearch import WebSearchPlugin
-from src.protocol.transport import StdioTransport
-from src.server import MCPServer
+if TYPE_CHECKING:
+    from src.server import MCPServer
+
+# Socket file name used by --persist
+PERSIST_SOCKET_NAME = "mcp-secure.sock"
+
+
+def default_socket_path() -> Path:
+    """Get the default Unix socket path for persistent mode.
+
+    Uses $XDG_RUNTIME_DIR (a per-user, mode 0700 directory) when set,
+    falling back to ~/.mcp-secure/.
+
+    Returns:
+        Path to the persistent-mode socket.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / PERSIST_SOCKET_NAME
+    return Path.home() / ".mcp-secure" / PERSIST_SOCKET_NAME
+
+
+def serve_persistent(server: MCPServer, socket_path: Path) -> int:
+    """Serve MCP sessions over a Unix socket from one long-lived process.
+
+    Policy, plugins and their resources (e.g. the bug tracker database) are
+    loaded once; each accepted connection is a new MCP session speaking the
+    same newline-delimited JSON-RPC as stdio. Clients reach it through a
+    stdio proxy such as ``socat - UNIX-CONNECT:<socket>``.
+
+    Connections are served one at a time: plugins and the rate limiter are
+    not thread-safe, and a local MCP client holds a single session.
+
+    A client whose session fails (malformed input, a plugin error escaping
+    the server) is disconnected and logged; the daemon keeps accepting.
+
+    SECURITY: The socket is created with mode 0600, so only the current
+    user can connect. An existing file at socket_path is only replaced if
+    it is a stale socket; one another instance still listens on is left
+    alone and startup fails.
+
+    Args:
+        server: Fully initialized server with plugins registered.
+        socket_path: Path to bind the Unix socket at.
+
+    Returns:
+        Exit code (0 for success, non-zero for errors).
+    """
+    from src.protocol.transport import StdioTransport
+
+    log = StdioTransport()
+
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    try:
+        is_socket = stat.S_ISSOCK(socket_path.lstat().st_mode)
+    except FileNotFoundError:
+        is_socket = False
+    if is_socket:
+        # Only a socket nobody listens on is stale; never take over a live one
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+            except OSError as e:
+                if e.errno != errno.ECONNREFUSED:
+                    log.log(f"Error: cannot probe {socket_path}: {e}")
+                    return 1
+                socket_path.unlink()
+            else:
+                log.log(f"Error: another server is listening on {socket_path}")
+                return 1
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(str(socket_path))
+    except OSError as e:
+        listener.close()
+        log.log(f"Error: cannot bind {socket_path}: {e}")
+        return 1
+    finally:
+        os.umask(old_umask)
+
+    listener.listen()
+    log.log(f"Persistent mode listening on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = listener.accept()
+            log.log("Client connected")
+            try:
+                _serve_connection(server, conn)
+            except OSError as e:
+                log.log(f"Client connection error: {e}")
+            except Exception as e:
+                # e.g. UnicodeDecodeError on a non-UTF-8 line: drop this client only
+                log.log(f"Client session error: {type(e).__name__}: {e}")
+            finally:
+                server.reset_session()
+            log.log("Client disconnected")
+
+    except KeyboardInterrupt:
+        log.log("Interrupted, shutting down")
+        return 130  # Standard exit code for SIGINT
+
+    finally:
+        listener.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _serve_connection(server: MCPServer, conn: socket.socket) -> None:
+    """Run one MCP session over an accepted connection until the client hangs up.
+
+    Args:
+        server: Server handling the session's messages.
+        conn: Accepted Unix socket connection; closed on return.
+    """
+    from src.protocol.transport import StdioTransport
+
+    # MCP messages are UTF-8 whatever the daemon's locale
+    with (
+        conn,
+        conn.makefile("r", encoding="utf-8") as reader,
+        conn.makefile("w", encoding="utf-8") as writer,
+    ):
+        transport = StdioTransport(stdin=reader, stdout=writer)
+        while (message := transport.read_message()) is not None:
+            response = server.handle_message(message)
+            if response is not None:
+                transport.write_message(response)
 
 
 def main() -> int:
@@ -103,6 +233,17 @@ def main() -> int:
         action="version",
         version="mcp-secure-local 1.0.0",
     )
+    parser.add_argument(
+        "--persist",
+        action="store_true",
+        help="Stay resident and serve sessions over a Unix socket instead of stdio",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help=f"Socket path for --persist (default: $XDG_RUNTIME_DIR/{PERSIST_SOCKET_NAME})",
+    )
 
     args = parser.parse_args()
 
@@ -111,6 +252,11 @@ def main() -> int:
         print(f"Error: Policy file not found: {args.policy}", file=sys.stderr)
         return 1
 
+    # Server and plugin modules are imported only once we know we will run,
+    # so --help, --version and a missing policy exit without loading them.
+    from src.protocol.transport import StdioTransport
+    from src.server import MCPServer
+
     # Initialize server
     try:
         server = MCPServer(policy_path=args.policy)
@@ -129,10 +275,25 @@ def main() -> int:
     # Each plugin's tools will automatically appear in the MCP tools/list response.
     # The security layer will validate all inputs before your plugin sees them.
     # -------------------------------------------------------------------------
+    from src.plugins.figma_stories import FigmaStoriesPlugin
+    from src.plugins.websearch import WebSearchPlugin
+
     server.register_plugin(WebSearchPlugin())
-    server.register_plugin(BugTrackerPlugin())
+
+    # Bug tracker is on by default; MCP_ENABLE_BUGTRACKER=0 skips importing it
+    if os.environ.get("MCP_ENABLE_BUGTRACKER", "1") != "0":
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        server.register_plugin(BugTrackerPlugin())
+
     server.register_plugin(FigmaStoriesPlugin())
 
+    # Open plugin resources (e.g. the bug tracker database) before serving
+    server.startup()
+
+    if args.persist:
+        return serve_persistent(server, args.socket or default_socket_path())
+
     # Setup transport
     transport = StdioTransport()
     transport.log("MCP Secure Local Server started")
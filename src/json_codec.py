@@ -0,0 +1,41 @@
+"""Shared JSON codec.
+
+orjson is used when installed (the "fast" extra); otherwise the stdlib json
+module, with each encoder built once rather than per call. Modules that
+serialize JSON import from here, so the choice is made in one place.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so parse failures
+are handled the same either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Whether the orjson codec is active
+HAS_ORJSON = orjson is not None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(value: Any) -> str:
+        """Serialize for the JSON-RPC wire (non-string keys allowed, as in json)."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def dumps_compact(value: Any) -> str:
+        """Serialize without whitespace, e.g. for storage in TEXT columns."""
+        return orjson.dumps(value).decode()
+
+    def dumps_indented(value: Any) -> str:
+        """Serialize with two-space indentation, for tool output."""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+else:
+    loads = json.loads
+    dumps = json.dumps
+    dumps_compact = json.JSONEncoder(separators=(",", ":")).encode
+    dumps_indented = json.JSONEncoder(indent=2).encode
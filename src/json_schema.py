@@ -0,0 +1,55 @@
+"""Shared JSON Schema validator cache.
+
+Tool definitions and the security layer's input validator both validate
+arguments against tool input schemas. They compile each schema once here,
+so equal schemas share a single validator whichever layer sees them first.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import TYPE_CHECKING, Any
+
+from jsonschema.validators import validator_for
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+
+@functools.lru_cache(maxsize=512)
+def compile_validator(schema_key: str) -> Validator:
+    """Compile the validator for a schema given as canonical JSON.
+
+    Keyed by canonical schema JSON, so definitions that plugins rebuild on
+    every get_tools() call, and identical schemas across plugins, share one
+    validator. The cache is bounded for plugins that generate schemas.
+
+    Args:
+        schema_key: JSON Schema serialized with sorted keys.
+
+    Returns:
+        Validator for the schema's declared draft (latest by default).
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    schema = json.loads(schema_key)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def get_validator(schema: dict[str, Any]) -> Validator:
+    """Return the cached validator for a JSON Schema, compiling it once.
+
+    Args:
+        schema: JSON Schema to validate against.
+
+    Returns:
+        Validator for the schema's declared draft (latest by default).
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    return compile_validator(json.dumps(schema, sort_keys=True))
@@ -186,10 +186,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.json_schema import get_validator
 
-@dataclass
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from jsonschema.protocols import Validator
+
+
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of a tool provided by a plugin."""
 
@@ -198,6 +205,34 @@ class ToolDefinition:
     input_schema: dict[str, Any]
     aliases: list[str] = field(default_factory=list)
     intent_categories: list[str] = field(default_factory=list)
+    _validator: Validator | None = field(default=None, init=False, repr=False, compare=False)
+
+    def validate(self, arguments: Any) -> None:
+        """Validate tool arguments against the input schema.
+
+        Args:
+            arguments: Arguments from a tools/call request.
+
+        Raises:
+            jsonschema.ValidationError: If the arguments do not match.
+        """
+        validator = self._validator
+        if validator is None:
+            validator = self.compile_validator()
+        validator.validate(arguments)
+
+    def compile_validator(self) -> Validator:
+        """Return the input schema validator, compiling it on first use.
+
+        Returns:
+            Validator shared by every definition with an equal schema.
+
+        Raises:
+            jsonschema.SchemaError: If the input schema itself is invalid.
+        """
+        if self._validator is None:
+            self._validator = get_validator(self.input_schema)
+        return self._validator
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to MCP tool format.
@@ -212,7 +247,7 @@ class ToolDefinition:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution."""
 
@@ -245,8 +280,10 @@ class PluginBase(ABC):
     Lifecycle:
         1. Plugin is instantiated (with any config in __init__)
         2. Plugin is registered with server via server.register_plugin(plugin)
-        3. get_tools() is called when MCP client requests tools/list
-        4. execute() is called when MCP client calls tools/call
+        3. startup() is called once when the server starts (server.startup())
+        4. get_tools() is called when MCP client requests tools/list
+        5. execute() is called when MCP client calls tools/call
+        6. cleanup() is called when the server shuts down
 
     Security:
         - The security layer validates all inputs BEFORE execute() is called
@@ -271,11 +308,14 @@ class PluginBase(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def get_tools(self) -> list[ToolDefinition]:
+    def get_tools(self) -> Sequence[ToolDefinition]:
         """Return tool definitions provided by this plugin.
 
+        Plugins with static tools can return a shared module-level tuple;
+        callers must not mutate the result.
+
         Returns:
-            List of ToolDefinition objects.
+            Sequence of ToolDefinition objects.
         """
         pass  # pragma: no cover
 
@@ -292,6 +332,17 @@ class PluginBase(ABC):
         """
         pass  # pragma: no cover
 
+    def startup(self) -> None:  # noqa: B027
+        """Prepare plugin resources before the first request.
+
+        Called once when the server starts, after all plugins are
+        registered. Override this method to open connections or warm
+        caches up front, so the first tool call does not pay for them.
+
+        The default implementation does nothing.
+        """
+        pass
+
     def cleanup(self) -> None:  # noqa: B027
         """Clean up plugin resources.
 
@@ -6,16 +6,28 @@ and cross-project search capabilities.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import os
+import secrets
 import sqlite3
-from dataclasses import dataclass
-from datetime import UTC
+import stat
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from cachetools import TTLCache
+
+from src.json_codec import dumps_compact, dumps_indented, loads
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
 from src.plugins.base import PluginBase, ToolDefinition, ToolResult
 
@@ -30,29 +42,64 @@ def get_global_db_path() -> Path:
     Returns:
         Path to ~/.mcp-bugtracker/bugs.db
     """
-    home = Path(os.environ.get("HOME", os.path.expanduser("~")))
-    return home / ".mcp-bugtracker" / "bugs.db"
+    return _home_dir(os.environ.get("HOME")) / ".mcp-bugtracker" / "bugs.db"
+
 
+@functools.lru_cache(maxsize=8)
+def _home_dir(home: str | None) -> Path:
+    """Resolve the home directory for a given $HOME value.
+
+    ``os.path.expanduser`` falls back to a passwd lookup when $HOME is unset,
+    so it is only consulted in that case and the result is memoized. Keying
+    on the $HOME value keeps callers that change HOME working.
+    """
+    return Path(home if home is not None else os.path.expanduser("~"))
 
+
+@functools.lru_cache(maxsize=256)
 def compute_project_id(project_path: str) -> str:
     """Compute a stable project ID from a path.
 
     Format: basename-hash8 (e.g., "my-project-a1b2c3d4")
 
+    Results are memoized per path string, since every tool call that
+    touches a project computes its ID.
+
     Args:
         project_path: Absolute path to the project directory.
 
     Returns:
         Project ID string.
     """
-    import hashlib
-
     resolved = Path(project_path).resolve()
     name = resolved.name
+    # Project IDs are stored with every bug, so the hash must never change:
+    # switching algorithms would orphan existing bugs from their projects.
     hash_suffix = hashlib.sha256(str(resolved).encode()).hexdigest()[:8]
     return f"{name}-{hash_suffix}"
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_project(project_path_str: str) -> tuple[str, str]:
+    """Resolve a project path argument to its project ID and absolute path.
+
+    Memoized per raw string: tools are called repeatedly with the same
+    project_path, and resolving it stats every parent directory.
+
+    Args:
+        project_path_str: Project path as given by the caller.
+
+    Returns:
+        Tuple of (project_id, resolved absolute path).
+
+    Raises:
+        OSError: If the path cannot be resolved.
+        ValueError: If the path is malformed (e.g. contains null bytes).
+    """
+    project_path = str(Path(project_path_str).resolve())
+    return compute_project_id(project_path), project_path
+
+
 # =============================================================================
 # Project Index (for cross-project search) - DEPRECATED
 # =============================================================================
@@ -64,24 +111,40 @@ def get_project_index_path() -> Path:
     Returns:
         Path to ~/.bugtracker/projects.json
     """
-    home = Path(os.environ.get("HOME", os.path.expanduser("~")))
-    return home / ".bugtracker" / "projects.json"
+    return _home_dir(os.environ.get("HOME")) / ".bugtracker" / "projects.json"
+
+
+# Last parsed project index: (path, mtime_ns, size, projects)
+_index_cache: tuple[Path, int, int, list[str]] | None = None
 
 
 def get_indexed_projects() -> list[str]:
     """Get list of all indexed project paths.
 
+    The parsed index is cached and only re-read when the file's mtime or
+    size changes.
+
     Returns:
         List of project paths that have bug trackers initialized.
     """
+    global _index_cache
+
     index_path = get_project_index_path()
-    if not index_path.exists():
+    try:
+        st = index_path.stat()
+    except FileNotFoundError:
         return []
 
+    cached = _index_cache
+    if cached is not None and cached[:3] == (index_path, st.st_mtime_ns, st.st_size):
+        return list(cached[3])
+
     with open(index_path) as f:
         index = json.load(f)
 
-    return index.get("projects", [])
+    projects = index.get("projects", [])
+    _index_cache = (index_path, st.st_mtime_ns, st.st_size, projects)
+    return list(projects)
 
 
 def _register_project_in_index(project_path: str) -> None:  # pragma: no cover
@@ -93,6 +156,12 @@ def _register_project_in_index(project_path: str) -> None:  # pragma: no cover
     Args:
         project_path: Absolute path to the project directory.
     """
+    global _index_cache
+
+    # Already registered: answered from the cached index, no read or write
+    if project_path in get_indexed_projects():
+        return
+
     index_path = get_project_index_path()
 
     # Ensure directory exists
@@ -105,13 +174,13 @@ def _register_project_in_index(project_path: str) -> None:  # pragma: no cover
     else:
         index = {"projects": []}
 
-    # Add project if not already in index
-    if project_path not in index["projects"]:
-        index["projects"].append(project_path)
+    index["projects"].append(project_path)
 
-    # Save index
+    # Save index, then prime the cache so the next read skips the parse
     with open(index_path, "w") as f:
         json.dump(index, f, indent=2)
+    st = index_path.stat()
+    _index_cache = (index_path, st.st_mtime_ns, st.st_size, index["projects"])
 
 
 # =============================================================================
@@ -119,9 +188,34 @@ def _register_project_in_index(project_path: str) -> None:  # pragma: no cover
 # =============================================================================
 
 
-@dataclass
+# Relationship kinds, interned so decoded relationships share one string each
+_RELATIONSHIPS = {
+    name: sys.intern(name)
+    for name in ("duplicate_of", "duplicated_by", "related_to", "blocks", "blocked_by")
+}
+
+# Status and priority values, in the order of the integer codes stored for
+# them in the database
+_STATUSES = ("open", "in_progress", "closed")
+_PRIORITIES = ("low", "medium", "high", "critical")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Used for created_at and history timestamps; each bug write takes the
+    clock once.
+    """
+    return datetime.now(UTC).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class RelatedBug:
-    """Represents a relationship to another bug."""
+    """Represents a relationship to another bug.
+
+    Instances are immutable, so equal relationships decoded from storage
+    share one cached object.
+    """
 
     bug_id: str
     relationship: Literal["duplicate_of", "duplicated_by", "related_to", "blocks", "blocked_by"]
@@ -133,10 +227,16 @@ class RelatedBug:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> RelatedBug:
         """Deserialize from dictionary."""
-        return cls(bug_id=data["bug_id"], relationship=data["relationship"])
+        return _cached_related_bug(data["bug_id"], data["relationship"])
+
 
+@functools.lru_cache(maxsize=4096)
+def _cached_related_bug(bug_id: str, relationship: str) -> RelatedBug:
+    """Build (or reuse) the RelatedBug for a bug_id/relationship pair."""
+    return RelatedBug(bug_id=bug_id, relationship=_RELATIONSHIPS.get(relationship, relationship))
 
-@dataclass
+
+@dataclass(slots=True)
 class HistoryEntry:
     """Represents a change or note in bug history.
 
@@ -155,7 +255,8 @@ class HistoryEntry:
         """
         return {
             "timestamp": self.timestamp,
-            "changes": {k: list(v) for k, v in self.changes.items()},
+            # [*v] skips the global lookup and call of list(v)
+            "changes": {k: [*v] for k, v in self.changes.items()},
             "note": self.note,
         }
 
@@ -165,7 +266,9 @@ class HistoryEntry:
 
         Converts lists back to tuples.
         """
-        changes = {k: tuple(v) for k, v in data.get("changes", {}).items()}
+        # Note-only entries have no changes; skip building an empty comprehension
+        raw = data.get("changes")
+        changes = {k: tuple(v) for k, v in raw.items()} if raw else {}
         return cls(
             timestamp=data["timestamp"],
             changes=changes,
@@ -173,7 +276,7 @@ class HistoryEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Bug:
     """Represents a bug with full history tracking."""
 
@@ -188,6 +291,10 @@ class Bug:
     related_bugs: list[RelatedBug]
     created_at: str  # ISO format
     history: list[HistoryEntry]
+    # related_bugs/history as stored JSON text, for bugs streamed by
+    # BugStore.iter_bugs(); both lists stay empty until decode_lists()
+    _raw_related: str | None = field(default=None, init=False, repr=False, compare=False)
+    _raw_history: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
@@ -200,11 +307,39 @@ class Bug:
             "status": self.status,
             "priority": self.priority,
             "tags": self.tags,
-            "related_bugs": [r.to_dict() for r in self.related_bugs],
+            "related_bugs": self._related_dicts(),
             "created_at": self.created_at,
-            "history": [h.to_dict() for h in self.history],
+            "history": self._history_dicts(),
         }
 
+    def to_json(self) -> str:
+        """Serialize to indented JSON text, as returned by the bug tools."""
+        return dumps_indented(self.to_dict())
+
+    def decode_lists(self) -> Bug:
+        """Decode related_bugs and history if they are still stored JSON text.
+
+        Returns:
+            This bug, with both lists populated.
+        """
+        if self._raw_related is not None:
+            self.related_bugs = [RelatedBug.from_dict(r) for r in loads(self._raw_related)]
+            self._raw_related = None
+        if self._raw_history is not None:
+            self.history = [HistoryEntry.from_dict(h) for h in loads(self._raw_history)]
+            self._raw_history = None
+        return self
+
+    def _related_dicts(self) -> list[dict[str, Any]]:
+        if self._raw_related is not None:
+            return loads(self._raw_related)
+        return [r.to_dict() for r in self.related_bugs]
+
+    def _history_dicts(self) -> list[dict[str, Any]]:
+        if self._raw_history is not None:
+            return loads(self._raw_history)
+        return [h.to_dict() for h in self.history]
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Bug:
         """Deserialize from dictionary."""
@@ -227,12 +362,308 @@ class Bug:
 # Storage Layer
 # =============================================================================
 
+# status and priority are stored as small integer codes (their index in
+# _STATUSES/_PRIORITIES): rows and the listing indexes stay narrow and filters
+# compare integers. SELECTs decode them back to names in SQL.
+_STATUS_CODES = {name: code for code, name in enumerate(_STATUSES)}
+_PRIORITY_CODES = {name: code for code, name in enumerate(_PRIORITIES)}
+
+
+def _sql_decode(column: str, names: Sequence[str]) -> str:
+    """Build a CASE expression mapping a stored integer code to its name."""
+    cases = " ".join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(names))
+    return f"CASE {column} {cases} END"
+
+
+def _sql_encode(column: str, names: Sequence[str], default: int) -> str:
+    """Build a CASE expression mapping a stored name to its integer code."""
+    cases = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+    return f"CASE {column} {cases} ELSE {default} END"
+
+
+_SQL_STATUS = _sql_decode("status", _STATUSES)
+_SQL_PRIORITY = _sql_decode("priority", _PRIORITIES)
+
+# SQL statements are module constants so every call passes the same string and
+# hits sqlite3's per-connection statement cache instead of re-preparing.
+_SQL_INSERT_BUG = (
+    "INSERT INTO bugs (id, project_id, project_path, title, description, "
+    "status, priority, tags, related_bugs, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_UPDATE_BUG = (
+    "UPDATE bugs SET title = ?, description = ?, status = ?, priority = ?, "
+    "tags = ?, related_bugs = ? WHERE id = ?"
+)
+# History lives in the append-only bug_history table: recording an entry is
+# one INSERT whatever the bug's history length. seq numbers entries per bug.
+_SQL_INSERT_HISTORY = (
+    "INSERT INTO bug_history (bug_id, seq, timestamp, changes, note) VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_APPEND_HISTORY = (
+    "INSERT INTO bug_history (bug_id, seq, timestamp, changes, note) "
+    "SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ? FROM bug_history WHERE bug_id = ?"
+)
+_SQL_COUNT_HISTORY = "SELECT COUNT(*) FROM bug_history WHERE bug_id = ?"
+# A bug's history entries aggregated into the JSON array layout of
+# Bug.to_dict()["history"], oldest first
+_SQL_HISTORY = (
+    "(SELECT json_group_array(json_object('timestamp', timestamp, "
+    "'changes', json(changes), 'note', note)) FROM (SELECT timestamp, changes, note "
+    "FROM bug_history WHERE bug_id = bugs.id ORDER BY seq))"
+)
+# Explicit column order for SELECTs; _row_to_bug unpacks rows positionally.
+# Only the constant SQL expressions above are interpolated into statements.
+_SQL_SELECT_BUGS = (
+    f"SELECT id, project_id, project_path, title, description, {_SQL_STATUS}, "  # noqa: S608
+    f"{_SQL_PRIORITY}, tags, related_bugs, created_at, {_SQL_HISTORY} FROM bugs"
+)
+_SQL_SELECT_BUG = _SQL_SELECT_BUGS + " WHERE id = ?"
+# Scalar columns only, for listings that don't need descriptions, tags,
+# related bugs or history; must match _SUMMARY_FIELDS
+_SQL_SELECT_SUMMARIES = (
+    f"SELECT id, project_id, title, {_SQL_STATUS}, {_SQL_PRIORITY}, created_at FROM bugs"  # noqa: S608
+)
+_SUMMARY_FIELDS = ("id", "project_id", "title", "status", "priority", "created_at")
+_SQL_SELECT_PROJECT_BUG = _SQL_SELECT_BUGS + " WHERE id = ? AND project_id = ?"
+_SQL_INSERT_TAG = "INSERT OR IGNORE INTO bug_tags (bug_id, tag) VALUES (?, ?)"
+_SQL_DELETE_TAGS = "DELETE FROM bug_tags WHERE bug_id = ?"
+_SQL_BACKFILL_TAGS = (
+    "INSERT OR IGNORE INTO bug_tags (bug_id, tag) "
+    "SELECT bugs.id, json_each.value FROM bugs, json_each(bugs.tags)"
+)
+
+# Bump when the schema changes; _initialize_schema is skipped for databases
+# whose PRAGMA user_version is already at this value
+_SCHEMA_VERSION = 5
+
+_BUGS_COLUMNS = """(
+        id TEXT PRIMARY KEY,
+        project_id TEXT NOT NULL,
+        project_path TEXT NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        status INTEGER NOT NULL,
+        priority INTEGER NOT NULL,
+        tags TEXT NOT NULL,
+        related_bugs TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )"""
+_SQL_CREATE_HISTORY = """
+    CREATE TABLE IF NOT EXISTS bug_history (
+        bug_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        timestamp TEXT NOT NULL,
+        changes TEXT NOT NULL,
+        note TEXT,
+        PRIMARY KEY (bug_id, seq)
+    ) WITHOUT ROWID;
+"""
+_SQL_CREATE_TABLES = f"""
+    CREATE TABLE IF NOT EXISTS bugs {_BUGS_COLUMNS};
+    {_SQL_CREATE_HISTORY}
+    -- Listing indexes end in created_at so filtered listings come back in
+    -- ORDER BY created_at DESC order (a reverse index scan) without a sort.
+    -- v2 databases have the same names without created_at: rebuild them.
+    DROP INDEX IF EXISTS idx_bugs_project;
+    DROP INDEX IF EXISTS idx_bugs_filters;
+    DROP INDEX IF EXISTS idx_bugs_priority;
+    CREATE INDEX IF NOT EXISTS idx_bugs_project ON bugs(project_id, created_at);
+    -- (project_id, status, priority) serves status filters and status+priority
+    -- filters; it replaces the v1 idx_bugs_status(project_id, status)
+    DROP INDEX IF EXISTS idx_bugs_status;
+    CREATE INDEX IF NOT EXISTS idx_bugs_filters
+        ON bugs(project_id, status, priority, created_at);
+    CREATE INDEX IF NOT EXISTS idx_bugs_priority ON bugs(project_id, priority, created_at);
+    CREATE INDEX IF NOT EXISTS idx_bugs_created_at ON bugs(created_at);
+    -- Tags are mirrored into a join table so tag filters run in SQL
+    CREATE TABLE IF NOT EXISTS bug_tags (
+        bug_id TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (bug_id, tag)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_bug_tags_tag ON bug_tags(tag, bug_id);
+"""
+
+# Full-text index over title/description, kept in sync with bugs by triggers
+_SQL_CREATE_FTS = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS bugs_fts USING fts5(
+        title, description, content='bugs', content_rowid='rowid',
+        tokenize='porter unicode61'
+    );
+    CREATE TRIGGER IF NOT EXISTS bugs_ai AFTER INSERT ON bugs BEGIN
+        INSERT INTO bugs_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS bugs_ad AFTER DELETE ON bugs BEGIN
+        INSERT INTO bugs_fts(bugs_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END;
+    CREATE TRIGGER IF NOT EXISTS bugs_au AFTER UPDATE OF title, description ON bugs BEGIN
+        INSERT INTO bugs_fts(bugs_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO bugs_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END;
+"""
+_SQL_REBUILD_FTS = "INSERT INTO bugs_fts(bugs_fts) VALUES ('rebuild')"
+_SQL_BUGS_COLUMN_TYPES = "SELECT name, type FROM pragma_table_info('bugs')"
+
+
+def _sql_migrate_bugs(text_enums: bool) -> str:
+    """Build the script moving a pre-v5 bugs table to the current layout.
+
+    Before v5, history was a JSON column on bugs; its entries are copied
+    into bug_history. Before v4, status and priority were TEXT; they are
+    converted to integer codes, and names outside the enums (only possible
+    in hand-edited databases) fall back to the add_bug defaults, open and
+    medium. The table is rebuilt keeping rowids so bugs_fts stays valid;
+    dropping the old table drops its indexes and triggers, which the schema
+    script then recreates.
+
+    Args:
+        text_enums: Whether status and priority are stored as TEXT.
+
+    Returns:
+        SQL script, run in one transaction.
+    """
+    status, priority = "status", "priority"
+    if text_enums:
+        status = _sql_encode(status, _STATUSES, 0)
+        priority = _sql_encode(priority, _PRIORITIES, 1)
+    return f"""
+    BEGIN;
+    {_SQL_CREATE_HISTORY}
+    INSERT OR IGNORE INTO bug_history (bug_id, seq, timestamp, changes, note)
+    SELECT bugs.id, entry.key + 1, json_extract(entry.value, '$.timestamp'),
+        COALESCE(json_extract(entry.value, '$.changes'), '{{}}'),
+        json_extract(entry.value, '$.note')
+    FROM bugs, json_each(bugs.history) AS entry;
+    CREATE TABLE bugs_v5 {_BUGS_COLUMNS};
+    INSERT INTO bugs_v5 (rowid, id, project_id, project_path, title, description,
+        status, priority, tags, related_bugs, created_at)
+    SELECT rowid, id, project_id, project_path, title, description,
+        {status}, {priority}, tags, related_bugs, created_at
+    FROM bugs;
+    DROP TABLE bugs;
+    ALTER TABLE bugs_v5 RENAME TO bugs;
+    COMMIT;
+    """  # noqa: S608
+
+
+_SQL_CREATE_SCHEMA = _SQL_CREATE_TABLES + _SQL_CREATE_FTS
+
+# Size of sqlite3's per-connection prepared statement cache
+_STATEMENT_CACHE_SIZE = 256
+
+# Per-connection settings, applied in one call when a connection opens
+_SQL_CONNECTION_PRAGMAS = """
+    -- Enable WAL mode for better concurrency
+    PRAGMA journal_mode=WAL;
+    -- WAL makes NORMAL sync safe (no corruption, only last-commit loss on power cut)
+    PRAGMA synchronous=NORMAL;
+    -- ~20 MB page cache (negative value is in KiB)
+    PRAGMA cache_size=-20000;
+    -- Serve reads from a memory map instead of read() syscalls per page
+    PRAGMA mmap_size=268435456;
+    -- Keep temp b-trees for ORDER BY/GROUP BY off disk
+    PRAGMA temp_store=MEMORY;
+"""
+_SQL_SCHEMA_VERSION = "PRAGMA user_version"
+_SQL_DATA_VERSION = "PRAGMA data_version"
+# Refresh planner statistics where they are stale (a no-op most of the time)
+_SQL_OPTIMIZE = "PRAGMA optimize"
+_SQL_LIST_TABLES = "SELECT name FROM sqlite_master WHERE type = 'table'"
+
+# Renders related_bugs before/after values in history entries. Kept on the
+# stdlib encoder under both codecs so recorded values keep their established
+# format (sorted keys, default separators); built once rather than per call.
+_format_change = json.JSONEncoder(sort_keys=True).encode
+
+
+def _format_bug_list(bugs: Iterable[Bug]) -> str:
+    """Render bugs as an indented JSON array, one bug at a time.
+
+    Produces the same text as ``dumps_indented([b.to_dict() for b in bugs])``
+    without holding every intermediate dict at once. Each bug is rendered at
+    the top level and shifted one indent step; JSON strings never contain raw
+    newlines, so the shift only touches structural line breaks.
+
+    Args:
+        bugs: Bugs to render.
+
+    Returns:
+        JSON array text.
+    """
+    parts = ["  " + bug.to_json().replace("\n", "\n  ") for bug in bugs]
+    if not parts:
+        return "[]"
+    return "[\n" + ",\n".join(parts) + "\n]"
+
+
+@functools.lru_cache(maxsize=64)
+def _list_bugs_sql(
+    by_project: bool,
+    by_status: bool,
+    by_priority: bool,
+    tag_count: int,
+    by_text: bool,
+    select: str = _SQL_SELECT_BUGS,
+) -> str:
+    """Build the list_bugs query for a combination of filters.
+
+    Args:
+        by_project: Whether to filter on project_id.
+        by_status: Whether to filter on status.
+        by_priority: Whether to filter on priority.
+        tag_count: Number of distinct tags the bug must all have (0 for none).
+        by_text: Whether to filter with a full-text match on title/description.
+        select: SELECT ... FROM bugs prefix choosing the returned columns.
+
+    Returns:
+        SQL string with positional placeholders in the order
+        project_id, status, priority, tags..., tag_count, text
+        (for the filters that are enabled).
+    """
+    query = select + " WHERE 1=1"
+    if by_project:
+        query += " AND project_id = ?"
+    if by_status:
+        query += " AND status = ?"
+    if by_priority:
+        query += " AND priority = ?"
+    if tag_count:
+        # Only "?" placeholders are interpolated; tag values are bound as parameters
+        placeholders = ", ".join("?" * tag_count)
+        tagged = f"SELECT bug_id FROM bug_tags WHERE tag IN ({placeholders})"  # noqa: S608
+        query += f" AND id IN ({tagged} GROUP BY bug_id HAVING COUNT(*) = ?)"
+    if by_text:
+        query += " AND rowid IN (SELECT rowid FROM bugs_fts WHERE bugs_fts MATCH ?)"
+    return query + " ORDER BY created_at DESC"
+
+
+class _ThreadState(threading.local):
+    """A BugStore's per-thread connection and transaction nesting depth."""
+
+    conn: sqlite3.Connection | None = None
+    # Identifies conn within its store, for data_version()
+    serial: int = 0
+    transaction_depth: int = 0
+
 
 class BugStore:
     """SQLite-based storage for bugs.
 
     Single global database with project_id for isolation.
     Uses WAL mode for better concurrency.
+
+    Each thread gets its own connection, so tool calls running on worker
+    threads can read concurrently (WAL allows many readers alongside one
+    writer). Transactions are per thread as well.
+
+    Reads go through a memory-mapped view of the database file (up to
+    256 MB of virtual address space; pages are only resident while the OS
+    keeps them cached), and temporary sort/group tables stay in memory.
     """
 
     def __init__(self, db_path: Path | None = None) -> None:
@@ -242,58 +673,129 @@ class BugStore:
             db_path: Path to the SQLite database file. Defaults to global path.
         """
         self._db_path = db_path or get_global_db_path()
-        self._conn: sqlite3.Connection | None = None
+        self._local = _ThreadState()
+        # Every thread's connection, so close() can release them all
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        # Commits and rollbacks made through this store, for data_version()
+        self._writes = 0
+        self._serials = itertools.count(1)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create a database connection."""
-        if self._conn is None:
+        """Get or create the calling thread's database connection."""
+        conn = self._local.conn
+        if conn is None:
             # Ensure parent directory exists
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(self._db_path)
-            self._conn.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrency
-            self._conn.execute("PRAGMA journal_mode=WAL;")
-            # Auto-initialize schema
-            self._initialize_schema()
-        return self._conn
-
-    def _initialize_schema(self) -> None:
-        """Create the database schema if it doesn't exist."""
-        if self._conn is None:
-            return
-        self._conn.execute("""
-            CREATE TABLE IF NOT EXISTS bugs (
-                id TEXT PRIMARY KEY,
-                project_id TEXT NOT NULL,
-                project_path TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                status TEXT NOT NULL,
-                priority TEXT NOT NULL,
-                tags TEXT NOT NULL,
-                related_bugs TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                history TEXT NOT NULL
+            # Only the owning thread uses a connection; the same-thread check
+            # is off so close() may release it from whichever thread shuts down
+            conn = sqlite3.connect(
+                self._db_path, cached_statements=_STATEMENT_CACHE_SIZE, check_same_thread=False
             )
-        """)
-        # Create indexes for common queries
-        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bugs_project ON bugs(project_id)")
-        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bugs_status ON bugs(project_id, status)")
-        self._conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_bugs_priority ON bugs(project_id, priority)"
-        )
-        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bugs_created_at ON bugs(created_at)")
-        self._conn.commit()
+            conn.executescript(_SQL_CONNECTION_PRAGMAS)
+            with self._lock:
+                self._connections.append(conn)
+                # Auto-initialize schema (once per store, by the first thread)
+                if not self._schema_ready:
+                    self._initialize_schema(conn)
+                    self._schema_ready = True
+            self._local.conn = conn
+            self._local.serial = next(self._serials)
+        return conn
+
+    def _initialize_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the database schema if it doesn't exist.
+
+        Databases already at _SCHEMA_VERSION skip straight past the CREATE
+        statements after a single user_version read.
+
+        Args:
+            conn: Connection to create the schema through.
+        """
+        version = conn.execute(_SQL_SCHEMA_VERSION).fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        existing_tables = {row[0] for row in conn.execute(_SQL_LIST_TABLES)}
+        # Empty when there is no bugs table yet
+        column_types = dict(conn.execute(_SQL_BUGS_COLUMN_TYPES).fetchall())
+        if "history" in column_types:
+            conn.executescript(_sql_migrate_bugs(column_types["status"] == "TEXT"))
+        conn.executescript(_SQL_CREATE_SCHEMA)
+        if "bug_tags" not in existing_tables:
+            # Databases created before bug_tags existed: index their tags once
+            conn.execute(_SQL_BACKFILL_TAGS)
+        if "bugs_fts" not in existing_tables:
+            # Index any bugs stored before the full-text table existed
+            conn.execute(_SQL_REBUILD_FTS)
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION:d}")
+        conn.commit()
 
     def initialize(self) -> None:
         """Ensure database is initialized (for backwards compatibility)."""
         self._get_connection()
 
+    def data_version(self) -> tuple[int, int, int]:
+        """Return a token that changes whenever stored bugs may have changed.
+
+        Combines a count of transactions ended through this store (counted
+        once they commit or roll back) with SQLite's data_version, which
+        changes when any other connection (another thread's, or another
+        process sharing the database) commits. data_version is only
+        comparable on one connection, so the token also identifies the
+        calling thread's connection: tokens from different threads never
+        match.
+
+        Returns:
+            Token to compare with one taken earlier.
+        """
+        conn = self._get_connection()
+        serial = self._local.serial
+        return self._writes, serial, conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+
     def close(self) -> None:
-        """Close the database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        """Close every thread's database connection."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = _ThreadState()
+            self._schema_ready = False
+        for conn in connections:
+            conn.close()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[BugStore]:
+        """Group several store operations into a single commit.
+
+        Writes inside the block are committed together when it exits, or
+        rolled back if it raises. Nested blocks join the outermost one.
+        The transaction covers the calling thread's operations only.
+
+        Yields:
+            This store.
+        """
+        conn = self._get_connection()
+        local = self._local
+        local.transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            local.transaction_depth -= 1
+            if local.transaction_depth == 0:
+                conn.rollback()
+                # Reads inside the block may have seen the discarded writes
+                self._writes += 1
+            raise
+        local.transaction_depth -= 1
+        if local.transaction_depth == 0:
+            conn.commit()
+            self._writes += 1
+
+    def _commit(self) -> None:
+        """Commit unless inside a transaction() block."""
+        local = self._local
+        if local.transaction_depth == 0 and local.conn is not None:
+            local.conn.commit()
+            self._writes += 1
 
     def add_bug(self, bug: Bug) -> None:
         """Add a new bug to the store.
@@ -301,28 +803,42 @@ class BugStore:
         Args:
             bug: The bug to add.
         """
+        bug.decode_lists()
         conn = self._get_connection()
-        conn.execute(
-            """
-            INSERT INTO bugs (id, project_id, project_path, title, description,
-                            status, priority, tags, related_bugs, created_at, history)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                bug.id,
-                bug.project_id,
-                bug.project_path,
-                bug.title,
-                bug.description,
-                bug.status,
-                bug.priority,
-                json.dumps(bug.tags),
-                json.dumps([r.to_dict() for r in bug.related_bugs]),
-                bug.created_at,
-                json.dumps([h.to_dict() for h in bug.history]),
-            ),
-        )
-        conn.commit()
+        conn.execute(_SQL_INSERT_BUG, _insert_params(bug))
+        conn.executemany(_SQL_INSERT_TAG, [(bug.id, tag) for tag in bug.tags])
+        conn.executemany(_SQL_INSERT_HISTORY, _history_rows(bug.id, bug.history))
+        self._commit()
+
+    def add_bugs(self, bugs: Iterable[Bug]) -> None:
+        """Add many bugs in one transaction (e.g. bulk imports).
+
+        Bugs are serialized one at a time as they are inserted, so a
+        generator of bugs is never materialized; only their tag and history
+        rows are collected for the following statements. Planner statistics
+        are refreshed afterwards.
+
+        Args:
+            bugs: The bugs to add. If any insert fails, none are added.
+        """
+        tag_rows: list[tuple[str, str]] = []
+        history_rows: list[tuple[Any, ...]] = []
+
+        def bug_rows() -> Iterator[tuple[Any, ...]]:
+            for bug in bugs:
+                bug.decode_lists()
+                tag_rows.extend((bug.id, tag) for tag in bug.tags)
+                history_rows.extend(_history_rows(bug.id, bug.history))
+                yield _insert_params(bug)
+
+        with self.transaction():
+            conn = self._get_connection()
+            conn.executemany(_SQL_INSERT_BUG, bug_rows())
+            conn.executemany(_SQL_INSERT_TAG, tag_rows)
+            conn.executemany(_SQL_INSERT_HISTORY, history_rows)
+        # A bulk import can change the row distribution enough for the
+        # planner to prefer a different listing index
+        conn.execute(_SQL_OPTIMIZE)
 
     def get_bug(self, bug_id: str, project_id: str | None = None) -> Bug | None:
         """Retrieve a bug by ID.
@@ -336,49 +852,63 @@ class BugStore:
         """
         conn = self._get_connection()
         if project_id:
-            cursor = conn.execute(
-                "SELECT * FROM bugs WHERE id = ? AND project_id = ?", (bug_id, project_id)
-            )
+            cursor = conn.execute(_SQL_SELECT_PROJECT_BUG, (bug_id, project_id))
         else:
-            cursor = conn.execute("SELECT * FROM bugs WHERE id = ?", (bug_id,))
+            cursor = conn.execute(_SQL_SELECT_BUG, (bug_id,))
         row = cursor.fetchone()
 
         if row is None:
             return None
 
-        return self._row_to_bug(row)
+        return self._row_to_bug(row).decode_lists()
 
     def update_bug(self, bug: Bug) -> None:
         """Update an existing bug.
 
+        History is append-only: entries past those already stored are
+        appended and stored entries are never rewritten. A loaded bug whose
+        history was never accessed skips the history check entirely.
+
         Args:
             bug: The bug with updated values.
         """
         conn = self._get_connection()
         conn.execute(
-            """
-            UPDATE bugs SET
-                title = ?,
-                description = ?,
-                status = ?,
-                priority = ?,
-                tags = ?,
-                related_bugs = ?,
-                history = ?
-            WHERE id = ?
-            """,
+            _SQL_UPDATE_BUG,
             (
                 bug.title,
                 bug.description,
-                bug.status,
-                bug.priority,
-                json.dumps(bug.tags),
-                json.dumps([r.to_dict() for r in bug.related_bugs]),
-                json.dumps([h.to_dict() for h in bug.history]),
+                _STATUS_CODES[bug.status],
+                _PRIORITY_CODES[bug.priority],
+                dumps_compact(bug.tags),
+                dumps_compact(bug._related_dicts()),
                 bug.id,
             ),
         )
-        conn.commit()
+        conn.execute(_SQL_DELETE_TAGS, (bug.id,))
+        conn.executemany(_SQL_INSERT_TAG, [(bug.id, tag) for tag in bug.tags])
+        # A bug whose history was never decoded has no new entries to record
+        if bug._raw_history is None:
+            stored = conn.execute(_SQL_COUNT_HISTORY, (bug.id,)).fetchone()[0]
+            conn.executemany(
+                _SQL_INSERT_HISTORY, _history_rows(bug.id, bug.history[stored:], stored)
+            )
+        self._commit()
+
+    def append_history(self, bug_id: str, entry: HistoryEntry) -> None:
+        """Record a history entry for a bug with a single INSERT.
+
+        Args:
+            bug_id: The bug the entry belongs to.
+            entry: The change or note to record.
+        """
+        data = entry.to_dict()
+        conn = self._get_connection()
+        conn.execute(
+            _SQL_APPEND_HISTORY,
+            (bug_id, data["timestamp"], dumps_compact(data["changes"]), data["note"], bug_id),
+        )
+        self._commit()
 
     def list_bugs(
         self,
@@ -386,6 +916,7 @@ class BugStore:
         status: str | None = None,
         priority: str | None = None,
         tags: list[str] | None = None,
+        text: str | None = None,
     ) -> list[Bug]:
         """List bugs with optional filtering.
 
@@ -394,59 +925,232 @@ class BugStore:
             status: Filter by status (open, in_progress, closed).
             priority: Filter by priority (low, medium, high, critical).
             tags: Filter by tags (bug must have all specified tags).
+            text: Full-text filter on title/description (bug must match all words).
 
         Returns:
             List of bugs matching the filters.
         """
-        conn = self._get_connection()
-        query = "SELECT * FROM bugs WHERE 1=1"
-        params: list[Any] = []
-
-        if project_id is not None:
-            query += " AND project_id = ?"
-            params.append(project_id)
-
-        if status is not None:
-            query += " AND status = ?"
-            params.append(status)
-
-        if priority is not None:
-            query += " AND priority = ?"
-            params.append(priority)
-
-        query += " ORDER BY created_at DESC"
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
-
-        bugs = [self._row_to_bug(row) for row in rows]
-
-        # Filter by tags in Python (SQLite JSON support is limited)
-        if tags:
-            bugs = [b for b in bugs if all(tag in b.tags for tag in tags)]
-
-        return bugs
-
-    def _row_to_bug(self, row: sqlite3.Row) -> Bug:
-        """Convert a database row to a Bug object."""
-        return Bug(
-            id=row["id"],
-            project_id=row["project_id"],
-            project_path=row["project_path"],
-            title=row["title"],
-            description=row["description"],
-            status=row["status"],
-            priority=row["priority"],
-            tags=json.loads(row["tags"]),
-            related_bugs=[RelatedBug.from_dict(r) for r in json.loads(row["related_bugs"])],
-            created_at=row["created_at"],
-            history=[HistoryEntry.from_dict(h) for h in json.loads(row["history"])],
+        bugs = self.iter_bugs(project_id, status, priority, tags, text)
+        return [bug.decode_lists() for bug in bugs]
+
+    def iter_bugs(
+        self,
+        project_id: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        tags: list[str] | None = None,
+        text: str | None = None,
+    ) -> Iterator[Bug]:
+        """Iterate over bugs matching the filters, reading rows as they are consumed.
+
+        Same filters and order as list_bugs(), without holding every row and
+        Bug at once. The query runs immediately; consume the iterator on the
+        calling thread, whose connection it reads from.
+
+        Each bug keeps related_bugs and history as stored JSON text, which
+        to_dict() serializes without building RelatedBug/HistoryEntry
+        objects; call decode_lists() before reading either list.
+
+        Args:
+            project_id: Filter by project.
+            status: Filter by status (open, in_progress, closed).
+            priority: Filter by priority (low, medium, high, critical).
+            tags: Filter by tags (bug must have all specified tags).
+            text: Full-text filter on title/description (bug must match all words).
+
+        Returns:
+            Iterator of bugs matching the filters.
+        """
+        query, params = _list_bugs_query(_SQL_SELECT_BUGS, project_id, status, priority, tags, text)
+        return map(self._row_to_bug, self._get_connection().execute(query, params))
+
+    def list_bug_summaries(
+        self,
+        project_id: str | None = None,
+        status: str | None = None,
+        priority: str | None = None,
+        tags: list[str] | None = None,
+        text: str | None = None,
+    ) -> list[dict[str, str]]:
+        """List the scalar fields of bugs matching the filters.
+
+        Same filters and order as list_bugs(), but only id, project_id,
+        title, status, priority and created_at are read, so no JSON
+        columns are fetched or decoded and no Bug objects are built.
+
+        Args:
+            project_id: Filter by project.
+            status: Filter by status (open, in_progress, closed).
+            priority: Filter by priority (low, medium, high, critical).
+            tags: Filter by tags (bug must have all specified tags).
+            text: Full-text filter on title/description (bug must match all words).
+
+        Returns:
+            One dict per matching bug, keyed by _SUMMARY_FIELDS.
+        """
+        query, params = _list_bugs_query(
+            _SQL_SELECT_SUMMARIES, project_id, status, priority, tags, text
         )
+        rows = self._get_connection().execute(query, params).fetchall()
+        return [dict(zip(_SUMMARY_FIELDS, row, strict=True)) for row in rows]
+
+    def search_bugs(self, text: str, project_id: str | None = None) -> list[Bug]:
+        """Full-text search over bug titles and descriptions.
+
+        Args:
+            text: Words to search for (bug must match all of them).
+            project_id: Optional project filter.
+
+        Returns:
+            List of matching bugs, newest first.
+        """
+        return self.list_bugs(project_id=project_id, text=text)
+
+    def _row_to_bug(self, row: tuple[Any, ...]) -> Bug:
+        """Convert a database row (in _SQL_SELECT_BUGS column order) to a Bug.
+
+        related_bugs and history are left as stored JSON text; see
+        Bug.decode_lists().
+        """
+        (
+            bug_id,
+            project_id,
+            project_path,
+            title,
+            description,
+            status,
+            priority,
+            tags,
+            related_bugs,
+            created_at,
+            history,
+        ) = row
+        bug = Bug(
+            id=bug_id,
+            project_id=project_id,
+            project_path=project_path,
+            title=title,
+            description=description,
+            status=status,
+            priority=priority,
+            tags=loads(tags),
+            related_bugs=[],
+            created_at=created_at,
+            history=[],
+        )
+        bug._raw_related = related_bugs
+        bug._raw_history = history
+        return bug
+
+
+def _list_bugs_query(
+    select: str,
+    project_id: str | None,
+    status: str | None,
+    priority: str | None,
+    tags: list[str] | None,
+    text: str | None,
+) -> tuple[str, list[Any]]:
+    """Build the SQL and parameters for a filtered bug listing.
+
+    Args:
+        select: SELECT ... FROM bugs prefix choosing the returned columns.
+        project_id: Optional project filter.
+        status: Optional status filter.
+        priority: Optional priority filter.
+        tags: Optional tags the bug must all have.
+        text: Optional full-text filter on title/description.
+
+    Returns:
+        Query string and its positional parameters.
+    """
+    tag_filter = list(dict.fromkeys(tags)) if tags else []
+    match = _fts_match_expression(text) if text else ""
+    query = _list_bugs_sql(
+        project_id is not None,
+        status is not None,
+        priority is not None,
+        len(tag_filter),
+        bool(match),
+        select,
+    )
+    params: list[Any] = [] if project_id is None else [project_id]
+    # Unknown names get code -1, which matches no bug
+    if status is not None:
+        params.append(_STATUS_CODES.get(status, -1))
+    if priority is not None:
+        params.append(_PRIORITY_CODES.get(priority, -1))
+    if tag_filter:
+        params.extend(tag_filter)
+        params.append(len(tag_filter))
+    if match:
+        params.append(match)
+    return query, params
+
+
+def _insert_params(bug: Bug) -> tuple[Any, ...]:
+    """Build the _SQL_INSERT_BUG parameters for a bug."""
+    return (
+        bug.id,
+        bug.project_id,
+        bug.project_path,
+        bug.title,
+        bug.description,
+        _STATUS_CODES[bug.status],
+        _PRIORITY_CODES[bug.priority],
+        dumps_compact(bug.tags),
+        dumps_compact([r.to_dict() for r in bug.related_bugs]),
+        bug.created_at,
+    )
+
+
+def _history_rows(
+    bug_id: str, entries: Iterable[HistoryEntry], stored: int = 0
+) -> list[tuple[Any, ...]]:
+    """Build _SQL_INSERT_HISTORY parameters for history entries.
+
+    Args:
+        bug_id: The bug the entries belong to.
+        entries: Entries to store, oldest first.
+        stored: Number of entries already stored for the bug.
+
+    Returns:
+        One parameter tuple per entry, numbered after the stored ones.
+    """
+    rows = []
+    for seq, entry in enumerate(entries, stored + 1):
+        data = entry.to_dict()
+        rows.append((bug_id, seq, data["timestamp"], dumps_compact(data["changes"]), data["note"]))
+    return rows
+
+
+def _fts_match_expression(text: str) -> str:
+    """Convert free text into a safe FTS5 MATCH expression.
+
+    Each whitespace-separated word becomes a quoted phrase, so FTS5 query
+    syntax in user input (quotes, operators, column filters) is matched
+    literally instead of being interpreted.
+
+    Args:
+        text: Free-text search input.
+
+    Returns:
+        MATCH expression requiring every word, or "" if there are no words.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
 
 
 # =============================================================================
 # Tool Schema Definitions (extracted for readability)
 # =============================================================================
 
+# Enum values shared by every schema that references them. These stay lists
+# (not tuples or read-only mappings): the JSON Schema metaschema requires
+# "enum" to be an array, and tools/list serializes schemas with json.dumps.
+_STATUS_VALUES = list(_STATUSES)
+_PRIORITY_VALUES = list(_PRIORITIES)
+_RELATIONSHIP_VALUES = list(_RELATIONSHIPS)
+
 # Common schema fragments
 _PROJECT_PATH_SCHEMA: dict[str, Any] = {
     "type": "string",
@@ -455,13 +1159,13 @@ _PROJECT_PATH_SCHEMA: dict[str, Any] = {
 
 _STATUS_SCHEMA: dict[str, Any] = {
     "type": "string",
-    "enum": ["open", "in_progress", "closed"],
+    "enum": _STATUS_VALUES,
     "description": "Filter by status.",
 }
 
 _PRIORITY_SCHEMA: dict[str, Any] = {
     "type": "string",
-    "enum": ["low", "medium", "high", "critical"],
+    "enum": _PRIORITY_VALUES,
     "description": "Filter by priority.",
 }
 
@@ -471,6 +1175,15 @@ _TAGS_FILTER_SCHEMA: dict[str, Any] = {
     "description": "Filter by tags (must have ALL specified tags).",
 }
 
+_SUMMARY_SCHEMA: dict[str, Any] = {
+    "type": "boolean",
+    "default": False,
+    "description": (
+        "Return only id, project_id, title, status, priority and created_at per bug "
+        "(faster for large result sets)."
+    ),
+}
+
 # Tool-specific schemas
 _INIT_BUGTRACKER_SCHEMA: dict[str, Any] = {
     "type": "object",
@@ -493,7 +1206,7 @@ _ADD_BUG_SCHEMA: dict[str, Any] = {
         },
         "priority": {
             "type": "string",
-            "enum": ["low", "medium", "high", "critical"],
+            "enum": _PRIORITY_VALUES,
             "description": "Bug priority (default: medium).",
         },
         "tags": {
@@ -527,12 +1240,12 @@ _UPDATE_BUG_SCHEMA: dict[str, Any] = {
         },
         "status": {
             "type": "string",
-            "enum": ["open", "in_progress", "closed"],
+            "enum": _STATUS_VALUES,
             "description": "New status for the bug.",
         },
         "priority": {
             "type": "string",
-            "enum": ["low", "medium", "high", "critical"],
+            "enum": _PRIORITY_VALUES,
             "description": "New priority for the bug.",
         },
         "tags": {
@@ -548,13 +1261,7 @@ _UPDATE_BUG_SCHEMA: dict[str, Any] = {
                     "bug_id": {"type": "string"},
                     "relationship": {
                         "type": "string",
-                        "enum": [
-                            "duplicate_of",
-                            "duplicated_by",
-                            "related_to",
-                            "blocks",
-                            "blocked_by",
-                        ],
+                        "enum": _RELATIONSHIP_VALUES,
                     },
                 },
                 "required": ["bug_id", "relationship"],
@@ -592,6 +1299,7 @@ _LIST_BUGS_SCHEMA: dict[str, Any] = {
         "status": _STATUS_SCHEMA,
         "priority": _PRIORITY_SCHEMA,
         "tags": _TAGS_FILTER_SCHEMA,
+        "summary": _SUMMARY_SCHEMA,
         "project_path": _PROJECT_PATH_SCHEMA,
     },
     "required": [],
@@ -600,15 +1308,20 @@ _LIST_BUGS_SCHEMA: dict[str, Any] = {
 _SEARCH_BUGS_GLOBAL_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
+        "query": {
+            "type": "string",
+            "description": "Full-text search on title and description (matches all words).",
+        },
         "status": _STATUS_SCHEMA,
         "priority": _PRIORITY_SCHEMA,
         "tags": _TAGS_FILTER_SCHEMA,
+        "summary": _SUMMARY_SCHEMA,
     },
     "required": [],
 }
 
-# Tool definitions list (used by get_tools())
-_TOOL_DEFINITIONS: list[ToolDefinition] = [
+# Tool definitions (returned as-is by get_tools(); immutable so it can be shared)
+_TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = (
     ToolDefinition(
         name="init_bugtracker",
         description="Initialize bug tracker for a project. Creates .bugtracker/ directory.",
@@ -647,7 +1360,25 @@ _TOOL_DEFINITIONS: list[ToolDefinition] = [
         description="Search bugs across all indexed projects.",
         input_schema=_SEARCH_BUGS_GLOBAL_SCHEMA,
     ),
-]
+)
+
+# Fixed-text validation errors, shared rather than rebuilt per call (read-only)
+_ERR_PROJECT_PATH_REQUIRED = ToolResult(
+    content=[{"type": "text", "text": "project_path required (or set MCP_PROJECT_PATH env var)"}],
+    is_error=True,
+)
+_ERR_TITLE_REQUIRED = ToolResult(
+    content=[{"type": "text", "text": "Title is required"}],
+    is_error=True,
+)
+_ERR_BUG_ID_REQUIRED = ToolResult(
+    content=[{"type": "text", "text": "bug_id is required"}],
+    is_error=True,
+)
+
+# Total characters of rendered listings the listing cache may hold (8 MiB
+# of ASCII JSON). Listings larger than this on their own are not cached.
+_LISTING_CACHE_CHARS = 8 * 1024 * 1024
 
 
 class BugTrackerPlugin(PluginBase):
@@ -667,6 +1398,26 @@ class BugTrackerPlugin(PluginBase):
     def __init__(self) -> None:
         """Initialize the plugin."""
         self._store: BugStore | None = None
+        # Rendered listings per (summary, filters), tagged with the store's
+        # data_version() when rendered; an entry is only served while the
+        # token is unchanged. The TTL (60 seconds) and the total listing
+        # size (_LISTING_CACHE_CHARS) bound memory; a search over the whole
+        # global database can render megabytes. Locked because tools may run
+        # from worker threads.
+        self._listing_cache: TTLCache[tuple[Any, ...], tuple[tuple[int, int, int], str]] = TTLCache(
+            maxsize=_LISTING_CACHE_CHARS, ttl=60, getsizeof=lambda entry: len(entry[1])
+        )
+        self._listing_lock = threading.Lock()
+        # Tool name -> bound handler, built once rather than per execute()
+        self._handlers: dict[str, Callable[[dict[str, Any]], ToolResult]] = {
+            "init_bugtracker": self._init_bugtracker,
+            "add_bug": self._add_bug,
+            "get_bug": self._get_bug,
+            "update_bug": self._update_bug,
+            "close_bug": self._close_bug,
+            "list_bugs": self._list_bugs,
+            "search_bugs_global": self._search_bugs_global,
+        }
 
     def _get_store(self) -> BugStore:
         """Get or create the global bug store."""
@@ -674,11 +1425,23 @@ class BugTrackerPlugin(PluginBase):
             self._store = BugStore()
         return self._store
 
+    def startup(self) -> None:
+        """Open the database and apply the schema before the first request.
+
+        Failures are left for the first tool call to report, as without
+        startup().
+        """
+        with contextlib.suppress(sqlite3.Error, OSError):
+            self._get_store().initialize()
+
     def cleanup(self) -> None:
         """Clean up resources."""
         if self._store is not None:
             self._store.close()
             self._store = None
+        # Versions are per store, so entries can't be checked against a new one
+        with self._listing_lock:
+            self._listing_cache.clear()
 
     @property
     def name(self) -> str:
@@ -690,16 +1453,16 @@ class BugTrackerPlugin(PluginBase):
         """Return plugin version."""
         return "1.0.0"
 
-    def get_tools(self) -> list[ToolDefinition]:
+    def get_tools(self) -> Sequence[ToolDefinition]:
         """Return available tools.
 
         Returns:
-            List of tool definitions for bug tracking.
+            Tool definitions for bug tracking.
         """
         return _TOOL_DEFINITIONS
 
     def _resolve_project_path(
-        self, arguments: dict[str, Any]
+        self, project_path_str: str | None
     ) -> tuple[str, str, ToolResult | None]:
         """Resolve project path and compute project ID.
 
@@ -709,34 +1472,24 @@ class BugTrackerPlugin(PluginBase):
         3. Error
 
         Args:
-            arguments: Tool arguments containing optional project_path.
+            project_path_str: The project_path argument, if any.
 
         Returns:
             Tuple of (project_id, project_path, None) on success,
             or ("", "", error_result) on failure.
         """
-        # Try argument first, then env var
-        project_path_str = arguments.get("project_path") or os.environ.get("MCP_PROJECT_PATH")
+        # Fall back to env var when no argument was given
+        project_path_str = project_path_str or os.environ.get("MCP_PROJECT_PATH")
 
         if not project_path_str:
-            return (
-                "",
-                "",
-                ToolResult(
-                    content=[
-                        {
-                            "type": "text",
-                            "text": "project_path required (or set MCP_PROJECT_PATH env var)",
-                        }
-                    ],
-                    is_error=True,
-                ),
-            )
+            return "", "", _ERR_PROJECT_PATH_REQUIRED
 
-        # Resolve to absolute path
+        # Resolve to absolute path and compute project ID
         try:
-            resolved = Path(project_path_str).resolve()
-            project_path = str(resolved)
+            if not os.path.isabs(project_path_str):
+                # Relative paths depend on the cwd, so cache them by absolute form
+                project_path_str = os.path.join(os.getcwd(), project_path_str)
+            project_id, project_path = _resolve_project(project_path_str)
         except (OSError, ValueError) as e:
             return (
                 "",
@@ -747,27 +1500,8 @@ class BugTrackerPlugin(PluginBase):
                 ),
             )
 
-        # Compute project ID
-        project_id = compute_project_id(project_path)
-
         return project_id, project_path, None
 
-    def _get_handler_registry(self) -> dict[str, Callable[[dict[str, Any]], ToolResult]]:
-        """Return mapping of tool names to handler methods.
-
-        Returns:
-            Dict mapping tool names to their handler functions.
-        """
-        return {
-            "init_bugtracker": self._init_bugtracker,
-            "add_bug": self._add_bug,
-            "get_bug": self._get_bug,
-            "update_bug": self._update_bug,
-            "close_bug": self._close_bug,
-            "list_bugs": self._list_bugs,
-            "search_bugs_global": self._search_bugs_global,
-        }
-
     def execute(self, tool_name: str, arguments: dict[str, Any]) -> ToolResult:
         """Execute a tool.
 
@@ -778,8 +1512,7 @@ class BugTrackerPlugin(PluginBase):
         Returns:
             ToolResult with result or error.
         """
-        handlers = self._get_handler_registry()
-        handler = handlers.get(tool_name)
+        handler = self._handlers.get(tool_name)
 
         if handler is None:
             return ToolResult(
@@ -801,19 +1534,20 @@ class BugTrackerPlugin(PluginBase):
         Returns:
             ToolResult with project_id or error.
         """
-        project_id, project_path, error = self._resolve_project_path(arguments)
+        project_id, project_path, error = self._resolve_project_path(arguments.get("project_path"))
         if error:
             return error
 
-        # Validate path exists
-        path = Path(project_path)
-        if not path.exists():
+        # Validate path exists and is a directory (one stat call)
+        try:
+            mode = os.stat(project_path).st_mode
+        except OSError:
             return ToolResult(
                 content=[{"type": "text", "text": f"Project path does not exist: {project_path}"}],
                 is_error=True,
             )
 
-        if not path.is_dir():
+        if not stat.S_ISDIR(mode):
             return ToolResult(
                 content=[
                     {"type": "text", "text": f"Project path is not a directory: {project_path}"}
@@ -828,14 +1562,13 @@ class BugTrackerPlugin(PluginBase):
             content=[
                 {
                     "type": "text",
-                    "text": json.dumps(
+                    "text": dumps_indented(
                         {
                             "status": "ready",
                             "project_id": project_id,
                             "project_path": project_path,
                             "database": str(get_global_db_path()),
-                        },
-                        indent=2,
+                        }
                     ),
                 }
             ],
@@ -851,24 +1584,18 @@ class BugTrackerPlugin(PluginBase):
         Returns:
             ToolResult with bug ID or error.
         """
-        import uuid
-        from datetime import datetime
-
         # Resolve project
-        project_id, project_path, error = self._resolve_project_path(arguments)
+        project_id, project_path, error = self._resolve_project_path(arguments.get("project_path"))
         if error:
             return error
 
         # Validate title
-        title = arguments.get("title", "").strip()
-        if not title:
-            return ToolResult(
-                content=[{"type": "text", "text": "Title is required"}],
-                is_error=True,
-            )
+        title = arguments.get("title")
+        if not title or not (title := title.strip()):
+            return _ERR_TITLE_REQUIRED
 
         # Create bug
-        bug_id = f"bug-{uuid.uuid4().hex[:8]}"
+        bug_id = f"bug-{secrets.token_hex(4)}"
         bug = Bug(
             id=bug_id,
             project_id=project_id,
@@ -879,7 +1606,7 @@ class BugTrackerPlugin(PluginBase):
             priority=arguments.get("priority", "medium"),
             tags=arguments.get("tags", []),
             related_bugs=[],
-            created_at=datetime.now(UTC).isoformat(),
+            created_at=_now_iso(),
             history=[],
         )
 
@@ -901,17 +1628,15 @@ class BugTrackerPlugin(PluginBase):
             ToolResult with bug data as JSON or error.
         """
         # Validate bug_id
-        bug_id = arguments.get("bug_id", "").strip()
-        if not bug_id:
-            return ToolResult(
-                content=[{"type": "text", "text": "bug_id is required"}],
-                is_error=True,
-            )
+        bug_id = arguments.get("bug_id")
+        if not bug_id or not (bug_id := bug_id.strip()):
+            return _ERR_BUG_ID_REQUIRED
 
         # Optionally scope to project
         project_id = None
-        if "project_path" in arguments or os.environ.get("MCP_PROJECT_PATH"):
-            project_id, _, error = self._resolve_project_path(arguments)
+        project_path_str = arguments.get("project_path") or os.environ.get("MCP_PROJECT_PATH")
+        if project_path_str:
+            project_id, _, error = self._resolve_project_path(project_path_str)
             if error:
                 return error
 
@@ -926,7 +1651,7 @@ class BugTrackerPlugin(PluginBase):
             )
 
         return ToolResult(
-            content=[{"type": "text", "text": json.dumps(bug.to_dict(), indent=2)}],
+            content=[{"type": "text", "text": bug.to_json()}],
             is_error=False,
         )
 
@@ -946,13 +1671,13 @@ class BugTrackerPlugin(PluginBase):
             changes: Dict to track changes (modified in place).
         """
         # Simple fields: status, priority
-        for field in ("status", "priority"):
-            if field in arguments:
-                new_value = arguments[field]
-                old_value = getattr(bug, field)
+        for name in ("status", "priority"):
+            if name in arguments:
+                new_value = arguments[name]
+                old_value = getattr(bug, name)
                 if new_value != old_value:
-                    changes[field] = (old_value, new_value)
-                    setattr(bug, field, new_value)
+                    changes[name] = (old_value, new_value)
+                    setattr(bug, name, new_value)
 
         # Tags: list field with sorted comparison
         if "tags" in arguments:
@@ -969,10 +1694,9 @@ class BugTrackerPlugin(PluginBase):
         changes: dict[str, tuple[str | None, str]],
     ) -> None:
         """Update bug tags and track changes."""
-        old_tags_str = ",".join(sorted(bug.tags)) if bug.tags else ""
-        new_tags_str = ",".join(sorted(new_tags)) if new_tags else ""
-        if old_tags_str != new_tags_str:
-            changes["tags"] = (old_tags_str, new_tags_str)
+        # Order-insensitive check; the sorted strings are only built on change
+        if frozenset(bug.tags) != frozenset(new_tags):
+            changes["tags"] = (",".join(sorted(bug.tags)), ",".join(sorted(new_tags)))
         bug.tags = new_tags
 
     def _apply_related_bugs_update(
@@ -983,10 +1707,12 @@ class BugTrackerPlugin(PluginBase):
     ) -> None:
         """Update related bugs and track changes."""
         new_related = [RelatedBug.from_dict(r) for r in new_related_dicts]
-        old_related_str = json.dumps([r.to_dict() for r in bug.related_bugs], sort_keys=True)
-        new_related_str = json.dumps([r.to_dict() for r in new_related], sort_keys=True)
-        if old_related_str != new_related_str:
-            changes["related_bugs"] = (old_related_str, new_related_str)
+        # RelatedBug compares by value; only serialize when recording a change
+        if bug.related_bugs != new_related:
+            changes["related_bugs"] = (
+                _format_change([r.to_dict() for r in bug.related_bugs]),
+                _format_change([r.to_dict() for r in new_related]),
+            )
         bug.related_bugs = new_related
 
     def _update_bug(self, arguments: dict[str, Any]) -> ToolResult:
@@ -1001,20 +1727,28 @@ class BugTrackerPlugin(PluginBase):
         Returns:
             ToolResult indicating success or failure.
         """
-        from datetime import datetime
-
         # Validate bug_id
-        bug_id = arguments.get("bug_id", "").strip()
-        if not bug_id:
-            return ToolResult(
-                content=[{"type": "text", "text": "bug_id is required"}],
-                is_error=True,
-            )
+        bug_id = arguments.get("bug_id")
+        if not bug_id or not (bug_id := bug_id.strip()):
+            return _ERR_BUG_ID_REQUIRED
+
+        return self._update_bug_by_id(bug_id, arguments)
+
+    def _update_bug_by_id(self, bug_id: str, arguments: dict[str, Any]) -> ToolResult:
+        """Apply an update to a bug whose id has already been validated.
+
+        Args:
+            bug_id: Stripped, non-empty bug id.
+            arguments: Tool arguments (bug_id is not read).
 
+        Returns:
+            ToolResult indicating success or failure.
+        """
         # Optionally scope to project
         project_id = None
-        if "project_path" in arguments or os.environ.get("MCP_PROJECT_PATH"):
-            project_id, _, error = self._resolve_project_path(arguments)
+        project_path_str = arguments.get("project_path") or os.environ.get("MCP_PROJECT_PATH")
+        if project_path_str:
+            project_id, _, error = self._resolve_project_path(project_path_str)
             if error:
                 return error
 
@@ -1031,17 +1765,25 @@ class BugTrackerPlugin(PluginBase):
         changes: dict[str, tuple[str | None, str]] = {}
         self._apply_field_updates(bug, arguments, changes)
 
-        # Create history entry (even if no field changes - supports note-only updates)
+        # Nothing changed and nothing to note: skip the history entry and write
         note = arguments.get("note")
+        if not changes and note is None:
+            return ToolResult(
+                content=[{"type": "text", "text": f"No changes for bug: {bug_id}"}],
+                is_error=False,
+            )
+
+        # Create history entry (even if no field changes - supports note-only updates)
         history_entry = HistoryEntry(
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=_now_iso(),
             changes=changes,
             note=note,
         )
-        bug.history.append(history_entry)
 
-        # Save changes
-        store.update_bug(bug)
+        # Save changes; the entry is appended without loading the bug's history
+        with store.transaction():
+            store.update_bug(bug)
+            store.append_history(bug.id, history_entry)
 
         return ToolResult(
             content=[{"type": "text", "text": f"Updated bug: {bug_id}"}],
@@ -1058,18 +1800,12 @@ class BugTrackerPlugin(PluginBase):
             ToolResult indicating success or failure.
         """
         # Validate bug_id
-        bug_id = arguments.get("bug_id", "").strip()
-        if not bug_id:
-            return ToolResult(
-                content=[{"type": "text", "text": "bug_id is required"}],
-                is_error=True,
-            )
+        bug_id = arguments.get("bug_id")
+        if not bug_id or not (bug_id := bug_id.strip()):
+            return _ERR_BUG_ID_REQUIRED
 
-        # Delegate to update_bug with status=closed
-        update_args = {
-            "bug_id": bug_id,
-            "status": "closed",
-        }
+        # Delegate to update_bug with status=closed; bug_id is already validated
+        update_args = {"status": "closed"}
 
         # Pass through resolution as note
         if "resolution" in arguments:
@@ -1079,7 +1815,7 @@ class BugTrackerPlugin(PluginBase):
         if "project_path" in arguments:
             update_args["project_path"] = arguments["project_path"]
 
-        return self._update_bug(update_args)
+        return self._update_bug_by_id(bug_id, update_args)
 
     def _list_bugs(self, arguments: dict[str, Any]) -> ToolResult:
         """List bugs with optional filtering.
@@ -1091,25 +1827,12 @@ class BugTrackerPlugin(PluginBase):
             ToolResult with JSON array of bugs.
         """
         # Resolve project (required for list)
-        project_id, _, error = self._resolve_project_path(arguments)
+        project_id, _, error = self._resolve_project_path(arguments.get("project_path"))
         if error:
             return error
 
         # Get filtered bugs
-        store = self._get_store()
-        bugs = store.list_bugs(
-            project_id=project_id,
-            status=arguments.get("status"),
-            priority=arguments.get("priority"),
-            tags=arguments.get("tags"),
-        )
-
-        # Serialize to JSON
-        bugs_data = [bug.to_dict() for bug in bugs]
-        return ToolResult(
-            content=[{"type": "text", "text": json.dumps(bugs_data, indent=2)}],
-            is_error=False,
-        )
+        return self._bug_listing(arguments, project_id)
 
     def _search_bugs_global(self, arguments: dict[str, Any]) -> ToolResult:
         """Search bugs across all projects.
@@ -1122,17 +1845,52 @@ class BugTrackerPlugin(PluginBase):
         Returns:
             ToolResult with JSON array of bugs from all projects.
         """
-        store = self._get_store()
-        bugs = store.list_bugs(
-            project_id=None,  # No project filter = global search
-            status=arguments.get("status"),
-            priority=arguments.get("priority"),
-            tags=arguments.get("tags"),
-        )
+        # No project filter = global search
+        return self._bug_listing(arguments, None, text=arguments.get("query"))
 
-        # Serialize to JSON
-        bugs_data = [bug.to_dict() for bug in bugs]
-        return ToolResult(
-            content=[{"type": "text", "text": json.dumps(bugs_data, indent=2)}],
-            is_error=False,
-        )
+    def _bug_listing(
+        self, arguments: dict[str, Any], project_id: str | None, text: str | None = None
+    ) -> ToolResult:
+        """Run a filtered listing as full bugs, or summaries if requested.
+
+        Repeated listings are served from the listing cache until a bug is
+        written, by this server or any other connection to the database.
+
+        Args:
+            arguments: Tool arguments (reads the status, priority and tags
+                filters and the "summary" flag).
+            project_id: Project to list, or None for all projects.
+            text: Optional full-text filter.
+
+        Returns:
+            ToolResult with a JSON array of bugs or bug summaries.
+        """
+        summary = bool(arguments.get("summary"))
+        status = arguments.get("status")
+        priority = arguments.get("priority")
+        tags = arguments.get("tags")
+        # Tag order and repeats don't change the result
+        key = (summary, project_id, status, priority, frozenset(tags or ()), text)
+
+        store = self._get_store()
+        version = store.data_version()
+        with self._listing_lock:
+            cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == version:
+            listing = cached[1]
+        else:
+            filters = {
+                "project_id": project_id,
+                "status": status,
+                "priority": priority,
+                "tags": tags,
+                "text": text,
+            }
+            if summary:
+                listing = dumps_indented(store.list_bug_summaries(**filters))
+            else:
+                listing = _format_bug_list(store.iter_bugs(**filters))
+            if len(listing) <= _LISTING_CACHE_CHARS:
+                with self._listing_lock:
+                    self._listing_cache[key] = (version, listing)
+        return ToolResult(content=[{"type": "text", "text": listing}], is_error=False)
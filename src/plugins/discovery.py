@@ -9,14 +9,75 @@ described in Anthropic's MCP efficiency guidelines.
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, Literal
 
+from src.json_codec import dumps_indented
 from src.plugins.base import PluginBase, ToolDefinition, ToolResult
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from src.plugins.dispatcher import ToolDispatcher
 
+# Tool definitions (returned as-is by get_tools(); immutable so it can be shared)
+_TOOL_DEFINITIONS: tuple[ToolDefinition, ...] = (
+    ToolDefinition(
+        name="search_tools",
+        description=(
+            "Search for available tools by keyword or category. "
+            "Use detail_level to control how much information is returned: "
+            "'name' for just tool names, 'summary' for names and descriptions, "
+            "'full' for complete definitions including input schemas."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Keyword to search for in tool names, descriptions, and aliases",
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Filter by plugin category (e.g., 'bugtracker')",
+                },
+                "intent": {
+                    "type": "string",
+                    "description": "Filter by intent category (e.g., 'bug tracking', 'research')",
+                },
+                "detail_level": {
+                    "type": "string",
+                    "enum": ["name", "summary", "full"],
+                    "description": "Level of detail to return (default: 'summary')",
+                    "default": "summary",
+                },
+                "include_unavailable": {
+                    "type": "boolean",
+                    "description": (
+                        "Include tools from unavailable plugins (default: false). "
+                        "When true, results include availability status."
+                    ),
+                    "default": False,
+                },
+            },
+        },
+    ),
+    ToolDefinition(
+        name="list_categories",
+        description=(
+            "List all available tool categories (plugins) with their tool counts. "
+            "Use this to discover what capabilities are available before searching."
+        ),
+        input_schema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+)
+
+
+# (tool, name, description, aliases, intent categories), lowercased for search
+_IndexedTool = tuple[ToolDefinition, str, str, tuple[str, ...], tuple[str, ...]]
+
 
 class ToolDiscoveryPlugin(PluginBase):
     """Plugin for discovering available tools.
@@ -37,6 +98,19 @@ class ToolDiscoveryPlugin(PluginBase):
             dispatcher: The ToolDispatcher containing registered plugins.
         """
         self._dispatcher = dispatcher
+        # Search index of registered tools with pre-lowercased fields, rebuilt
+        # when the dispatcher's generation changes
+        self._index: list[tuple[PluginBase, str, list[_IndexedTool]]] = []
+        self._index_generation = -1
+        # list_categories output, reused while the index and every plugin's
+        # availability are unchanged
+        self._categories_key: tuple[int, tuple[tuple[bool, str], ...]] | None = None
+        self._categories_text = ""
+        # Tool name -> handler, built once rather than branching per execute()
+        self._handlers: dict[str, Callable[[dict[str, Any]], ToolResult]] = {
+            "search_tools": self._search_tools,
+            "list_categories": lambda _arguments: self._list_categories(),
+        }
 
     @property
     def name(self) -> str:
@@ -48,69 +122,13 @@ class ToolDiscoveryPlugin(PluginBase):
         """Return plugin version."""
         return "1.0.0"
 
-    def get_tools(self) -> list[ToolDefinition]:
+    def get_tools(self) -> Sequence[ToolDefinition]:
         """Return available tools.
 
         Returns:
-            List containing search_tools and list_categories definitions.
+            search_tools and list_categories definitions.
         """
-        return [
-            ToolDefinition(
-                name="search_tools",
-                description=(
-                    "Search for available tools by keyword or category. "
-                    "Use detail_level to control how much information is returned: "
-                    "'name' for just tool names, 'summary' for names and descriptions, "
-                    "'full' for complete definitions including input schemas."
-                ),
-                input_schema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": (
-                                "Keyword to search for in tool names, descriptions, and aliases"
-                            ),
-                        },
-                        "category": {
-                            "type": "string",
-                            "description": "Filter by plugin category (e.g., 'bugtracker')",
-                        },
-                        "intent": {
-                            "type": "string",
-                            "description": (
-                                "Filter by intent category (e.g., 'bug tracking', 'research')"
-                            ),
-                        },
-                        "detail_level": {
-                            "type": "string",
-                            "enum": ["name", "summary", "full"],
-                            "description": "Level of detail to return (default: 'summary')",
-                            "default": "summary",
-                        },
-                        "include_unavailable": {
-                            "type": "boolean",
-                            "description": (
-                                "Include tools from unavailable plugins (default: false). "
-                                "When true, results include availability status."
-                            ),
-                            "default": False,
-                        },
-                    },
-                },
-            ),
-            ToolDefinition(
-                name="list_categories",
-                description=(
-                    "List all available tool categories (plugins) with their tool counts. "
-                    "Use this to discover what capabilities are available before searching."
-                ),
-                input_schema={
-                    "type": "object",
-                    "properties": {},
-                },
-            ),
-        ]
+        return _TOOL_DEFINITIONS
 
     def execute(self, tool_name: str, arguments: dict[str, Any]) -> ToolResult:
         """Execute a tool.
@@ -122,16 +140,47 @@ class ToolDiscoveryPlugin(PluginBase):
         Returns:
             ToolResult with search/list results or error.
         """
-        if tool_name == "search_tools":
-            return self._search_tools(arguments)
-        elif tool_name == "list_categories":
-            return self._list_categories()
-        else:
+        handler = self._handlers.get(tool_name)
+
+        if handler is None:
             return ToolResult(
                 content=[{"type": "text", "text": f"Unknown tool: {tool_name}"}],
                 is_error=True,
             )
 
+        return handler(arguments)
+
+    def _get_index(self) -> list[tuple[PluginBase, str, list[_IndexedTool]]]:
+        """Return the search index, rebuilding it if plugins were registered.
+
+        Only static tool metadata is indexed; plugin availability is still
+        checked on every search.
+
+        Returns:
+            List of (plugin, lowercased plugin name, indexed tools).
+        """
+        generation = self._dispatcher.generation
+        if generation != self._index_generation:
+            self._index = [
+                (
+                    plugin,
+                    plugin.name.lower(),
+                    [
+                        (
+                            tool,
+                            tool.name.lower(),
+                            tool.description.lower(),
+                            tuple(alias.lower() for alias in tool.aliases),
+                            tuple(cat.lower() for cat in tool.intent_categories),
+                        )
+                        for tool in plugin.get_tools()
+                    ],
+                )
+                for plugin in self._dispatcher._plugins
+            ]
+            self._index_generation = generation
+        return self._index
+
     def _search_tools(self, arguments: dict[str, Any]) -> ToolResult:
         """Search for tools by query and/or category.
 
@@ -150,9 +199,7 @@ class ToolDiscoveryPlugin(PluginBase):
 
         # Collect all tools with their plugin info
         matching_tools: list[tuple[ToolDefinition, bool, str]] = []  # (tool, available, hint)
-        for plugin in self._dispatcher._plugins:
-            plugin_name = plugin.name.lower()
-
+        for plugin, plugin_name, indexed_tools in self._get_index():
             # Filter by category if specified
             if category and plugin_name != category:
                 continue
@@ -165,18 +212,18 @@ class ToolDiscoveryPlugin(PluginBase):
             if not is_available and not include_unavailable:
                 continue
 
-            for tool in plugin.get_tools():
+            for tool, tool_name, description, aliases, intents in indexed_tools:
                 # Filter by intent if specified
                 if intent:
-                    intent_match = any(intent in cat.lower() for cat in tool.intent_categories)
+                    intent_match = any(intent in cat for cat in intents)
                     if not intent_match:
                         continue
 
                 # Filter by query if specified (search name, description, AND aliases)
                 if query:
-                    name_match = query in tool.name.lower()
-                    desc_match = query in tool.description.lower()
-                    alias_match = any(query in alias.lower() for alias in tool.aliases)
+                    name_match = query in tool_name
+                    desc_match = query in description
+                    alias_match = any(query in alias for alias in aliases)
                     if not (name_match or desc_match or alias_match):
                         continue
 
@@ -215,7 +262,7 @@ class ToolDiscoveryPlugin(PluginBase):
                 result = [tool.to_dict() for tool, _, _ in matching_tools]
 
         return ToolResult(
-            content=[{"type": "text", "text": json.dumps(result, indent=2)}],
+            content=[{"type": "text", "text": dumps_indented(result)}],
             is_error=False,
         )
 
@@ -225,23 +272,31 @@ class ToolDiscoveryPlugin(PluginBase):
         Returns:
             ToolResult with category information including availability.
         """
-        categories = []
-        for plugin in self._dispatcher._plugins:
-            tools = plugin.get_tools()
+        index = self._get_index()
+        # Availability can change at runtime, so it is part of the cache key
+        states: list[tuple[bool, str]] = []
+        for plugin, _, _ in index:
             is_available = plugin.is_available()
-            hint = plugin.availability_hint()
-            categories.append(
+            states.append((is_available, "" if is_available else plugin.availability_hint()))
+        key = (self._index_generation, tuple(states))
+        if key != self._categories_key:
+            categories = [
                 {
                     "category": plugin.name,
                     "version": plugin.version,
-                    "tool_count": len(tools),
-                    "tools": [tool.name for tool in tools],
+                    "tool_count": len(indexed_tools),
+                    "tools": [tool.name for tool, *_ in indexed_tools],
                     "available": is_available,
-                    "availability_hint": hint if not is_available else "",
+                    "availability_hint": hint,
                 }
-            )
+                for (plugin, _, indexed_tools), (is_available, hint) in zip(
+                    index, states, strict=True
+                )
+            ]
+            self._categories_text = dumps_indented(categories)
+            self._categories_key = key
 
         return ToolResult(
-            content=[{"type": "text", "text": json.dumps(categories, indent=2)}],
+            content=[{"type": "text", "text": self._categories_text}],
             is_error=False,
         )
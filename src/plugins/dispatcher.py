@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
+import sys
 from typing import Any
 
-from src.plugins.base import PluginBase, ToolResult
+from jsonschema import SchemaError, ValidationError
+
+from src.plugins.base import PluginBase, ToolDefinition, ToolResult
 
 
 class ToolNotFoundError(Exception):
@@ -19,6 +23,22 @@ class ToolExecutionError(Exception):
     pass
 
 
+def _invalid_arguments(tool_name: str, error: ValidationError) -> ToolResult:
+    """Build the error result for arguments that fail schema validation."""
+    return ToolResult(
+        content=[{"type": "text", "text": f"Invalid arguments for {tool_name}: {error.message}"}],
+        is_error=True,
+    )
+
+
+def _invalid_schema(tool_name: str) -> ToolResult:
+    """Build the error result for a tool whose own input schema is invalid."""
+    return ToolResult(
+        content=[{"type": "text", "text": f"Invalid input schema for tool {tool_name}"}],
+        is_error=True,
+    )
+
+
 class ToolDispatcher:
     """Routes tool calls to registered plugins.
 
@@ -30,6 +50,17 @@ class ToolDispatcher:
         """Initialize the dispatcher."""
         self._plugins: list[PluginBase] = []
         self._tool_map: dict[str, PluginBase] = {}
+        # Definitions as registered; each caches its compiled schema validator
+        self._tool_defs: dict[str, ToolDefinition] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every plugin registration.
+
+        Lets consumers that index the registered tools detect staleness.
+        """
+        return self._generation
 
     def register_plugin(self, plugin: PluginBase) -> None:
         """Register a plugin and index its tools.
@@ -38,10 +69,25 @@ class ToolDispatcher:
             plugin: Plugin instance to register.
         """
         self._plugins.append(plugin)
+        self._generation += 1
 
-        # Index tools for fast lookup
+        # Index tools for fast lookup; interned keys let call_tool hand plugins
+        # the canonical name string
         for tool in plugin.get_tools():
-            self._tool_map[tool.name] = plugin
+            name = sys.intern(tool.name)
+            self._tool_map[name] = plugin
+            self._tool_defs[name] = tool
+
+    def has_tool(self, tool_name: str) -> bool:
+        """Check whether a tool is registered.
+
+        Args:
+            tool_name: Name of the tool.
+
+        Returns:
+            True if some plugin provides the tool.
+        """
+        return tool_name in self._tool_map
 
     def list_tools(self) -> list[dict[str, Any]]:
         """List all available tools in MCP format.
@@ -73,6 +119,15 @@ class ToolDispatcher:
         if plugin is None:
             raise ToolNotFoundError(f"Tool not found: {tool_name}")
 
+        # Known name only, so this returns the registered key rather than
+        # growing the intern table with arbitrary caller strings
+        tool_name = sys.intern(tool_name)
+        try:
+            self._tool_defs[tool_name].validate(arguments)
+        except ValidationError as e:
+            return _invalid_arguments(tool_name, e)
+        except SchemaError:
+            return _invalid_schema(tool_name)
         try:
             return plugin.execute(tool_name, arguments)
         except Exception as e:
@@ -87,15 +142,23 @@ class ToolDispatcher:
         Returns:
             Input schema dict or None if tool not found.
         """
-        plugin = self._tool_map.get(tool_name)
-        if plugin is None:
-            return None
+        tool = self._tool_defs.get(tool_name)
+        return None if tool is None else tool.input_schema
 
-        for tool in plugin.get_tools():
-            if tool.name == tool_name:
-                return tool.input_schema
+    def startup(self) -> None:
+        """Start up all registered plugins.
 
-        return None
+        Calls startup() on each plugin so they can prepare resources, and
+        compiles each tool's schema validator so the first call to a tool
+        doesn't pay for it. Called by MCPServer.startup() before serving
+        requests.
+        """
+        for plugin in self._plugins:
+            plugin.startup()
+        for tool in self._tool_defs.values():
+            # Calls to a tool with an invalid schema get an error result instead
+            with contextlib.suppress(SchemaError):
+                tool.compile_validator()
 
     def cleanup(self) -> None:
         """Clean up all registered plugins.
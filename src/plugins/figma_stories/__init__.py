@@ -8,7 +8,7 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from ..base import PluginBase, ToolDefinition, ToolResult
 from .ai_client import AIClientBase, create_ai_client
@@ -27,6 +27,9 @@ from .markdown_writer import MarkdownWriter
 from .models import GenerationResult
 from .story_generator import StoryGenerator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 @dataclass
 class FigmaStoriesPlugin(PluginBase):
@@ -41,6 +44,14 @@ class FigmaStoriesPlugin(PluginBase):
         self._config = config
         self._figma_client: FigmaClient | None = None
         self._ai_client: AIClientBase | None = None
+        # Tool name -> handler, built once rather than branching per execute()
+        self._handlers: dict[str, Callable[[dict[str, Any]], ToolResult]] = {
+            "configure_figma_stories": self._configure,
+            "generate_user_stories": self._generate_stories,
+            "preview_user_stories": self._preview_stories,
+            "list_figma_pages": self._list_pages,
+            "get_config_status": self._get_config_status,
+        }
 
     @property
     def name(self) -> str:
@@ -199,21 +210,13 @@ class FigmaStoriesPlugin(PluginBase):
             ToolResult with content or error
         """
         try:
-            if tool_name == "configure_figma_stories":
-                return self._configure(arguments)
-            elif tool_name == "generate_user_stories":
-                return self._generate_stories(arguments)
-            elif tool_name == "preview_user_stories":
-                return self._preview_stories(arguments)
-            elif tool_name == "list_figma_pages":
-                return self._list_pages(arguments)
-            elif tool_name == "get_config_status":
-                return self._get_config_status(arguments)
-            else:
+            handler = self._handlers.get(tool_name)
+            if handler is None:
                 return ToolResult(
                     content=[{"type": "text", "text": f"Unknown tool: {tool_name}"}],
                     is_error=True,
                 )
+            return handler(arguments)
         except FigmaAuthenticationError as e:
             return ToolResult(
                 content=[{"type": "text", "text": f"Figma authentication failed: {e.message}"}],
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .models import AcceptanceCriteria
+
 if TYPE_CHECKING:
     from .models import UserStory
 
@@ -178,8 +180,6 @@ Separate criteria with blank lines. Only output the criteria."""
         story: UserStory,
         instructions: str,
     ) -> UserStory:
-        from .models import AcceptanceCriteria
-
         prompt = f"""You are an expert agile product manager. Enhance this user story.
 
 Current Story:
@@ -6,6 +6,7 @@ from Figma design data using templates and optional AI enhancement.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 from .ai_client import AIClientBase
@@ -364,8 +365,6 @@ class StoryGenerator:
         context: list[str],
     ) -> str:
         """Synchronous wrapper for AI description generation."""
-        import asyncio
-
         return asyncio.run(self._ai_generate_description(component_name, text_content, context))
 
     def _infer_action(self, component_name: str) -> str:
@@ -621,8 +620,6 @@ class StoryGenerator:
         hierarchy: list[str],
     ) -> list[AcceptanceCriteria]:
         """Synchronous wrapper for AI acceptance criteria generation."""
-        import asyncio
-
         return asyncio.run(self._ai_generate_acceptance_criteria(text_content, variants, hierarchy))
 
     def _parse_ai_criteria(self, text: str) -> tuple | None:
@@ -731,8 +728,6 @@ class StoryGenerator:
             return story
 
         try:
-            import asyncio
-
             enhanced = asyncio.run(
                 self.ai_client.enhance_story(
                     story=story,
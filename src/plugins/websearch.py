@@ -6,20 +6,140 @@ which is allowed by the security policy.
 
 from __future__ import annotations
 
+import importlib.util
 import re
-import urllib.parse
-from typing import Any
+import threading
+from html import unescape
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote_plus
 
 import httpx
+from cachetools import TTLCache
 
 from src.plugins.base import PluginBase, ToolDefinition, ToolResult
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    HTMLParser = None
+
 # DuckDuckGo Lite endpoint (HTML-based, simpler to parse)
 DUCKDUCKGO_LITE_URL = "https://lite.duckduckgo.com/lite/"
 
 # User agent to use for requests
 USER_AGENT = "MCP-SecureLocal/1.0 (Web Search Plugin)"
 
+# Connection settings: per-stage timeouts so a stalled connect or pool wait
+# fails fast, and idle connections kept long enough to reuse the TLS session
+# across searches. HTTP/2 is used when the optional h2 package is installed.
+_TIMEOUT = httpx.Timeout(connect=2.0, read=8.0, write=2.0, pool=1.0)
+_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_CLIENT_OPTIONS: dict[str, Any] = {
+    "headers": {"User-Agent": USER_AGENT},
+    "follow_redirects": True,
+    "timeout": _TIMEOUT,
+    "limits": _LIMITS,
+    "http2": _HTTP2,
+}
+
+# Result parsing pattern, compiled once at import. One scan finds, in
+# document order:
+#   - snippets: <a class="result__snippet">...</a>
+#   - result links: <a class="result-link" href="..."> or <a class="result__a" ...>
+#   - the alternative Lite link form: <a rel="nofollow" href="...">
+# Snippets are tried first so a snippet anchor is never taken for a result link.
+# Every alternative starts with the literal "<a", which re's prefix search skips
+# to directly, so a Lite page (~30 results) scans in well under a millisecond;
+# a multi-pattern DFA engine would not pay for its extra dependency here.
+_RESULT_SCAN_RE = re.compile(
+    r'<a[^>]*class="[^"]*snippet[^"]*"[^>]*>(?P<snippet>[^<]+)</a>'
+    r'|<a[^>]*class="[^"]*result[^"]*"[^>]*href="(?P<url>[^"]+)"[^>]*>(?P<title>[^<]+)</a>'
+    r'|<a[^>]*rel="nofollow"[^>]*href="(?P<alt_url>[^"]+)"[^>]*>(?P<alt_title>[^<]+)</a>',
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
+
+# Anchors relevant to result parsing, as (kind, url, text) in document order.
+# kind is "snippet" (url is empty), "link" for result-class links or "alt" for
+# rel="nofollow" links; text has HTML entities decoded.
+_Anchor = tuple[str, str, str]
+
+
+def _scan_anchors_regex(html: str) -> Iterator[_Anchor]:
+    """Yield result anchors using the compiled regex (single pass)."""
+    for match in _RESULT_SCAN_RE.finditer(html):
+        if (snippet := match["snippet"]) is not None:
+            yield "snippet", "", unescape(snippet)
+        elif match["url"] is not None:
+            yield "link", match["url"], unescape(match["title"])
+        else:
+            yield "alt", match["alt_url"], unescape(match["alt_title"])
+
+
+def _scan_anchors_selectolax(html: str) -> Iterator[_Anchor]:  # pragma: no cover
+    """Yield result anchors using selectolax's native HTML parser.
+
+    Classifies anchors the same way as the regex, but text includes nested
+    tags (e.g. <b> highlights) that the regex cannot match across.
+    """
+    for node in HTMLParser(html).css("a"):
+        attrs = node.attributes
+        css_class = (attrs.get("class") or "").lower()
+        href = attrs.get("href")
+        text = node.text()
+        if not text:
+            continue
+        if "snippet" in css_class:
+            yield "snippet", "", text
+        elif href and "result" in css_class:
+            yield "link", href, text
+        elif href and (attrs.get("rel") or "").lower() == "nofollow":
+            yield "alt", href, text
+
+
+# selectolax is used when installed (the "fast" extra); regex otherwise
+_scan_anchors = _scan_anchors_regex if HTMLParser is None else _scan_anchors_selectolax
+
+
+def _cache_key(query: str, max_results: int) -> tuple[str, int]:
+    """Normalize a search into its result-cache key (DDG ignores case)."""
+    return query.strip().lower(), max_results
+
+
+# Constant part of the search query string (region: US English)
+_QUERY_SUFFIX = "&kl=us-en"
+
+
+def _search_url(query: str) -> str:
+    """Build the DuckDuckGo Lite URL for a query.
+
+    Same encoding as urlencode({"q": query, "kl": "us-en"}), with only the
+    query quoted per call.
+    """
+    return f"{DUCKDUCKGO_LITE_URL}?q={quote_plus(query)}{_QUERY_SUFFIX}"
+
+
+def _search_error(exc: Exception) -> ToolResult:
+    """Map a search failure to a sanitized error result.
+
+    Args:
+        exc: Exception raised while fetching or parsing results.
+
+    Returns:
+        ToolResult with a generic message that does not leak internals.
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        text = "Search timed out. Please try again."
+    elif isinstance(exc, httpx.HTTPStatusError):
+        text = f"Search failed (HTTP {exc.response.status_code})"
+    else:
+        text = "Search failed. Please try again later."
+    return ToolResult(content=[{"type": "text", "text": text}], is_error=True)
+
 
 class WebSearchPlugin(PluginBase):
     """Web search plugin using DuckDuckGo.
@@ -30,11 +150,15 @@ class WebSearchPlugin(PluginBase):
 
     def __init__(self) -> None:
         """Initialize the plugin with a reusable HTTP client."""
-        self._client = httpx.Client(
-            headers={"User-Agent": USER_AGENT},
-            follow_redirects=True,
-            timeout=10.0,
+        self._client = httpx.Client(**_CLIENT_OPTIONS)
+        # Parsed results per (normalized query, max_results) with TTL (5 minutes)
+        # and max size (256 entries); DDG results are stable over that span, so
+        # repeated searches skip the HTTP round-trip. Locked because searches
+        # may run from worker threads.
+        self._results_cache: TTLCache[tuple[str, int], list[dict[str, str]]] = TTLCache(
+            maxsize=256, ttl=300
         )
+        self._cache_lock = threading.Lock()
 
     def close(self) -> None:
         """Close the HTTP client and release resources."""
@@ -102,27 +226,12 @@ class WebSearchPlugin(PluginBase):
 
         try:
             results = self._search(query, max_results)
-            return ToolResult(
-                content=[{"type": "text", "text": results}],
-                is_error=False,
-            )
-        except httpx.TimeoutException:
-            return ToolResult(
-                content=[{"type": "text", "text": "Search timed out. Please try again."}],
-                is_error=True,
-            )
-        except httpx.HTTPStatusError as e:
-            return ToolResult(
-                content=[
-                    {"type": "text", "text": f"Search failed (HTTP {e.response.status_code})"}
-                ],
-                is_error=True,
-            )
-        except Exception:
-            return ToolResult(
-                content=[{"type": "text", "text": "Search failed. Please try again later."}],
-                is_error=True,
-            )
+        except Exception as e:
+            return _search_error(e)
+        return ToolResult(
+            content=[{"type": "text", "text": results}],
+            is_error=False,
+        )
 
     def _search(self, query: str, max_results: int) -> str:
         """Perform the actual search.
@@ -134,17 +243,39 @@ class WebSearchPlugin(PluginBase):
         Returns:
             Formatted search results as a string.
         """
-        # Build the request
-        params = {"q": query, "kl": "us-en"}
-        url = f"{DUCKDUCKGO_LITE_URL}?{urllib.parse.urlencode(params)}"
+        key = _cache_key(query, max_results)
+        results = self._cache_get(key)
+        if results is None:
+            # Make the request using the pooled client
+            response = self._client.get(_search_url(query))
+            response.raise_for_status()
+            results = self._cache_put(key, self._parse_results(response.text, max_results))
+
+        return self._format_results(query, results)
+
+    def _cache_get(self, key: tuple[str, int]) -> list[dict[str, str]] | None:
+        """Return cached parsed results for a search, if still fresh."""
+        with self._cache_lock:
+            return self._results_cache.get(key)
+
+    def _cache_put(
+        self, key: tuple[str, int], results: list[dict[str, str]]
+    ) -> list[dict[str, str]]:
+        """Cache parsed results for a search and return them."""
+        with self._cache_lock:
+            self._results_cache[key] = results
+        return results
 
-        # Make the request using the pooled client
-        response = self._client.get(url)
-        response.raise_for_status()
+    def _format_results(self, query: str, results: list[dict[str, str]]) -> str:
+        """Format parsed results for the tool response.
 
-        # Parse the results
-        results = self._parse_results(response.text, max_results)
+        Args:
+            query: Search query.
+            results: Parsed results from _parse_results().
 
+        Returns:
+            Formatted search results as a string.
+        """
         if not results:
             return f"No results found for: {query}"
 
@@ -167,59 +298,48 @@ class WebSearchPlugin(PluginBase):
         Returns:
             List of result dictionaries with title, url, snippet.
         """
-        results = []
-
-        # DuckDuckGo Lite uses simple HTML structure
-        # Look for result links and snippets
-        # Pattern for result links: <a class="result-link" href="...">...</a>
-        # or <a class="result__a" href="...">...</a>
-
-        # Simple regex-based parsing (more robust than BeautifulSoup for simple cases)
-        # Find all result blocks
-        result_pattern = re.compile(
-            r'<a[^>]*class="[^"]*result[^"]*"[^>]*href="([^"]+)"[^>]*>([^<]+)</a>',
-            re.IGNORECASE,
-        )
-
-        snippet_pattern = re.compile(
-            r'<a[^>]*class="[^"]*snippet[^"]*"[^>]*>([^<]+)</a>',
-            re.IGNORECASE,
-        )
-
-        # Alternative pattern for Lite
-        link_pattern = re.compile(
-            r'<a[^>]*rel="nofollow"[^>]*href="([^"]+)"[^>]*>([^<]+)</a>',
-            re.IGNORECASE,
-        )
+        # Each link is paired with the first snippet that follows it.
+        # rel="nofollow" links are only used when the page has no result-class
+        # links at all.
+        links: list[list[str]] = []  # [url, title, snippet]
+        alt_links: list[list[str]] = []
+        last: list[str] | None = None
+        for kind, url, text in _scan_anchors(html):
+            if kind == "snippet":
+                if last is not None and not last[2]:
+                    last[2] = text
+                    if len(links) >= max_results:
+                        break
+            elif kind == "link":
+                if len(links) >= max_results:
+                    break
+                last = [url, text, ""]
+                links.append(last)
+            elif not links and len(alt_links) < max_results:
+                last = [url, text, ""]
+                alt_links.append(last)
 
-        # Find links
-        links = result_pattern.findall(html) or link_pattern.findall(html)
-        snippets = snippet_pattern.findall(html)
-
-        # Match links with snippets
-        for i, (url, title) in enumerate(links[:max_results]):
-            snippet = snippets[i] if i < len(snippets) else ""
-            results.append(
-                {
-                    "title": self._clean_text(title),
-                    "url": url,
-                    "snippet": self._clean_text(snippet),
-                }
-            )
-
-        return results
+        return [
+            {
+                "title": self._clean_text(title),
+                "url": url,
+                "snippet": self._clean_text(snippet),
+            }
+            for url, title, snippet in links or alt_links
+        ]
 
     def _clean_text(self, text: str) -> str:
-        """Clean HTML entities and whitespace from text.
+        """Collapse whitespace in result text.
 
         Args:
-            text: Raw text to clean.
+            text: Text with HTML entities already decoded.
 
         Returns:
             Cleaned text.
         """
-        import html
-
-        text = html.unescape(text)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        # Most titles and snippets are already clean. isprintable() is False
+        # for every whitespace character except the ASCII space, so without
+        # double spaces there is nothing for the regex to collapse.
+        if "  " not in text and text.isprintable():
+            return text.strip()
+        return _WS_RE.sub(" ", text).strip()
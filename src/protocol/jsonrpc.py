@@ -5,10 +5,12 @@ Implements the JSON-RPC 2.0 specification for MCP protocol communication.
 
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass
 from typing import Any
 
+from src.json_codec import dumps, loads
+
 # Standard JSON-RPC 2.0 error codes
 PARSE_ERROR = -32700
 INVALID_REQUEST = -32600
@@ -37,7 +39,7 @@ class JsonRpcError(Exception):
         self.data = data
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcRequest:
     """Represents a JSON-RPC request (has id)."""
 
@@ -46,7 +48,7 @@ class JsonRpcRequest:
     params: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonRpcNotification:
     """Represents a JSON-RPC notification (no id)."""
 
@@ -54,11 +56,32 @@ class JsonRpcNotification:
     params: dict[str, Any] | None = None
 
 
-def parse_message(raw: str) -> JsonRpcRequest | JsonRpcNotification:
-    """Parse a JSON-RPC message from a string.
+# Decoded JSON types accepted as a request id
+_ID_TYPES = (int, str)
+
+# Marks a message without an "id" member (a notification)
+_NO_ID = object()
+
+
+def _byte_length(raw: str | bytes | bytearray) -> int:
+    """Return the UTF-8 size of a message without encoding small strings.
+
+    A str needs at most four bytes per character, so only strings that could
+    exceed the limit are encoded to measure them exactly.
+    """
+    if not isinstance(raw, str) or len(raw) * 4 <= MAX_MESSAGE_SIZE:
+        return len(raw)
+    return len(raw.encode("utf-8", "surrogatepass"))
+
+
+def parse_message(raw: str | bytes | bytearray) -> JsonRpcRequest | JsonRpcNotification:
+    """Parse a JSON-RPC message.
+
+    Accepts the raw wire bytes as well as text, so byte-oriented transports
+    do not need to decode before parsing.
 
     Args:
-        raw: Raw JSON string.
+        raw: Raw JSON message, as text or UTF-8 bytes.
 
     Returns:
         Parsed request or notification.
@@ -66,20 +89,22 @@ def parse_message(raw: str) -> JsonRpcRequest | JsonRpcNotification:
     Raises:
         JsonRpcError: If the message is invalid.
     """
-    # Check message size before parsing to prevent DoS
-    if len(raw) > MAX_MESSAGE_SIZE:
+    # Check message size (in bytes) before parsing to prevent DoS
+    size = _byte_length(raw)
+    if size > MAX_MESSAGE_SIZE:
         raise JsonRpcError(
-            PARSE_ERROR, f"Message too large: {len(raw)} bytes exceeds {MAX_MESSAGE_SIZE} limit"
+            PARSE_ERROR, f"Message too large: {size} bytes exceeds {MAX_MESSAGE_SIZE} limit"
         )
 
-    # Parse JSON
+    # Parse JSON. ValueError also covers undecodable bytes and oversized
+    # integers; RecursionError covers pathologically deep nesting.
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = loads(raw)
+    except (ValueError, RecursionError) as e:
         raise JsonRpcError(PARSE_ERROR, f"Parse error: {e}") from e
 
     # Must be an object
-    if not isinstance(data, dict):
+    if type(data) is not dict:
         raise JsonRpcError(INVALID_REQUEST, "Invalid Request: message must be an object")
 
     # Validate jsonrpc version
@@ -88,22 +113,22 @@ def parse_message(raw: str) -> JsonRpcRequest | JsonRpcNotification:
 
     # Must have method
     method = data.get("method")
-    if not isinstance(method, str):
+    if type(method) is not str:
         raise JsonRpcError(INVALID_REQUEST, "Invalid Request: method must be a string")
 
     # Get params (optional)
     params = data.get("params")
-    if params is not None and not isinstance(params, dict):
+    if params is not None and type(params) is not dict:
         raise JsonRpcError(INVALID_REQUEST, "Invalid Request: params must be an object")
 
     # Check for id to distinguish request from notification
-    if "id" in data:
-        msg_id = data["id"]
-        if not isinstance(msg_id, int | str):
-            raise JsonRpcError(INVALID_REQUEST, "Invalid Request: id must be integer or string")
-        return JsonRpcRequest(id=msg_id, method=method, params=params)
-    else:
+    msg_id = data.get("id", _NO_ID)
+    if msg_id is _NO_ID:
         return JsonRpcNotification(method=method, params=params)
+    # Exact types: JSON true/false decode to bool, which is not a valid id
+    if type(msg_id) not in _ID_TYPES:
+        raise JsonRpcError(INVALID_REQUEST, "Invalid Request: id must be integer or string")
+    return JsonRpcRequest(id=msg_id, method=method, params=params)
 
 
 def format_response(msg_id: int | str, result: Any) -> str:
@@ -121,7 +146,42 @@ def format_response(msg_id: int | str, result: Any) -> str:
         "id": msg_id,
         "result": result,
     }
-    return json.dumps(response)
+    return dumps(response)
+
+
+def to_json(value: Any) -> str:
+    """Serialize a value with the wire codec.
+
+    Args:
+        value: JSON-compatible value.
+
+    Returns:
+        JSON string, encoded exactly as inside formatted messages.
+    """
+    return dumps(value)
+
+
+# Response envelope around the id and result values, serialized once by the
+# active codec so spacing matches dumps output
+_RESPONSE_ID_PREFIX, _RESPONSE_RESULT_PREFIX = (
+    dumps({"jsonrpc": "2.0", "id": None, "result": None}).removesuffix("null}").split("null")
+)
+
+
+def format_serialized_response(msg_id: int | str, result_json: str) -> str:
+    """Format a successful JSON-RPC response around a pre-serialized result.
+
+    Produces the same output as format_response() for callers that cache
+    the serialized form of a result which rarely changes.
+
+    Args:
+        msg_id: Request ID to echo back.
+        result_json: Result payload, already serialized to JSON.
+
+    Returns:
+        JSON string.
+    """
+    return f"{_RESPONSE_ID_PREFIX}{dumps(msg_id)}{_RESPONSE_RESULT_PREFIX}{result_json}}}"
 
 
 def format_error(
@@ -141,6 +201,9 @@ def format_error(
     Returns:
         JSON string.
     """
+    if msg_id is None and data is None:
+        return _format_unaddressed_error(code, message)
+
     error_obj: dict[str, Any] = {
         "code": code,
         "message": message,
@@ -153,7 +216,22 @@ def format_error(
         "id": msg_id,
         "error": error_obj,
     }
-    return json.dumps(response)
+    return dumps(response)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_unaddressed_error(code: int, message: str) -> str:
+    """Format an error for a message that could not be parsed (id null).
+
+    These come from malformed input, so a client (or attacker) repeating the
+    same bad message gets the serialized envelope from the cache.
+    """
+    return dumps({"jsonrpc": "2.0", "id": None, "error": {"code": code, "message": message}})
+
+
+# Parameterless notification envelope up to the method value, serialized once
+# by the active codec so spacing matches dumps output
+_NOTIFICATION_PREFIX = dumps({"jsonrpc": "2.0", "method": None}).removesuffix("null}")
 
 
 def format_notification(method: str, params: dict[str, Any] | None = None) -> str:
@@ -166,11 +244,8 @@ def format_notification(method: str, params: dict[str, Any] | None = None) -> st
     Returns:
         JSON string.
     """
-    notification: dict[str, Any] = {
-        "jsonrpc": "2.0",
-        "method": method,
-    }
-    if params is not None:
-        notification["params"] = params
+    if params is None:
+        # Common case: only the method varies, so reuse the serialized envelope
+        return _NOTIFICATION_PREFIX + dumps(method) + "}"
 
-    return json.dumps(notification)
+    return dumps({"jsonrpc": "2.0", "method": method, "params": params})
@@ -11,7 +11,7 @@ from typing import Any
 from src.plugins.dispatcher import ToolDispatcher, ToolExecutionError, ToolNotFoundError
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolsListResult:
     """Result of tools/list request."""
 
@@ -26,7 +26,7 @@ class ToolsListResult:
         return {"tools": self.tools}
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolsCallResult:
     """Result of tools/call request."""
 
@@ -14,7 +14,10 @@ for all tool executions and security events.
 from __future__ import annotations
 
 import json
+import os
+import queue
 import re
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -115,27 +118,106 @@ class AuditLogger:
 
     All operations are logged with timestamps, and the log file is
     flushed after each write for durability.
+
+    With background=True, events are handed to a single writer thread
+    through a bounded queue, so callers do not wait on disk I/O. The writer
+    batches whatever is queued into one write and flush. A full queue blocks
+    the caller rather than dropping events, since the audit trail must be
+    complete; call flush() to wait until queued events are on disk.
+
+    If a background write fails (disk full, EIO), the writer records the
+    error and discards what is still queued so no caller blocks on it; from
+    then on logging and flush() raise OSError, as a failed write does in
+    the default synchronous mode.
     """
 
-    def __init__(self, log_path: Path) -> None:
+    def __init__(
+        self,
+        log_path: Path,
+        background: bool = False,
+        fsync: bool = False,
+        queue_size: int = 1024,
+    ) -> None:
         """Initialize the audit logger.
 
         Args:
             log_path: Path to the audit log file.
+            background: Write events from a background thread.
+            fsync: Also fsync the file after each write (or batch).
+            queue_size: Maximum number of pending events in background mode.
         """
         self._log_path = log_path
+        self._fsync = fsync
         self._ensure_directory()
         self._file = open(log_path, "a", encoding="utf-8")  # noqa: SIM115
 
+        # None is the writer's stop sentinel
+        self._queue: queue.Queue[str | None] | None = None
+        self._writer: threading.Thread | None = None
+        # First failure of the background writer, re-raised to callers
+        self._write_error: Exception | None = None
+        if background:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(
+                target=self._drain_queue, args=(self._queue,), name="audit-writer", daemon=True
+            )
+            self._writer.start()
+
     def _ensure_directory(self) -> None:
         """Create log directory if it doesn't exist."""
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
 
     def _write_line(self, data: dict[str, Any]) -> None:
-        """Write a JSON line to the log file and flush."""
-        line = json.dumps(data)
-        self._file.write(line + "\n")
+        """Write a JSON line to the log file (or the writer queue)."""
+        line = json.dumps(data) + "\n"
+        if self._queue is not None:
+            self._raise_write_error()
+            self._queue.put(line)
+            return
+        self._write_out(line)
+
+    def _write_out(self, text: str) -> None:
+        """Write text to the log file and flush (and fsync if configured)."""
+        self._file.write(text)
         self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def _drain_queue(self, pending: queue.Queue[str | None]) -> None:
+        """Writer thread loop: write queued lines in batches until stopped."""
+        while True:
+            batch = [pending.get()]
+            while True:
+                try:
+                    batch.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            if lines and self._write_error is None:
+                try:
+                    self._write_out("".join(lines))
+                except Exception as e:
+                    # Keep draining (discarding) so put() and flush() never hang
+                    self._write_error = e
+            for _ in batch:
+                pending.task_done()
+            if len(lines) != len(batch):
+                return
+
+    def _raise_write_error(self) -> None:
+        """Raise if the background writer has failed, losing events."""
+        if self._write_error is not None:
+            raise OSError(f"Audit log write failed: {self._write_error}") from self._write_error
+
+    def flush(self) -> None:
+        """Wait until all queued events have been written (background mode).
+
+        Raises:
+            OSError: If the background writer failed to write events.
+        """
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_write_error()
 
     def log_request(self, request_id: str, tool_name: str, arguments: dict[str, Any]) -> None:
         """Log an incoming tool request.
@@ -188,7 +270,12 @@ class AuditLogger:
         self._write_line(event)
 
     def close(self) -> None:
-        """Close the log file."""
+        """Write any queued events, stop the writer and close the log file."""
+        if self._writer is not None and self._queue is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._queue = None
+            self._writer = None
         if self._file and not self._file.closed:
             self._file.close()
 
@@ -6,7 +6,8 @@ firewall, validator, and audit logger into a single engine.
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import secrets
 from pathlib import Path
 from typing import Any
 
@@ -49,11 +50,20 @@ class SecurityEngine:
         self._firewall = NetworkFirewall(policy)
         self._validator = InputValidator(policy)
         self._rate_limiter = RateLimiter(window_seconds=rate_limit_window_seconds)
+        # Per-tool limits resolved from the policy, which is fixed for the
+        # engine's lifetime
+        self._rate_limits: dict[str, int] = {}
+        # Request IDs: a random per-engine prefix plus a counter, unique within
+        # the process and distinguishable across restarts in the audit log
+        self._request_id_prefix = secrets.token_hex(4)
+        self._request_counter = itertools.count(1)
 
         # Initialize audit logger if configured
         if policy.audit_log_file:
             log_path = Path(policy.audit_log_file)
-            self._audit_logger: AuditLogger | None = AuditLogger(log_path)
+            self._audit_logger: AuditLogger | None = AuditLogger(
+                log_path, background=policy.audit_background, fsync=policy.audit_fsync
+            )
         else:
             self._audit_logger = None
 
@@ -144,7 +154,9 @@ class SecurityEngine:
         Raises:
             RateLimitExceeded: If rate limit is exceeded.
         """
-        limit = self._policy.get_rate_limit(tool_name)
+        limit = self._rate_limits.get(tool_name)
+        if limit is None:
+            limit = self._rate_limits[tool_name] = self._policy.get_rate_limit(tool_name)
         try:
             self._rate_limiter.check_rate_limit(tool_name, limit)
         except RateLimitExceeded:
@@ -206,7 +218,7 @@ class SecurityEngine:
         Returns:
             Unique request identifier.
         """
-        return str(uuid.uuid4())
+        return f"{self._request_id_prefix}-{next(self._request_counter):x}"
 
     def close(self) -> None:
         """Close the security engine and flush logs."""
@@ -6,14 +6,20 @@ and provides validation methods for the security layer.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PolicyLoadError(Exception):
     """Raised when policy loading or validation fails."""
@@ -79,6 +85,8 @@ class SecurityPolicy:
     audit_log_file: str = ""
     audit_log_level: str = "INFO"
     audit_include: list[str] = field(default_factory=list)
+    audit_background: bool = False
+    audit_fsync: bool = False
 
     @classmethod
     def from_dict(cls, config: dict[str, Any]) -> SecurityPolicy:
@@ -116,6 +124,8 @@ class SecurityPolicy:
             audit_log_file=log_file,
             audit_log_level=audit.get("log_level", "INFO"),
             audit_include=audit.get("include", []),
+            audit_background=audit.get("background", False),
+            audit_fsync=audit.get("fsync", False),
         )
 
     def is_port_blocked(self, port: int) -> bool:
@@ -164,7 +174,10 @@ class SecurityPolicy:
         Returns:
             Rate limit in requests per minute, or default if not specified.
         """
-        return self.tool_rate_limits.get(tool_name, self.tool_rate_limits.get("default", 60))
+        limit = self.tool_rate_limits.get(tool_name)
+        if limit is None:
+            limit = self.tool_rate_limits.get("default", 60)
+        return limit
 
     def is_dns_allowed(self, hostname: str) -> bool:
         """Check if DNS resolution is allowed for a hostname.
@@ -180,9 +193,93 @@ class SecurityPolicy:
         return hostname in self.dns_allowlist
 
 
+def _policy_cache_path(path: Path) -> Path:
+    """Get the path of the parsed-policy cache for a policy file.
+
+    Args:
+        path: Path to the policy YAML file.
+
+    Returns:
+        Path to the JSON sidecar next to the policy (e.g. policy.yaml.cache.json).
+    """
+    return path.with_name(path.name + ".cache.json")
+
+
+def _policy_cache_header(content: bytes) -> str:
+    """Build the cache header identifying a specific version of the policy file.
+
+    The header carries a hash of the file contents rather than its mtime, so
+    edits that preserve the timestamp (cp -p, rsync -a, tar x) still miss.
+    """
+    return f"# sha256={hashlib.sha256(content).hexdigest()}"
+
+
+def _read_policy_cache(cache_path: Path, header: str) -> dict[str, Any] | None:
+    """Read a cached policy config if it matches the policy file.
+
+    Args:
+        cache_path: Path to the JSON sidecar.
+        header: Expected header line for the current policy file.
+
+    Returns:
+        Cached configuration dict, or None if missing, stale, or unreadable.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            if f.readline().rstrip("\n") != header:
+                return None
+            config = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return config if isinstance(config, dict) else None
+
+
+def _write_policy_cache(cache_path: Path, header: str, config: dict[str, Any]) -> None:
+    """Write the parsed policy config to the JSON sidecar.
+
+    The cache is written atomically (temp file + rename). It is best effort:
+    configs that do not survive a JSON round-trip unchanged (e.g. YAML dates
+    or non-string keys) are not cached, and write failures are ignored.
+
+    Args:
+        cache_path: Path to the JSON sidecar.
+        header: Header line identifying the policy file version.
+        config: Parsed policy configuration.
+    """
+    try:
+        encoded = json.dumps(config)
+        if json.loads(encoded) != config:
+            return
+    except (TypeError, ValueError):
+        return
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+        )
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(header + "\n")
+            f.write(encoded)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
 def load_policy(path: Path) -> SecurityPolicy:
     """Load security policy from a YAML file.
 
+    The parsed YAML is cached in a JSON sidecar (see _policy_cache_path)
+    keyed by a hash of the policy file's contents, so warm starts skip YAML
+    parsing. Environment variables are still expanded on every load.
+
     Args:
         path: Path to the policy YAML file.
 
@@ -192,14 +289,23 @@ def load_policy(path: Path) -> SecurityPolicy:
     Raises:
         PolicyLoadError: If the file cannot be found, parsed, or validated.
     """
-    if not path.exists():
-        raise PolicyLoadError(f"Policy file not found: {path}")
-
     try:
-        with open(path) as f:
-            config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise PolicyLoadError(f"Failed to parse policy YAML: {e}") from e
+        content = path.read_bytes()
+    except OSError:
+        raise PolicyLoadError(f"Policy file not found: {path}") from None
+
+    cache_path = _policy_cache_path(path)
+    header = _policy_cache_header(content)
+    config = _read_policy_cache(cache_path, header)
+
+    if config is None:
+        try:
+            config = yaml.load(content, Loader=_YAML_SAFE_LOADER)  # noqa: S506 - safe loader
+        except yaml.YAMLError as e:
+            raise PolicyLoadError(f"Failed to parse policy YAML: {e}") from e
+
+        if isinstance(config, dict):
+            _write_policy_cache(cache_path, header, config)
 
     if not isinstance(config, dict):
         raise PolicyLoadError("Policy must be a YAML mapping")
@@ -6,8 +6,8 @@ by SecurityEngine or other components requiring request throttling.
 
 from __future__ import annotations
 
+import math
 import time
-from collections import defaultdict
 
 
 class RateLimitExceeded(Exception):
@@ -17,10 +17,11 @@ class RateLimitExceeded(Exception):
 
 
 class RateLimiter:
-    """Sliding window rate limiter for tool invocations.
+    """Token bucket rate limiter for tool invocations.
 
-    Tracks request timestamps per tool and enforces configurable
-    rate limits within a sliding time window.
+    Each tool gets a bucket of ``limit`` tokens that refills continuously at
+    ``limit`` tokens per window; a request spends one token. A bucket is just
+    (tokens, last update, limit), so a check is O(1) regardless of the limit.
 
     Example:
         limiter = RateLimiter(window_seconds=60.0)
@@ -34,7 +35,7 @@ class RateLimiter:
         """Initialize the rate limiter.
 
         Args:
-            window_seconds: Size of the sliding window in seconds.
+            window_seconds: Time for an empty bucket to refill completely.
 
         Raises:
             ValueError: If window_seconds is not positive.
@@ -43,8 +44,9 @@ class RateLimiter:
             raise ValueError("window_seconds must be positive")
 
         self._window_seconds = window_seconds
-        self._buckets: dict[str, list[float]] = defaultdict(list)
-        self._last_cleanup: float = time.time()
+        # tool name -> (tokens, monotonic time of last update, limit)
+        self._buckets: dict[str, tuple[float, float, int]] = {}
+        self._last_cleanup: float = time.monotonic()
         self._cleanup_interval: float = 60.0  # Run cleanup at most every 60s
 
     @property
@@ -57,29 +59,30 @@ class RateLimiter:
         """Get the number of tracked tool buckets."""
         return len(self._buckets)
 
+    def _tokens(self, bucket: tuple[float, float, int], now: float) -> float:
+        """Return a bucket's token count refilled up to ``now``."""
+        tokens, updated, limit = bucket
+        return min(limit, tokens + (now - updated) * limit / self._window_seconds)
+
     def cleanup(self) -> None:
-        """Remove empty buckets to prevent memory leaks.
+        """Remove full buckets to prevent memory leaks.
 
-        Removes any bucket keys where all timestamps have expired
-        outside the current window.
+        A bucket that has refilled completely carries no state beyond
+        what a fresh bucket would, so it can be dropped.
         """
-        now = time.time()
-        window_start = now - self._window_seconds
-
-        # Find and remove empty buckets
-        empty_keys = [
-            key
-            for key, timestamps in self._buckets.items()
-            if not any(t > window_start for t in timestamps)
+        now = time.monotonic()
+
+        full_keys = [
+            key for key, bucket in self._buckets.items() if self._tokens(bucket, now) >= bucket[2]
         ]
-        for key in empty_keys:
+        for key in full_keys:
             del self._buckets[key]
 
     def check_rate_limit(self, tool_name: str, limit: int) -> None:
         """Check if a tool invocation is within rate limits.
 
-        Records the request if allowed. May trigger automatic cleanup
-        of expired buckets to prevent memory leaks.
+        Spends a token if allowed. May trigger automatic cleanup
+        of full buckets to prevent memory leaks.
 
         Args:
             tool_name: Name of the tool being invoked.
@@ -88,42 +91,38 @@ class RateLimiter:
         Raises:
             RateLimitExceeded: If the rate limit has been exceeded.
         """
-        now = time.time()
-        window_start = now - self._window_seconds
+        now = time.monotonic()
 
-        # Periodic cleanup to prevent memory leaks from accumulated empty buckets
+        # Periodic cleanup to prevent memory leaks from accumulated idle buckets
         if now - self._last_cleanup >= self._cleanup_interval:
             self.cleanup()
             self._last_cleanup = now
 
-        # Clean old entries outside the window
-        bucket = self._buckets[tool_name]
-        self._buckets[tool_name] = [t for t in bucket if t > window_start]
+        bucket = self._buckets.get(tool_name)
+        tokens = float(limit) if bucket is None else self._tokens(bucket, now)
 
         # Check if limit would be exceeded
-        if len(self._buckets[tool_name]) >= limit:
+        if tokens < 1:
             raise RateLimitExceeded(
                 f"Rate limit exceeded for {tool_name}: {limit} requests per {self._window_seconds}s"
             )
 
-        # Record this request
-        self._buckets[tool_name].append(now)
+        # Spend a token for this request
+        self._buckets[tool_name] = (tokens - 1, now, limit)
 
     def get_request_count(self, tool_name: str) -> int:
-        """Get the current request count for a tool within the window.
+        """Get the number of requests currently counted against a tool's limit.
 
         Args:
             tool_name: Name of the tool.
 
         Returns:
-            Number of requests in the current window.
+            Tokens spent and not yet refilled, rounded up.
         """
-        now = time.time()
-        window_start = now - self._window_seconds
-
-        # Clean and count
-        bucket = self._buckets.get(tool_name, [])
-        return len([t for t in bucket if t > window_start])
+        bucket = self._buckets.get(tool_name)
+        if bucket is None:
+            return 0
+        return max(0, math.ceil(bucket[2] - self._tokens(bucket, time.monotonic())))
 
     def reset(self, tool_name: str | None = None) -> None:
         """Reset rate limit buckets.
@@ -133,6 +132,6 @@ class RateLimiter:
                       If None, reset all buckets.
         """
         if tool_name is not None:
-            self._buckets[tool_name] = []
+            self._buckets.pop(tool_name, None)
         else:
             self._buckets.clear()
@@ -12,9 +12,10 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from src.json_schema import get_validator
+
 if TYPE_CHECKING:
     from src.security.policy import SecurityPolicy
 
@@ -73,13 +74,11 @@ def sanitize_path(path: str, base_path: str | None = None) -> str:
     except (OSError, ValueError) as e:
         raise ValidationError(f"Invalid path: {e}") from e
 
-    # Check for path traversal after resolution
-    if base_path:
-        base_resolved = Path(base_path).resolve()
-        try:
-            resolved.relative_to(base_resolved)
-        except ValueError:
-            raise ValidationError(f"Path traversal detected: {path} escapes {base_path}") from None
+    # Check for path traversal after resolution. Both sides are resolved on
+    # every call (never cached), so a symlink swapped since the last check
+    # can't slip through.
+    if base_path and not resolved.is_relative_to(Path(base_path).resolve()):
+        raise ValidationError(f"Path traversal detected: {path} escapes {base_path}")
 
     return str(resolved)
 
@@ -259,17 +258,18 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails.
         """
-        # First, validate against JSON Schema
+        # First, validate against JSON Schema (compiled once, shared with the
+        # dispatcher's tool definitions)
         try:
-            validator = Draft202012Validator(schema)
-            errors = list(validator.iter_errors(arguments))
-            if errors:
-                # Report first error
-                error = errors[0]
-                path = ".".join(str(p) for p in error.path) if error.path else "root"
-                raise ValidationError(f"Schema validation failed at '{path}': {error.message}")
+            validator = get_validator(schema)
         except SchemaError as e:
             raise ValidationError(f"Invalid schema for tool {tool_name}: {e}") from e
 
+        # Report first error
+        error = next(validator.iter_errors(arguments), None)
+        if error is not None:
+            path = ".".join(str(p) for p in error.path) if error.path else "root"
+            raise ValidationError(f"Schema validation failed at '{path}': {error.message}")
+
         # Then apply security-focused processing
         return self._process_arguments(arguments, schema)
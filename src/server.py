@@ -6,7 +6,7 @@ Integrates all components into a complete MCP server.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.plugins.base import PluginBase
 from src.plugins.discovery import ToolDiscoveryPlugin
@@ -19,13 +19,18 @@ from src.protocol.jsonrpc import (
     JsonRpcRequest,
     format_error,
     format_response,
+    format_serialized_response,
     parse_message,
+    to_json,
 )
 from src.protocol.lifecycle import LifecycleManager, ProtocolError
 from src.protocol.tools import ToolsHandler
 from src.security.engine import RateLimitExceeded, SecurityEngine
 from src.security.policy import SecurityPolicy, load_policy
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class MCPServer:
     """MCP Server implementation.
@@ -64,6 +69,17 @@ class MCPServer:
         # Auto-register discovery plugin (provides search_tools, list_categories)
         self._dispatcher.register_plugin(ToolDiscoveryPlugin(self._dispatcher))
 
+        # Method name -> handler for requests that require the ready state,
+        # built once rather than branching per request
+        self._handlers: dict[str, Callable[[int | str, dict[str, Any]], str]] = {
+            "tools/list": self._handle_tools_list,
+            "tools/call": self._handle_tools_call,
+        }
+
+        # Serialized tools/list result, tagged with the dispatcher generation
+        # it was built for; the catalog only changes when plugins register
+        self._tools_list_json: tuple[int, str] | None = None
+
     def register_plugin(self, plugin: PluginBase) -> None:
         """Register a plugin.
 
@@ -80,11 +96,11 @@ class MCPServer:
         """
         return self._dispatcher.list_tools()
 
-    def handle_message(self, raw_message: str) -> str | None:
+    def handle_message(self, raw_message: str | bytes) -> str | None:
         """Handle an incoming JSON-RPC message.
 
         Args:
-            raw_message: Raw JSON-RPC message string.
+            raw_message: Raw JSON-RPC message, as text or UTF-8 bytes.
 
         Returns:
             Response string or None for notifications.
@@ -141,25 +157,67 @@ class MCPServer:
             return format_error(msg_id, INTERNAL_ERROR, str(e))
 
         # Route to appropriate handler
-        if method == "tools/list":
+        handler = self._handlers.get(method)
+        if handler is None:
+            return format_error(msg_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+        return handler(msg_id, params)
+
+    def _handle_tools_list(self, msg_id: int | str, params: dict[str, Any]) -> str:
+        """Handle a tools/list request.
+
+        Args:
+            msg_id: Request ID.
+            params: Request parameters (unused).
+
+        Returns:
+            JSON-RPC response string.
+        """
+        generation = self._dispatcher.generation
+        cached = self._tools_list_json
+        if cached is None or cached[0] != generation:
             result = self._tools_handler.handle_list()
-            return format_response(msg_id, result.to_dict())
+            cached = self._tools_list_json = (generation, to_json(result.to_dict()))
+        return format_serialized_response(msg_id, cached[1])
+
+    def _handle_tools_call(self, msg_id: int | str, params: dict[str, Any]) -> str:
+        """Handle a tools/call request.
 
-        elif method == "tools/call":
-            name = params.get("name", "")
-            arguments = params.get("arguments", {})
+        Args:
+            msg_id: Request ID.
+            params: Request parameters with tool name and arguments.
 
-            # Check rate limit before execution
+        Returns:
+            JSON-RPC response string.
+        """
+        name = params.get("name", "")
+
+        # Check rate limit first, so throttled calls do no further work.
+        # Unknown (and empty) tool names are rejected by the dispatcher
+        # without a limiter bucket being created for them.
+        if self._dispatcher.has_tool(name):
             try:
                 self._security_engine.check_rate_limit(name)
             except RateLimitExceeded:
                 return format_error(msg_id, INTERNAL_ERROR, f"Rate limit exceeded for tool: {name}")
 
-            result = self._tools_handler.handle_call(name, arguments)
-            return format_response(msg_id, result.to_dict())
+        result = self._tools_handler.handle_call(name, params.get("arguments", {}))
+        return format_response(msg_id, result.to_dict())
 
-        else:
-            return format_error(msg_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+    def reset_session(self) -> None:
+        """Start a fresh client session on this server.
+
+        Resets the initialize/initialized handshake so a new client can
+        connect, while keeping the loaded policy, plugins and their
+        resources. Used by persistent mode between socket connections.
+        """
+        self._lifecycle = LifecycleManager()
+
+    def startup(self) -> None:
+        """Start up registered plugins before serving requests.
+
+        Call once, after all plugins are registered.
+        """
+        self._dispatcher.startup()
 
     def close(self) -> None:
         """Close the server and clean up resources."""
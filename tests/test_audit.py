@@ -5,6 +5,8 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from src.security.audit import AuditEvent, AuditLogger, SecurityEvent
 
 
@@ -218,3 +220,51 @@ class TestAuditLogger:
             assert "req-001" in content
 
             logger.close()
+
+    def test_background_writer_preserves_order(self):
+        """Background mode should write every event, in order, by close()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "audit.log"
+
+            # A tiny queue makes callers wait on the writer instead of dropping
+            with AuditLogger(log_path, background=True, queue_size=2) as logger:
+                for i in range(50):
+                    logger.log_request(f"req-{i:03d}", "tool", {})
+
+            lines = log_path.read_text().splitlines()
+            ids = [json.loads(line)["request_id"] for line in lines]
+            assert ids == [f"req-{i:03d}" for i in range(50)]
+
+    def test_background_flush_waits_for_writer(self):
+        """flush() should return once queued events are on disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "audit.log"
+            logger = AuditLogger(log_path, background=True, fsync=True)
+
+            logger.log_security_event("blocked", {"host": "example.com"})
+            logger.flush()
+            assert "blocked" in log_path.read_text()
+
+            logger.close()
+            # Closing twice is harmless
+            logger.close()
+
+    def test_background_write_failure_is_raised(self):
+        """A failed background write should surface instead of hanging callers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "audit.log"
+            logger = AuditLogger(log_path, background=True, queue_size=2)
+
+            def fail(text: str) -> None:
+                raise OSError(28, "No space left on device")
+
+            logger._write_out = fail
+            logger.log_request("req-001", "tool", {})
+            with pytest.raises(OSError, match="No space left"):
+                logger.flush()
+
+            # Later events fail loudly rather than queueing behind a dead writer
+            with pytest.raises(OSError, match="Audit log write failed"):
+                logger.log_request("req-002", "tool", {})
+
+            logger.close()
@@ -17,6 +17,16 @@ class TestGlobalDatabaseHelpers:
 
         assert str(path) == "/Users/testuser/.mcp-bugtracker/bugs.db"
 
+    def test_get_global_db_path_tracks_home_changes(self, monkeypatch):
+        """Memoized path should follow changes to $HOME."""
+        from src.plugins.bugtracker import get_global_db_path
+
+        monkeypatch.setenv("HOME", "/Users/first")
+        assert str(get_global_db_path()) == "/Users/first/.mcp-bugtracker/bugs.db"
+
+        monkeypatch.setenv("HOME", "/Users/second")
+        assert str(get_global_db_path()) == "/Users/second/.mcp-bugtracker/bugs.db"
+
     def test_compute_project_id_format(self):
         """Should return basename-hash8 format."""
         from src.plugins.bugtracker import compute_project_id
@@ -36,6 +46,12 @@ class TestGlobalDatabaseHelpers:
 
         assert id1 == id2
 
+    def test_compute_project_id_is_stable(self):
+        """IDs are persisted with bugs, so the hash must not change between versions."""
+        from src.plugins.bugtracker import compute_project_id
+
+        assert compute_project_id("/Users/andy/my-project") == "my-project-7a994ef6"
+
     def test_compute_project_id_different_for_different_paths(self):
         """Different paths should produce different IDs."""
         from src.plugins.bugtracker import compute_project_id
@@ -93,6 +109,27 @@ class TestBugTrackerPluginInterface:
         tool_names = [t.name for t in tools]
         assert "init_bugtracker" in tool_names
 
+    def test_tool_schemas_are_valid_and_serializable(self):
+        """Shared schema fragments should keep every tool schema valid JSON Schema."""
+        from jsonschema import Draft202012Validator
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        for tool in BugTrackerPlugin().get_tools():
+            Draft202012Validator.check_schema(tool.input_schema)
+            json.dumps(tool.to_dict())
+
+    def test_startup_opens_database(self, global_db_path):
+        """startup() should create the database before any tool call."""
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        plugin.startup()
+
+        assert global_db_path.exists()
+        assert plugin._store is not None and plugin._store._local.conn is not None
+        plugin.cleanup()
+
     def test_handles_unknown_tool(self):
         """Should return error for unknown tool."""
         from src.plugins.bugtracker import BugTrackerPlugin
@@ -189,6 +226,18 @@ class TestBugDataModels:
         assert entry.changes == {"status": ("open", "closed")}
         assert entry.note == "Fixed"
 
+    def test_history_entry_from_dict_note_only(self):
+        """Should accept note-only entries with missing or empty changes."""
+        from src.plugins.bugtracker import HistoryEntry
+
+        for data in (
+            {"timestamp": "2025-11-27T10:00:00Z", "note": "Progress"},
+            {"timestamp": "2025-11-27T10:00:00Z", "changes": {}, "note": "Progress"},
+        ):
+            entry = HistoryEntry.from_dict(data)
+            assert entry.changes == {}
+            assert entry.to_dict()["changes"] == {}
+
     def test_bug_creation_minimal(self):
         """Should create Bug with minimal required fields."""
         from src.plugins.bugtracker import Bug
@@ -210,6 +259,27 @@ class TestBugDataModels:
         assert bug.title == "Test bug"
         assert bug.status == "open"
 
+    def test_bug_to_json(self):
+        """Should render the same indented JSON as the dict form."""
+        import json
+
+        from src.plugins.bugtracker import Bug, RelatedBug
+
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="Test bug",
+            description="Line one\nline two",
+            status="open",
+            priority="medium",
+            tags=["ui"],
+            related_bugs=[RelatedBug(bug_id="bug-002", relationship="blocks")],
+            created_at="2025-11-27T10:00:00Z",
+            history=[],
+        )
+        assert bug.to_json() == json.dumps(bug.to_dict(), indent=2)
+
     def test_bug_creation_full(self):
         """Should create Bug with all fields populated."""
         from src.plugins.bugtracker import Bug, HistoryEntry, RelatedBug
@@ -333,6 +403,32 @@ class TestBugDataModels:
         assert restored.related_bugs[0].bug_id == original.related_bugs[0].bug_id
         assert restored.history[0].note == original.history[0].note
 
+    def test_models_use_slots(self):
+        """Should not carry a per-instance __dict__."""
+        from src.plugins.bugtracker import HistoryEntry, RelatedBug
+
+        related = RelatedBug(bug_id="bug-001", relationship="blocks")
+        entry = HistoryEntry(timestamp="2025-11-27T11:00:00Z", changes={}, note=None)
+
+        assert not hasattr(related, "__dict__")
+        assert not hasattr(entry, "__dict__")
+
+    def test_related_bug_from_dict_reuses_instances(self):
+        """Equal relationships should decode to one shared, immutable object."""
+        import dataclasses
+
+        import pytest
+
+        from src.plugins.bugtracker import RelatedBug
+
+        data = {"bug_id": "bug-001", "relationship": "blocks"}
+        first = RelatedBug.from_dict(data)
+        second = RelatedBug.from_dict(dict(data))
+
+        assert first is second
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.bug_id = "bug-002"
+
 
 class TestBugStore:
     """Tests for BugStore SQLite storage layer."""
@@ -387,6 +483,126 @@ class TestBugStore:
         assert retrieved.title == "Test bug"
         store.close()
 
+    def test_add_bugs_bulk(self, tmp_path):
+        """Should add many bugs at once, including their tags."""
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        store.add_bugs(
+            Bug(
+                id=f"bug-{i:03d}",
+                project_id="myproject-abc12345",
+                project_path="/path/to/myproject",
+                title=f"Bulk bug {i}",
+                description=None,
+                status="open",
+                priority="low",
+                tags=["imported"],
+                related_bugs=[],
+                created_at=f"2025-11-27T10:00:{i:02d}Z",
+                history=[],
+            )
+            for i in range(5)
+        )
+
+        assert len(store.list_bugs(tags=["imported"])) == 5
+        store.close()
+
+    def test_add_bugs_is_atomic(self, tmp_path):
+        """A failing bulk insert should leave no bugs behind."""
+        import sqlite3
+
+        import pytest
+
+        from src.plugins.bugtracker import Bug, BugStore
+
+        def make_bug(bug_id):
+            return Bug(
+                id=bug_id,
+                project_id="myproject-abc12345",
+                project_path="/path/to/myproject",
+                title="Bulk bug",
+                description=None,
+                status="open",
+                priority="low",
+                tags=[],
+                related_bugs=[],
+                created_at="2025-11-27T10:00:00Z",
+                history=[],
+            )
+
+        store = BugStore(tmp_path / "bugs.db")
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_bugs([make_bug("bug-001"), make_bug("bug-001")])
+
+        assert store.list_bugs() == []
+        store.close()
+
+    def test_store_usable_from_worker_threads(self, tmp_path):
+        """Each thread should get its own connection; close() releases all."""
+        import sqlite3
+        from concurrent.futures import ThreadPoolExecutor
+
+        import pytest
+
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        store.add_bug(
+            Bug(
+                id="bug-001",
+                project_id="myproject-abc12345",
+                project_path="/path/to/myproject",
+                title="Threaded bug",
+                description=None,
+                status="open",
+                priority="low",
+                tags=[],
+                related_bugs=[],
+                created_at="2025-11-27T10:00:00Z",
+                history=[],
+            )
+        )
+        main_conn = store._get_connection()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            titles = list(pool.map(lambda _: store.get_bug("bug-001").title, range(4)))
+            worker_conn = pool.submit(store._get_connection).result()
+
+        assert titles == ["Threaded bug"] * 4
+        assert worker_conn is not main_conn
+        store.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            worker_conn.execute("SELECT 1")
+
+    def test_transaction_rolls_back_on_error(self, tmp_path):
+        """Writes in a transaction block should be discarded if it raises."""
+        import pytest
+
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        with pytest.raises(RuntimeError), store.transaction() as txn:
+            txn.add_bug(
+                Bug(
+                    id="bug-001",
+                    project_id="myproject-abc12345",
+                    project_path="/path/to/myproject",
+                    title="Discarded",
+                    description=None,
+                    status="open",
+                    priority="low",
+                    tags=[],
+                    related_bugs=[],
+                    created_at="2025-11-27T10:00:00Z",
+                    history=[],
+                )
+            )
+            raise RuntimeError("abort")
+
+        assert store.get_bug("bug-001") is None
+        store.close()
+
     def test_get_bug_not_found(self, tmp_path):
         """Should return None for non-existent bug."""
         from src.plugins.bugtracker import BugStore
@@ -399,6 +615,127 @@ class TestBugStore:
         assert result is None
         store.close()
 
+    def test_iter_bugs_decodes_lists_on_demand(self, tmp_path):
+        """Streamed bugs should serialize from stored JSON and decode on request."""
+        from src.plugins.bugtracker import Bug, BugStore, HistoryEntry, RelatedBug
+
+        store = BugStore(tmp_path / "bugs.db")
+        store.initialize()
+
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="Lazy bug",
+            description=None,
+            status="open",
+            priority="low",
+            tags=[],
+            related_bugs=[RelatedBug(bug_id="bug-002", relationship="blocks")],
+            created_at="2025-11-27T10:00:00Z",
+            history=[
+                HistoryEntry(
+                    timestamp="2025-11-27T11:00:00Z",
+                    changes={"status": ("open", "in_progress")},
+                    note=None,
+                )
+            ],
+        )
+        store.add_bug(bug)
+
+        (streamed,) = store.iter_bugs()
+        assert streamed.to_dict() == bug.to_dict()
+        assert streamed._raw_history is not None
+        assert streamed.history == []
+
+        assert streamed.decode_lists() is streamed
+        assert streamed.history[0].changes == {"status": ("open", "in_progress")}
+        assert streamed._raw_history is None
+        assert streamed == bug
+        assert store.get_bug("bug-001") == bug
+        assert store.list_bugs() == [bug]
+
+        # Writing a streamed bug elsewhere keeps its stored lists
+        copy = BugStore(tmp_path / "copy.db")
+        copy.initialize()
+        copy.add_bugs(store.iter_bugs())
+        assert copy.get_bug("bug-001") == bug
+        copy.close()
+        store.close()
+
+    def test_data_version_changes_after_rollback(self, tmp_path):
+        """Reads inside a rolled-back transaction must not share the later token."""
+        import pytest
+
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="Discarded",
+            description=None,
+            status="open",
+            priority="low",
+            tags=[],
+            related_bugs=[],
+            created_at="2025-11-27T10:00:00Z",
+            history=[],
+        )
+
+        with pytest.raises(RuntimeError), store.transaction():
+            store.add_bug(bug)
+            during = store.data_version()
+            raise RuntimeError
+
+        assert store.get_bug("bug-001") is None
+        assert store.data_version() != during
+        store.close()
+
+    def test_history_is_append_only(self, tmp_path):
+        """Should append history entries as rows without rewriting stored ones."""
+        from src.plugins.bugtracker import Bug, BugStore, HistoryEntry
+
+        store = BugStore(tmp_path / "bugs.db")
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="History bug",
+            description=None,
+            status="open",
+            priority="low",
+            tags=[],
+            related_bugs=[],
+            created_at="2025-11-27T10:00:00Z",
+            history=[HistoryEntry(timestamp="2025-11-27T11:00:00Z", changes={}, note="first")],
+        )
+        store.add_bug(bug)
+
+        store.append_history(
+            "bug-001",
+            HistoryEntry(
+                timestamp="2025-11-27T12:00:00Z",
+                changes={"status": ("open", "closed")},
+                note=None,
+            ),
+        )
+        stored = store.get_bug("bug-001")
+        stored.history.append(
+            HistoryEntry(timestamp="2025-11-27T13:00:00Z", changes={}, note="third")
+        )
+        store.update_bug(stored)
+
+        history = store.get_bug("bug-001").history
+        assert [h.timestamp[11:13] for h in history] == ["11", "12", "13"]
+        assert history[1].changes == {"status": ("open", "closed")}
+        rows = store._get_connection().execute(
+            "SELECT seq FROM bug_history WHERE bug_id = 'bug-001'"
+        )
+        assert [row[0] for row in rows] == [1, 2, 3]
+        store.close()
+
     def test_update_bug(self, tmp_path):
         """Should update an existing bug."""
         from src.plugins.bugtracker import Bug, BugStore, HistoryEntry
@@ -616,6 +953,196 @@ class TestBugStore:
         assert backend_bugs[0].id == "bug-001"
         store.close()
 
+    def test_iter_bugs_streams_listing(self, tmp_path):
+        """Should yield the same bugs as list_bugs() from a lazy iterator."""
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        store.add_bugs(
+            Bug(
+                id=f"bug-00{i}",
+                project_id="myproject-abc12345",
+                project_path="/path/to/myproject",
+                title="Bug",
+                description=None,
+                status="open",
+                priority="low",
+                tags=[],
+                related_bugs=[],
+                created_at=f"2025-11-27T1{i}:00:00Z",
+                history=[],
+            )
+            for i in range(3)
+        )
+
+        bugs = store.iter_bugs(project_id="myproject-abc12345")
+        assert not isinstance(bugs, list)
+        assert next(bugs).id == "bug-002"
+        assert [b.id for b in bugs] == ["bug-001", "bug-000"]
+        assert store.list_bugs() == list(store.iter_bugs())
+        store.close()
+
+    def test_list_bugs_filter_requires_all_tags(self, tmp_path):
+        """Should only return bugs that have every requested tag."""
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        for bug_id, tags in (("bug-001", ["ui"]), ("bug-002", ["frontend", "ui"])):
+            store.add_bug(
+                Bug(
+                    id=bug_id,
+                    project_id="myproject-abc12345",
+                    project_path="/path/to/myproject",
+                    title="Bug",
+                    description=None,
+                    status="open",
+                    priority="low",
+                    tags=tags,
+                    related_bugs=[],
+                    created_at="2025-11-27T10:00:00Z",
+                    history=[],
+                )
+            )
+
+        assert [b.id for b in store.list_bugs(tags=["ui", "frontend"])] == ["bug-002"]
+        assert [b.id for b in store.list_bugs(tags=["frontend", "frontend"])] == ["bug-002"]
+        store.close()
+
+    def test_list_bugs_filter_tags_after_update(self, tmp_path):
+        """Should filter on the tags saved by the latest update."""
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="Bug",
+            description=None,
+            status="open",
+            priority="low",
+            tags=["backend"],
+            related_bugs=[],
+            created_at="2025-11-27T10:00:00Z",
+            history=[],
+        )
+        store.add_bug(bug)
+
+        bug.tags = ["frontend"]
+        store.update_bug(bug)
+
+        assert store.list_bugs(tags=["backend"]) == []
+        assert [b.id for b in store.list_bugs(tags=["frontend"])] == ["bug-001"]
+        store.close()
+
+    def test_search_bugs_full_text(self, tmp_path):
+        """Should find bugs by words in title or description, tracking updates."""
+        from src.plugins.bugtracker import Bug, BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        bug = Bug(
+            id="bug-001",
+            project_id="myproject-abc12345",
+            project_path="/path/to/myproject",
+            title="Crash on startup",
+            description="Happens when the config file is missing",
+            status="open",
+            priority="high",
+            tags=[],
+            related_bugs=[],
+            created_at="2025-11-27T10:00:00Z",
+            history=[],
+        )
+        store.add_bug(bug)
+
+        assert [b.id for b in store.search_bugs("config missing")] == ["bug-001"]
+        assert [b.id for b in store.search_bugs("crash", "myproject-abc12345")] == ["bug-001"]
+        assert store.search_bugs("crash", "other-project") == []
+
+        bug.title = "Hang on startup"
+        store.update_bug(bug)
+        assert store.search_bugs("crash") == []
+        assert [b.id for b in store.search_bugs("hang")] == ["bug-001"]
+        store.close()
+
+    def test_backfills_indexes_for_existing_database(self, tmp_path):
+        """Should index tags and text of bugs stored before those tables existed."""
+        import sqlite3
+
+        from src.plugins.bugtracker import BugStore
+
+        db_path = tmp_path / "bugs.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE bugs (id TEXT PRIMARY KEY, project_id TEXT NOT NULL, "
+            "project_path TEXT NOT NULL, title TEXT NOT NULL, description TEXT, "
+            "status TEXT NOT NULL, priority TEXT NOT NULL, tags TEXT NOT NULL, "
+            "related_bugs TEXT NOT NULL, created_at TEXT NOT NULL, history TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO bugs VALUES ('bug-001', 'p-1', '/p', 'Old bug', NULL, 'open', "
+            "'low', '[\"legacy\"]', '[]', '2025-11-27T10:00:00Z', '[]')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = BugStore(db_path)
+        assert [b.id for b in store.list_bugs(tags=["legacy"])] == ["bug-001"]
+        assert [b.id for b in store.search_bugs("old")] == ["bug-001"]
+        store.close()
+
+    def test_migrates_text_status_and_priority_to_codes(self, tmp_path):
+        """Should convert TEXT status/priority columns of v3 databases to integer codes."""
+        import sqlite3
+
+        from src.plugins.bugtracker import _SQL_CREATE_FTS, BugStore
+
+        db_path = tmp_path / "bugs.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE bugs (id TEXT PRIMARY KEY, project_id TEXT NOT NULL, "
+            "project_path TEXT NOT NULL, title TEXT NOT NULL, description TEXT, "
+            "status TEXT NOT NULL, priority TEXT NOT NULL, tags TEXT NOT NULL, "
+            "related_bugs TEXT NOT NULL, created_at TEXT NOT NULL, history TEXT NOT NULL)"
+        )
+        conn.executescript(_SQL_CREATE_FTS)
+        conn.execute(
+            "INSERT INTO bugs VALUES ('bug-001', 'p-1', '/p', 'Login hang', NULL, "
+            "'in_progress', 'critical', '[]', '[]', '2025-11-27T10:00:00Z', ?)",
+            (
+                '[{"timestamp": "2025-11-27T11:00:00Z", '
+                '"changes": {"status": ["open", "in_progress"]}, "note": "started"}]',
+            ),
+        )
+        conn.execute(
+            "INSERT INTO bugs VALUES ('bug-002', 'p-1', '/p', 'Typo', NULL, "
+            "'closed', 'low', '[]', '[]', '2025-11-27T11:00:00Z', '[]')"
+        )
+        conn.execute("PRAGMA user_version = 3")
+        conn.commit()
+        conn.close()
+
+        store = BugStore(db_path)
+        raw = store._get_connection().execute(
+            "SELECT status, priority FROM bugs WHERE id = 'bug-001'"
+        )
+        assert raw.fetchone() == (1, 3)
+
+        bug = store.get_bug("bug-001")
+        assert (bug.status, bug.priority) == ("in_progress", "critical")
+        assert [(h.changes, h.note) for h in bug.history] == [
+            ({"status": ("open", "in_progress")}, "started")
+        ]
+        assert [b.id for b in store.list_bugs(status="closed", priority="low")] == ["bug-002"]
+        assert store.list_bugs(status="unknown") == []
+        assert [b.id for b in store.search_bugs("hang")] == ["bug-001"]
+
+        # Triggers are recreated on the rebuilt table
+        bug.title = "Logout crash"
+        store.update_bug(bug)
+        assert [b.id for b in store.search_bugs("crash")] == ["bug-001"]
+        store.close()
+
     def test_bug_with_related_bugs_roundtrip(self, tmp_path):
         """Should store and retrieve bugs with related bugs."""
         from src.plugins.bugtracker import Bug, BugStore, RelatedBug
@@ -665,6 +1192,81 @@ class TestBugStore:
         conn.close()
         assert result[0].lower() == "wal"
 
+    def test_connection_pragmas(self, tmp_path):
+        """Should tune the connection for WAL with a larger page cache."""
+        from src.plugins.bugtracker import BugStore
+
+        store = BugStore(tmp_path / "bugs.db")
+        conn = store._get_connection()
+
+        assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size;").fetchone()[0] == -20000
+        assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 2  # MEMORY
+        store.close()
+
+    def test_schema_version_recorded(self, tmp_path):
+        """Should stamp the schema version so later opens skip initialization."""
+        from src.plugins.bugtracker import _SCHEMA_VERSION, BugStore
+
+        db_path = tmp_path / "bugs.db"
+        store = BugStore(db_path)
+        store.initialize()
+        store.close()
+
+        store = BugStore(db_path)
+        conn = store._get_connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION
+        assert store.list_bugs() == []
+        store.close()
+
+    def test_list_filters_use_composite_index(self, tmp_path):
+        """Status and priority filters should be served by one composite index."""
+        from src.plugins.bugtracker import BugStore, _list_bugs_sql
+
+        store = BugStore(tmp_path / "bugs.db")
+        conn = store._get_connection()
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + _list_bugs_sql(True, True, True, 0, False),
+            ("proj-12345678", "open", "high"),
+        ).fetchall()
+        assert any("idx_bugs_filters" in row[-1] for row in plan)
+        store.close()
+
+    def test_filtered_listings_skip_sort(self, tmp_path):
+        """Project and status/priority listings should read created_at order from the index."""
+        from src.plugins.bugtracker import BugStore, _list_bugs_sql
+
+        store = BugStore(tmp_path / "bugs.db")
+        conn = store._get_connection()
+
+        for filters, params in (
+            ((True, False, False), ("proj-12345678",)),
+            ((True, True, True), ("proj-12345678", "open", "high")),
+            ((True, False, True), ("proj-12345678", "high")),
+        ):
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN " + _list_bugs_sql(*filters, 0, False), params
+            ).fetchall()
+            assert not any("TEMP B-TREE" in row[-1] for row in plan)
+        store.close()
+
+    def test_tag_and_text_filters_run_in_sql(self, tmp_path):
+        """Tag and text filters should use the tag index and the FTS table."""
+        from src.plugins.bugtracker import BugStore, _list_bugs_sql
+
+        store = BugStore(tmp_path / "bugs.db")
+        conn = store._get_connection()
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + _list_bugs_sql(True, False, False, 2, True),
+            ("proj-12345678", "ui", "crash", 2, '"login"'),
+        ).fetchall()
+        details = " | ".join(row[-1] for row in plan)
+        assert "idx_bug_tags_tag" in details
+        assert "bugs_fts" in details
+        store.close()
+
 
 class TestInitBugtrackerTool:
     """Tests for init_bugtracker tool.
@@ -711,6 +1313,25 @@ class TestInitBugtrackerTool:
 
         assert (tmp_path / ".mcp-bugtracker" / "bugs.db").exists()
 
+    def test_init_resolves_relative_path_against_cwd(self, tmp_path, monkeypatch):
+        """Relative project paths should follow the current directory."""
+        import json
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        for name in ("a", "b"):
+            (tmp_path / name / "proj").mkdir(parents=True)
+
+        plugin = BugTrackerPlugin()
+        paths = []
+        for name in ("a", "b"):
+            monkeypatch.chdir(tmp_path / name)
+            result = plugin.execute("init_bugtracker", {"project_path": "proj"})
+            paths.append(json.loads(result.content[0]["text"])["project_path"])
+
+        assert paths == [str(tmp_path / "a" / "proj"), str(tmp_path / "b" / "proj")]
+
     def test_init_allows_reinit(self, tmp_path, monkeypatch):
         """Should allow multiple init calls (idempotent)."""
         from src.plugins.bugtracker import BugTrackerPlugin
@@ -907,6 +1528,30 @@ class TestAddBugTool:
 class TestGetBugTool:
     """Tests for get_bug tool."""
 
+    def test_get_bug_rejects_null_or_blank_bug_id(self, tmp_path):
+        """Should reject a null or blank bug_id."""
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        plugin.execute("init_bugtracker", {"project_path": str(tmp_path)})
+
+        for args in ({"bug_id": None}, {"bug_id": "   "}):
+            result = plugin.execute("get_bug", {**args, "project_path": str(tmp_path)})
+            assert result.is_error is True
+            assert result.content[0]["text"] == "bug_id is required"
+
+    def test_get_bug_strips_bug_id(self, tmp_path):
+        """Should accept a bug_id with surrounding whitespace."""
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        add_result = plugin.execute("add_bug", {"title": "Bug", "project_path": str(tmp_path)})
+        bug_id = add_result.content[0]["text"].split(": ")[1]
+
+        result = plugin.execute("get_bug", {"bug_id": f" {bug_id} ", "project_path": str(tmp_path)})
+
+        assert result.is_error is False
+
     def test_get_bug_returns_bug(self, tmp_path):
         """Should retrieve bug by ID."""
         import json
@@ -1054,6 +1699,26 @@ class TestUpdateBugTool:
         assert bug_data["history"][1]["changes"] == {}
         assert "Tried approach X" in bug_data["history"][1]["note"]
 
+    def test_update_bug_without_changes_is_noop(self, tmp_path):
+        """Should not add history when nothing changed and no note is given."""
+        import json
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        add_result = plugin.execute("add_bug", {"title": "Bug", "project_path": str(tmp_path)})
+        bug_id = add_result.content[0]["text"].split(": ")[1]
+
+        result = plugin.execute(
+            "update_bug",
+            {"bug_id": bug_id, "status": "open", "project_path": str(tmp_path)},
+        )
+
+        assert result.is_error is False
+        assert result.content[0]["text"] == f"No changes for bug: {bug_id}"
+        get_result = plugin.execute("get_bug", {"bug_id": bug_id, "project_path": str(tmp_path)})
+        assert json.loads(get_result.content[0]["text"])["history"] == []
+
     def test_update_bug_priority(self, tmp_path):
         """Should update priority."""
         import json
@@ -1105,6 +1770,33 @@ class TestUpdateBugTool:
         bug_data = json.loads(get_result.content[0]["text"])
         assert bug_data["tags"] == ["backend", "urgent"]
 
+    def test_update_bug_tags_reordered_records_no_change(self, tmp_path):
+        """Re-sending the same tags in another order should not log a tag change."""
+        import json
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        add_result = plugin.execute(
+            "add_bug",
+            {"title": "Bug", "tags": ["backend", "urgent"], "project_path": str(tmp_path)},
+        )
+        bug_id = add_result.content[0]["text"].split(": ")[1]
+
+        plugin.execute(
+            "update_bug",
+            {
+                "bug_id": bug_id,
+                "tags": ["urgent", "backend"],
+                "note": "Triage",
+                "project_path": str(tmp_path),
+            },
+        )
+
+        get_result = plugin.execute("get_bug", {"bug_id": bug_id, "project_path": str(tmp_path)})
+        history = json.loads(get_result.content[0]["text"])["history"]
+        assert "tags" not in history[-1]["changes"]
+
     def test_update_bug_related_bugs(self, tmp_path):
         """Should update related_bugs."""
         import json
@@ -1136,6 +1828,31 @@ class TestUpdateBugTool:
         assert len(bug_data["related_bugs"]) == 1
         assert bug_data["related_bugs"][0]["bug_id"] == bug1_id
         assert bug_data["related_bugs"][0]["relationship"] == "duplicate_of"
+        change = bug_data["history"][-1]["changes"]["related_bugs"]
+        assert change == [
+            "[]",
+            json.dumps([{"bug_id": bug1_id, "relationship": "duplicate_of"}], sort_keys=True),
+        ]
+
+    def test_update_bug_same_related_bugs_is_noop(self, tmp_path):
+        """Resubmitting unchanged related_bugs should record no change."""
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        add_result = plugin.execute("add_bug", {"title": "Bug", "project_path": str(tmp_path)})
+        bug_id = add_result.content[0]["text"].split(": ")[1]
+        update = {
+            "bug_id": bug_id,
+            "related_bugs": [{"bug_id": "bug-other", "relationship": "blocks"}],
+            "project_path": str(tmp_path),
+        }
+        plugin.execute("update_bug", update)
+
+        # Same relationships, keys in another order
+        update["related_bugs"] = [{"relationship": "blocks", "bug_id": "bug-other"}]
+        result = plugin.execute("update_bug", update)
+
+        assert result.content[0]["text"] == f"No changes for bug: {bug_id}"
 
     def test_update_bug_reopen(self, tmp_path):
         """Should allow reopening a closed bug."""
@@ -1305,6 +2022,100 @@ class TestListBugsTool:
         bugs = json.loads(result.content[0]["text"])
         assert len(bugs) == 3
 
+    def test_list_bugs_summary(self, tmp_path):
+        """Should return only scalar fields when summary is requested."""
+        import json
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        plugin.execute(
+            "add_bug",
+            {"title": "Bug 1", "tags": ["ui"], "project_path": str(tmp_path)},
+        )
+
+        full = json.loads(
+            plugin.execute("list_bugs", {"project_path": str(tmp_path)}).content[0]["text"]
+        )
+        result = plugin.execute(
+            "list_bugs", {"project_path": str(tmp_path), "tags": ["ui"], "summary": True}
+        )
+
+        summaries = json.loads(result.content[0]["text"])
+        fields = ("id", "project_id", "title", "status", "priority", "created_at")
+        assert summaries == [{key: full[0][key] for key in fields}]
+
+    def test_list_bugs_cached_until_written(self, tmp_path, global_db_path):
+        """Should reuse a rendered listing until a bug is written by any connection."""
+        import json
+
+        from src.plugins.bugtracker import Bug, BugStore, BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        added = plugin.execute("add_bug", {"title": "Bug 1", "project_path": str(tmp_path)})
+        bug_id = added.content[0]["text"].split(": ")[-1]
+        args = {"project_path": str(tmp_path), "tags": []}
+
+        first = plugin.execute("list_bugs", args).content[0]["text"]
+        assert plugin.execute("list_bugs", dict(args)).content[0]["text"] is first
+
+        plugin.execute("update_bug", {"bug_id": bug_id, "status": "closed", **args})
+        bugs = json.loads(plugin.execute("list_bugs", args).content[0]["text"])
+        assert [b["status"] for b in bugs] == ["closed"]
+
+        # A write through another connection (e.g. another server process)
+        other = BugStore(global_db_path)
+        other.add_bug(Bug.from_dict({**bugs[0], "id": "bug-other", "history": []}))
+        other.close()
+        bugs = json.loads(plugin.execute("list_bugs", args).content[0]["text"])
+        assert {b["id"] for b in bugs} == {bug_id, "bug-other"}
+        plugin.cleanup()
+
+    def test_list_bugs_cache_is_not_shared_across_connections(self, tmp_path, global_db_path):
+        """A listing cached on one thread's connection should not be served to another's."""
+        import json
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.plugins.bugtracker import Bug, BugStore, BugTrackerPlugin
+
+        plugin = BugTrackerPlugin()
+        plugin.execute("add_bug", {"title": "Bug 1", "project_path": str(tmp_path)})
+        args = {"project_path": str(tmp_path)}
+        bugs = json.loads(plugin.execute("list_bugs", args).content[0]["text"])
+
+        # Committed elsewhere; a worker thread's fresh connection starts with
+        # its own data_version, which must not be compared with the main one's
+        other = BugStore(global_db_path)
+        other.add_bug(Bug.from_dict({**bugs[0], "id": "bug-other", "history": []}))
+        other.close()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(plugin.execute, "list_bugs", args).result()
+        ids = {b["id"] for b in json.loads(result.content[0]["text"])}
+        assert ids == {bugs[0]["id"], "bug-other"}
+        plugin.cleanup()
+
+    def test_list_bugs_cache_is_bounded_by_size(self, tmp_path, global_db_path, monkeypatch):
+        """Should evict by rendered size and not cache listings over the budget."""
+        import src.plugins.bugtracker as bugtracker
+
+        monkeypatch.setattr(bugtracker, "_LISTING_CACHE_CHARS", 600)
+        plugin = bugtracker.BugTrackerPlugin()
+        plugin.execute(
+            "add_bug",
+            {"title": "Bug 1", "description": "x" * 1000, "project_path": str(tmp_path)},
+        )
+        args = {"project_path": str(tmp_path)}
+
+        # A summary fits the budget; the full listing with its description does not
+        summary = plugin.execute("list_bugs", {**args, "summary": True}).content[0]["text"]
+        full = plugin.execute("list_bugs", args).content[0]["text"]
+        assert len(summary) <= 600 < len(full)
+
+        assert plugin.execute("list_bugs", dict(args)).content[0]["text"] is not full
+        assert plugin._listing_cache.currsize == len(summary)
+        plugin.cleanup()
+
     def test_list_bugs_filter_by_status(self, tmp_path):
         """Should filter bugs by status."""
         import json
@@ -1437,6 +2248,36 @@ class TestListBugsTool:
         assert len(bugs) == 1
         assert bugs[0]["title"] == "A"
 
+    def test_list_bugs_output_matches_whole_list_encoding(self, tmp_path):
+        """Should render the same text as formatting the full list of dicts."""
+        from src.plugins.bugtracker import (
+            BugStore,
+            BugTrackerPlugin,
+            compute_project_id,
+            dumps_indented,
+        )
+
+        plugin = BugTrackerPlugin()
+        plugin.execute("init_bugtracker", {"project_path": str(tmp_path)})
+        add = plugin.execute(
+            "add_bug",
+            {"title": "A\nmultiline", "tags": ["x", "y"], "project_path": str(tmp_path)},
+        )
+        bug_id = add.content[0]["text"].split(": ")[1]
+        plugin.execute(
+            "update_bug",
+            {"bug_id": bug_id, "note": "checked", "project_path": str(tmp_path)},
+        )
+        plugin.execute("add_bug", {"title": "B", "project_path": str(tmp_path)})
+
+        result = plugin.execute("list_bugs", {"project_path": str(tmp_path)})
+
+        store = plugin._get_store()
+        assert isinstance(store, BugStore)
+        bugs = store.list_bugs(project_id=compute_project_id(str(tmp_path.resolve())))
+        expected = dumps_indented([bug.to_dict() for bug in bugs])
+        assert result.content[0]["text"] == expected
+
 
 class TestProjectIndex:
     """Tests for project tracking with global database.
@@ -1519,6 +2360,45 @@ class TestProjectIndex:
         projects = get_indexed_projects()
         assert projects == ["/path/to/project1", "/path/to/project2"]
 
+    def test_indexed_projects_reread_when_index_changes(self, tmp_path, monkeypatch):
+        """The cached index should be refreshed after the file changes."""
+        import json
+        import os
+
+        from src.plugins.bugtracker import get_indexed_projects, get_project_index_path
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        index_path = get_project_index_path()
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(json.dumps({"projects": ["/a"]}))
+
+        first = get_indexed_projects()
+        first.append("/mutated")
+        assert get_indexed_projects() == ["/a"]
+
+        index_path.write_text(json.dumps({"projects": ["/a", "/b"]}))
+        stat = index_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert get_indexed_projects() == ["/a", "/b"]
+
+    def test_register_project_skips_write_when_present(self, tmp_path, monkeypatch):
+        """Registering an indexed project should not rewrite the index."""
+        from src.plugins.bugtracker import (
+            _register_project_in_index,
+            get_indexed_projects,
+            get_project_index_path,
+        )
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        _register_project_in_index("/a")
+        index_path = get_project_index_path()
+        mtime = index_path.stat().st_mtime_ns
+        _register_project_in_index("/a")
+
+        assert index_path.stat().st_mtime_ns == mtime
+        assert get_indexed_projects() == ["/a"]
+
 
 class TestSearchBugsGlobal:
     """Tests for search_bugs_global tool."""
@@ -1594,6 +2474,39 @@ class TestSearchBugsGlobal:
         bugs = json.loads(result.content[0]["text"])
         assert len(bugs) == 2
 
+    def test_search_by_text_query(self, tmp_path, monkeypatch):
+        """Should full-text search titles and descriptions across projects."""
+        import json
+
+        from src.plugins.bugtracker import BugTrackerPlugin
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        project1 = tmp_path / "project1"
+        project2 = tmp_path / "project2"
+        project1.mkdir()
+        project2.mkdir()
+
+        plugin = BugTrackerPlugin()
+        plugin.execute("add_bug", {"title": "Login fails", "project_path": str(project1)})
+        plugin.execute(
+            "add_bug",
+            {
+                "title": "Session bug",
+                "description": "Users get logged out after login",
+                "project_path": str(project2),
+            },
+        )
+        plugin.execute("add_bug", {"title": "Slow search page", "project_path": str(project2)})
+
+        result = plugin.execute("search_bugs_global", {"query": "login"})
+        titles = sorted(b["title"] for b in json.loads(result.content[0]["text"]))
+        assert titles == ["Login fails", "Session bug"]
+
+        # FTS5 syntax in the query is matched literally, not interpreted
+        result = plugin.execute("search_bugs_global", {"query": 'login" OR "slow'})
+        assert result.is_error is False
+
     def test_search_empty_result(self, tmp_path, monkeypatch):
         """Should return empty list when no bugs match."""
         import json
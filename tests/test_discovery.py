@@ -92,6 +92,16 @@ class TestSearchToolsTool:
         # Should include discovery plugin's own tools plus mock tools
         assert len(tools) >= 2
 
+    def test_search_tools_sees_plugins_registered_later(self, dispatcher_with_plugins):
+        """Should refresh its search index when plugins are registered after a search."""
+        plugin = ToolDiscoveryPlugin(dispatcher_with_plugins)
+        plugin.execute("search_tools", {"query": "mock"})
+
+        dispatcher_with_plugins.register_plugin(plugin)
+        result = plugin.execute("search_tools", {"query": "search_tools", "detail_level": "name"})
+
+        assert json.loads(result.content[0]["text"]) == ["search_tools"]
+
     def test_search_tools_detail_level_name(self, dispatcher_with_plugins):
         """Should return only names at detail_level='name'."""
         plugin = ToolDiscoveryPlugin(dispatcher_with_plugins)
@@ -257,3 +267,37 @@ class TestListCategoriesTool:
         assert "tools" in mock_cat
         assert "tool1" in mock_cat["tools"]
         assert "tool2" in mock_cat["tools"]
+
+    def test_list_categories_tracks_availability_and_registration(self, dispatcher_with_plugins):
+        """Cached output should follow availability changes and new plugins."""
+        plugin = ToolDiscoveryPlugin(dispatcher_with_plugins)
+        dispatcher_with_plugins.register_plugin(plugin)
+        mock = dispatcher_with_plugins._plugins[0]
+        first = plugin.execute("list_categories", {}).content[0]["text"]
+        assert plugin.execute("list_categories", {}).content[0]["text"] is first
+
+        mock.is_available = lambda: False
+        mock.availability_hint = lambda: "offline"
+        categories = json.loads(plugin.execute("list_categories", {}).content[0]["text"])
+        mock_cat = next(c for c in categories if c["category"] == "mock")
+        assert mock_cat["available"] is False
+        assert mock_cat["availability_hint"] == "offline"
+
+        class LatePlugin(PluginBase):
+            @property
+            def name(self) -> str:
+                return "late"
+
+            @property
+            def version(self) -> str:
+                return "1.0.0"
+
+            def get_tools(self) -> list[ToolDefinition]:
+                return []
+
+            def execute(self, tool_name: str, arguments: dict) -> ToolResult:
+                return ToolResult(content=[])
+
+        dispatcher_with_plugins.register_plugin(LatePlugin())
+        categories = json.loads(plugin.execute("list_categories", {}).content[0]["text"])
+        assert "late" in [c["category"] for c in categories]
@@ -114,6 +114,18 @@ class TestSecurityEngine:
         with pytest.raises(RateLimitExceeded):
             engine.check_rate_limit("web_search")
 
+    def test_resolves_rate_limit_once_per_tool(self, policy_with_audit):
+        """Should look up each tool's limit in the policy only once."""
+        policy, tmpdir = policy_with_audit
+        engine = SecurityEngine(policy)
+
+        with patch.object(policy, "get_rate_limit", wraps=policy.get_rate_limit) as lookup:
+            for _ in range(3):
+                engine.check_rate_limit("web_search")
+            engine.check_rate_limit("other_tool")
+
+        assert lookup.call_count == 2
+
     def test_rate_limits_reset_over_time(self, policy_with_audit):
         """Should reset rate limits after window passes."""
         policy, tmpdir = policy_with_audit
@@ -227,6 +239,15 @@ class TestSecurityEngineEdgeCases:
         # All IDs should be unique
         assert len(set(ids)) == 100
 
+    def test_request_ids_differ_between_engines(self, policy_with_audit):
+        """Should not repeat request IDs across engine instances (restarts)."""
+        policy, tmpdir = policy_with_audit
+
+        first = SecurityEngine(policy).generate_request_id()
+        second = SecurityEngine(policy).generate_request_id()
+
+        assert first != second
+
     def test_logs_url_blocked_event(self, policy_with_audit):
         """Should log URL blocked security event."""
         policy, tmpdir = policy_with_audit
@@ -0,0 +1,74 @@
+"""Tests for the shared JSON codec."""
+
+import importlib
+import json
+import sys
+import types
+
+import pytest
+
+import src.json_codec
+
+
+@pytest.fixture
+def fake_orjson(monkeypatch):
+    """Reload the codec against a stand-in orjson module built on json.
+
+    Exercises the orjson branch without the optional dependency installed.
+    The codec is reloaded with the real environment afterwards.
+    """
+    calls = []
+
+    def dumps(value, option=0):
+        calls.append(option)
+        indent = 2 if option & module.OPT_INDENT_2 else None
+        separators = None if indent else (",", ":")
+        return json.dumps(value, indent=indent, separators=separators).encode()
+
+    module = types.ModuleType("orjson")
+    module.OPT_INDENT_2 = 1
+    module.OPT_NON_STR_KEYS = 2
+    module.dumps = dumps
+    module.loads = json.loads
+    module.calls = calls
+
+    monkeypatch.setitem(sys.modules, "orjson", module)
+    yield importlib.reload(src.json_codec)
+    monkeypatch.delitem(sys.modules, "orjson")
+    importlib.reload(src.json_codec)
+
+
+class TestJsonCodec:
+    """Tests for the codec in the current environment."""
+
+    def test_formats(self):
+        """Should encode compactly, indented, and for the wire."""
+        from src.json_codec import dumps, dumps_compact, dumps_indented, loads
+
+        value = {"a": [1, 2], "b": None}
+
+        assert dumps_compact(value) == '{"a":[1,2],"b":null}'
+        assert dumps_indented(value) == json.dumps(value, indent=2)
+        assert loads(dumps(value)) == value
+
+    def test_orjson_branch(self, fake_orjson):
+        """Should route every encoder through orjson with the matching options."""
+        codec = fake_orjson
+        value = {"a": [1, 2]}
+
+        assert codec.HAS_ORJSON is True
+        assert codec.loads is sys.modules["orjson"].loads
+        assert codec.dumps_compact(value) == '{"a":[1,2]}'
+        assert codec.dumps_indented(value) == json.dumps(value, indent=2)
+        assert codec.loads(codec.dumps(value)) == value
+        assert sys.modules["orjson"].calls == [0, 1, 2]
+
+    def test_real_orjson_matches_stdlib_layout(self):
+        """orjson's indented and compact output should match the stdlib's."""
+        orjson = pytest.importorskip("orjson")
+        value = {"title": "Crash", "tags": ["ui"], "history": [], "n": 1}
+
+        assert orjson.dumps(value).decode() == json.dumps(value, separators=(",", ":"))
+        assert orjson.dumps(value, option=orjson.OPT_INDENT_2).decode() == json.dumps(
+            value, indent=2
+        )
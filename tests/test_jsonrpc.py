@@ -16,7 +16,9 @@ from src.protocol.jsonrpc import (
     format_error,
     format_notification,
     format_response,
+    format_serialized_response,
     parse_message,
+    to_json,
 )
 
 
@@ -149,6 +151,15 @@ class TestFormatResponse:
 
         assert parsed["result"] is None
 
+    def test_serialized_response_matches_format_response(self):
+        """Should splice a pre-serialized result into the same envelope."""
+        result = {"tools": [{"name": "echo", "description": 'say "hi"'}]}
+
+        for msg_id in (7, 'id "q"'):
+            assert format_serialized_response(msg_id, to_json(result)) == format_response(
+                msg_id, result
+            )
+
 
 class TestFormatError:
     """Tests for formatting JSON-RPC errors."""
@@ -183,6 +194,21 @@ class TestFormatError:
 class TestFormatNotification:
     """Tests for formatting JSON-RPC notifications."""
 
+    def test_reuses_error_envelope_without_id(self):
+        """Should serialize a repeated id-less error once."""
+        first = format_error(None, INVALID_REQUEST, "Invalid Request: message must be an object")
+        second = format_error(None, INVALID_REQUEST, "Invalid Request: message must be an object")
+
+        assert first is second
+        assert json.loads(first) == {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": INVALID_REQUEST,
+                "message": "Invalid Request: message must be an object",
+            },
+        }
+
     def test_formats_notification(self):
         """Should format notification."""
         notification = format_notification("notifications/tools/list_changed")
@@ -192,6 +218,13 @@ class TestFormatNotification:
         assert parsed["method"] == "notifications/tools/list_changed"
         assert "id" not in parsed
 
+    def test_formats_notification_escapes_method(self):
+        """Should escape the method name exactly as a full encode would."""
+        method = 'odd "name"\\\n'
+        notification = format_notification(method)
+
+        assert json.loads(notification) == {"jsonrpc": "2.0", "method": method}
+
     def test_formats_notification_with_params(self):
         """Should format notification with params."""
         notification = format_notification("notifications/progress", {"value": 75})
@@ -238,6 +271,53 @@ class TestMessageSizeLimit:
         assert exc_info.value.code == PARSE_ERROR
         assert "too large" in exc_info.value.message.lower()
 
+    def test_limit_counts_utf8_bytes(self):
+        """Should measure text messages in UTF-8 bytes, not characters."""
+        # Under the limit in characters, over it once encoded
+        data = {"jsonrpc": "2.0", "id": 1, "method": "test", "params": {"data": "é" * 600000}}
+        message = json.dumps(data, ensure_ascii=False)
+
+        with pytest.raises(JsonRpcError, match="too large"):
+            parse_message(message)
+
+    def test_parses_bytes(self):
+        """Should parse UTF-8 bytes without a separate decode."""
+        raw = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "ping"}).encode()
+
+        result = parse_message(raw)
+
+        assert isinstance(result, JsonRpcRequest)
+        assert result.method == "ping"
+
+    def test_rejects_invalid_utf8_bytes(self):
+        """Should report undecodable bytes as a parse error."""
+        with pytest.raises(JsonRpcError) as exc_info:
+            parse_message(b'{"jsonrpc": "2.0", "method": "\xff"}')
+
+        assert exc_info.value.code == PARSE_ERROR
+
+    def test_malformed_array_or_string_is_parse_error(self):
+        """Should report malformed JSON as a parse error whatever it starts with."""
+        for raw in ('[{"jsonrpc": "2.0", "method": "sum"', '"unterminated', b"  [" + b"1," * 1000):
+            with pytest.raises(JsonRpcError) as exc_info:
+                parse_message(raw)
+            assert exc_info.value.code == PARSE_ERROR
+
+    def test_rejects_boolean_id(self):
+        """Should not accept JSON true/false as a request id."""
+        with pytest.raises(JsonRpcError, match="id must be"):
+            parse_message('{"jsonrpc": "2.0", "id": true, "method": "test"}')
+
+    def test_pathological_values_are_parse_errors(self):
+        """Should map oversized integers and deep nesting to parse errors."""
+        huge_int = '{"jsonrpc": "2.0", "id": ' + "9" * 5000 + ', "method": "t"}'
+        deep = '{"a": ' + "[" * 100000 + "]" * 100000 + "}"
+
+        for raw in (huge_int, deep):
+            with pytest.raises(JsonRpcError) as exc_info:
+                parse_message(raw)
+            assert exc_info.value.code == PARSE_ERROR
+
     def test_accepts_message_under_limit(self):
         """Should accept messages under 1MB."""
         # Create a message just under 1MB
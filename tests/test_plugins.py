@@ -91,6 +91,36 @@ class TestToolDefinition:
         assert d["description"] == "Search the web"
         assert "inputSchema" in d
 
+    def test_validate_shares_compiled_validator(self):
+        """Definitions with equal schemas should share one compiled validator."""
+        from jsonschema import ValidationError
+
+        schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+        first = ToolDefinition(name="a", description="", input_schema=schema)
+        second = ToolDefinition(name="b", description="", input_schema=dict(schema))
+
+        first.validate({"q": "ok"})
+        second.validate({"q": "ok"})
+
+        assert first._validator is second._validator
+        with pytest.raises(ValidationError):
+            first.validate({"q": 1})
+
+    def test_validator_shared_regardless_of_key_order(self):
+        """Schemas differing only in key order should share one validator."""
+        schema = {"type": "object", "properties": {"q": {"type": "string"}}}
+        reordered = {"properties": {"q": {"type": "string"}}, "type": "object"}
+        first = ToolDefinition(name="a", description="", input_schema=schema)
+        second = ToolDefinition(name="b", description="", input_schema=reordered)
+
+        first.validate({})
+        second.validate({})
+        assert first._validator is second._validator
+
+        # The shared validator holds its own copy of the schema
+        schema["properties"]["q"]["type"] = "integer"
+        second.validate({"q": "still a string"})
+
 
 class TestToolResult:
     """Tests for ToolResult dataclass."""
@@ -101,6 +131,14 @@ class TestToolResult:
         assert result.is_error is False
         assert len(result.content) == 1
 
+    def test_uses_slots(self):
+        """Results and definitions should not carry a per-instance __dict__."""
+        result = ToolResult(content=[])
+        tool = ToolDefinition(name="t", description="", input_schema={"type": "object"})
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(tool, "__dict__")
+
     def test_creates_error_result(self):
         """Should create error result."""
         result = ToolResult(
@@ -318,6 +356,74 @@ class TestToolDispatcher:
 
         assert result.content[0]["text"] == "test"
 
+    def test_passes_interned_tool_name(self):
+        """Should hand the plugin the registered (interned) tool name."""
+        import sys
+
+        seen: list[str] = []
+
+        class RecordingPlugin(MockPlugin):
+            def execute(self, tool_name: str, arguments: dict) -> ToolResult:
+                seen.append(tool_name)
+                return super().execute(tool_name, arguments)
+
+        dispatcher = ToolDispatcher()
+        dispatcher.register_plugin(RecordingPlugin())
+
+        dispatcher.call_tool("".join(["ec", "ho"]), {"message": "test"})
+
+        assert seen[0] is sys.intern("echo")
+
+    def test_has_tool(self):
+        """Should report whether a tool is registered."""
+        dispatcher = ToolDispatcher()
+        dispatcher.register_plugin(MockPlugin())
+
+        assert dispatcher.has_tool("echo") is True
+        assert dispatcher.has_tool("nonexistent") is False
+
+    def test_rejects_arguments_not_matching_schema(self):
+        """Should return an error result without executing the tool."""
+        dispatcher = ToolDispatcher()
+        dispatcher.register_plugin(MockPlugin())
+
+        result = dispatcher.call_tool("add", {"a": 1})
+
+        assert result.is_error is True
+        assert result.content[0]["text"] == "Invalid arguments for add: 'b' is a required property"
+
+    def test_invalid_input_schema_returns_error_result(self):
+        """Should report a tool's invalid schema as an error result."""
+
+        class BadSchemaPlugin(MockPlugin):
+            def get_tools(self) -> list[ToolDefinition]:
+                return [ToolDefinition(name="bad", description="", input_schema={"type": 1})]
+
+        dispatcher = ToolDispatcher()
+        dispatcher.register_plugin(BadSchemaPlugin())
+
+        result = dispatcher.call_tool("bad", {})
+
+        assert result.is_error is True
+        assert result.content[0]["text"] == "Invalid input schema for tool bad"
+
+    def test_startup_compiles_validators(self):
+        """Should compile every tool's validator at startup, skipping invalid schemas."""
+
+        class BadSchemaPlugin(MockPlugin):
+            def get_tools(self) -> list[ToolDefinition]:
+                return [ToolDefinition(name="bad", description="", input_schema={"type": 1})]
+
+        dispatcher = ToolDispatcher()
+        dispatcher.register_plugin(MockPlugin())
+        dispatcher.register_plugin(BadSchemaPlugin())
+
+        dispatcher.startup()
+
+        assert dispatcher._tool_defs["echo"]._validator is not None
+        assert dispatcher._tool_defs["add"]._validator is not None
+        assert dispatcher._tool_defs["bad"]._validator is None
+
     def test_raises_on_unknown_tool(self):
         """Should raise ToolNotFoundError for unknown tool."""
         dispatcher = ToolDispatcher()
@@ -157,6 +157,76 @@ class TestLoadPolicy:
                 os.unlink(f.name)
 
 
+class TestPolicyCache:
+    """Tests for the parsed-policy JSON sidecar cache."""
+
+    def test_writes_cache_sidecar(self, tmp_path: Path):
+        """Should write a JSON sidecar after parsing the YAML."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(yaml.dump({"version": "1.0"}))
+
+        load_policy(policy_path)
+
+        cache_path = tmp_path / "policy.yaml.cache.json"
+        assert cache_path.exists()
+        assert cache_path.read_text().startswith("# sha256=")
+
+    def test_uses_fresh_cache(self, tmp_path: Path):
+        """Should load from the sidecar when it matches the policy file."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(yaml.dump({"version": "1.0"}))
+        load_policy(policy_path)
+
+        # Rewrite the cached body, keeping the header that matches the policy
+        cache_path = tmp_path / "policy.yaml.cache.json"
+        header = cache_path.read_text().splitlines()[0]
+        cache_path.write_text(header + "\n" + '{"version": "cached"}')
+
+        assert load_policy(policy_path).version == "cached"
+
+    def test_ignores_stale_cache(self, tmp_path: Path):
+        """Should re-parse the YAML when the policy file has changed."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(yaml.dump({"version": "1.0"}))
+        load_policy(policy_path)
+
+        policy_path.write_text(yaml.dump({"version": "2.0", "tools": {}}))
+
+        assert load_policy(policy_path).version == "2.0"
+
+    def test_ignores_cache_after_edit_preserving_mtime(self, tmp_path: Path):
+        """Should notice a same-size edit even when the mtime is restored."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text("version: '1.0'\ntools:\n  rate_limits:\n    web_search: 20\n")
+        load_policy(policy_path)
+        stat = policy_path.stat()
+
+        policy_path.write_text("version: '1.0'\ntools:\n  rate_limits:\n    web_search: 21\n")
+        os.utime(policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_policy(policy_path).tool_rate_limits["web_search"] == 21
+
+    def test_ignores_corrupt_cache(self, tmp_path: Path):
+        """Should fall back to YAML when the sidecar is unreadable."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(yaml.dump({"version": "1.0"}))
+        load_policy(policy_path)
+
+        cache_path = tmp_path / "policy.yaml.cache.json"
+        header = cache_path.read_text().splitlines()[0]
+        cache_path.write_text(header + "\n{not json")
+
+        assert load_policy(policy_path).version == "1.0"
+
+    def test_skips_cache_for_non_json_values(self, tmp_path: Path):
+        """Should not cache configs that do not round-trip through JSON."""
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text("version: '1.0'\ncreated: 2024-01-01\n")
+
+        assert load_policy(policy_path).version == "1.0"
+        assert not (tmp_path / "policy.yaml.cache.json").exists()
+
+
 class TestSecurityPolicyValidation:
     """Tests for policy validation methods."""
 
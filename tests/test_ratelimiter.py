@@ -232,7 +232,7 @@ class TestRateLimiterBucketCleanup:
         time.sleep(0.1)
 
         # Force cleanup by setting last cleanup time far in the past
-        limiter._last_cleanup = 0.0
+        limiter._last_cleanup = time.monotonic() - 3600
 
         # Next check should trigger cleanup
         limiter.check_rate_limit("trigger_tool", limit=100)
@@ -252,10 +252,39 @@ class TestRateLimiterBucketCleanup:
         time.sleep(0.1)
 
         # Set last cleanup to now - cleanup shouldn't trigger
-        limiter._last_cleanup = time.time()
+        limiter._last_cleanup = time.monotonic()
 
         # Check rate limit - should not trigger cleanup due to interval
         limiter.check_rate_limit("new_tool", limit=100)
 
         # Old buckets should still exist (cleanup didn't run)
         assert limiter.bucket_count >= 10
+
+
+class TestRateLimiterTokenBucket:
+    """Tests for token bucket refill behavior."""
+
+    def test_refills_gradually(self) -> None:
+        """A spent token comes back after window / limit seconds."""
+        limiter = RateLimiter(window_seconds=0.4)
+
+        for _ in range(4):
+            limiter.check_rate_limit("test_tool", limit=4)
+        with pytest.raises(RateLimitExceeded):
+            limiter.check_rate_limit("test_tool", limit=4)
+
+        # One token refills every 0.1s
+        time.sleep(0.15)
+        limiter.check_rate_limit("test_tool", limit=4)
+        with pytest.raises(RateLimitExceeded):
+            limiter.check_rate_limit("test_tool", limit=4)
+
+    def test_bucket_state_is_constant_size(self) -> None:
+        """Bucket state should not grow with the number of requests."""
+        limiter = RateLimiter()
+
+        for _ in range(100):
+            limiter.check_rate_limit("test_tool", limit=1000)
+
+        assert len(limiter._buckets["test_tool"]) == 3
+        assert limiter.get_request_count("test_tool") == 100
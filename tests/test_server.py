@@ -154,6 +154,23 @@ class TestMCPServer:
         # 2 discovery tools auto-registered + 1 mock plugin tool
         assert len(result["result"]["tools"]) == 3
 
+    def test_tools_list_reuses_serialized_catalog(self, initialized_server: MCPServer):
+        """Should serialize the catalog once and refresh it on registration."""
+        request = '{"jsonrpc":"2.0","id":%d,"method":"tools/list"}'
+
+        first = json.loads(initialized_server.handle_message(request % 1))
+        cached = initialized_server._tools_list_json
+        second = json.loads(initialized_server.handle_message(request % 2))
+
+        assert initialized_server._tools_list_json is cached
+        assert second["id"] == 2
+        assert second["result"] == first["result"]
+
+        initialized_server.register_plugin(MockPlugin())
+        third = json.loads(initialized_server.handle_message(request % 3))
+
+        assert len(third["result"]["tools"]) == len(first["result"]["tools"]) + 1
+
     def test_handles_tools_call(self, initialized_server: MCPServer):
         """Should handle tools/call after initialization."""
         initialized_server.register_plugin(MockPlugin())
@@ -176,6 +193,29 @@ class TestMCPServer:
         assert "result" in result
         assert result["result"]["content"][0]["text"] == "Hello World"
 
+    def test_tools_call_with_invalid_input_schema(self, initialized_server: MCPServer):
+        """Should answer with an error result when a tool's own schema is invalid."""
+
+        class BadSchemaPlugin(MockPlugin):
+            def get_tools(self) -> list[ToolDefinition]:
+                return [ToolDefinition(name="bad", description="", input_schema={"type": "objekt"})]
+
+        initialized_server.register_plugin(BadSchemaPlugin())
+
+        call_request = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": 4,
+                "method": "tools/call",
+                "params": {"name": "bad", "arguments": {}},
+            }
+        )
+        result = json.loads(initialized_server.handle_message(call_request))
+
+        assert result["id"] == 4
+        assert result["result"]["isError"] is True
+        assert result["result"]["content"][0]["text"] == "Invalid input schema for tool bad"
+
     def test_rejects_request_before_init(self, server: MCPServer):
         """Should reject requests before initialization."""
         request = json.dumps(
@@ -205,6 +245,33 @@ class TestMCPServer:
         assert "error" in result
         assert result["error"]["code"] == -32601  # Method not found
 
+    def test_reset_session_requires_new_handshake(self, initialized_server: MCPServer):
+        """Should require initialize again after the session is reset."""
+        initialized_server.reset_session()
+
+        response = json.loads(
+            initialized_server.handle_message('{"jsonrpc":"2.0","id":5,"method":"tools/list"}')
+        )
+        assert "error" in response
+
+        response = json.loads(
+            initialized_server.handle_message(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 6,
+                        "method": "initialize",
+                        "params": {
+                            "protocolVersion": "2025-03-26",
+                            "capabilities": {},
+                            "clientInfo": {"name": "second-client", "version": "1.0"},
+                        },
+                    }
+                )
+            )
+        )
+        assert "result" in response
+
     def test_creates_server_without_policy(self):
         """Should create server with no policy path."""
         server = MCPServer()
@@ -318,6 +385,36 @@ class TestMCPServerSecurityIntegration:
         assert "error" in result3
         assert "rate" in result3["error"]["message"].lower()
 
+    def test_unknown_tool_skips_rate_limiter(self, rate_limited_server: MCPServer):
+        """Should reject unknown tools without creating rate limiter state."""
+        call_request = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {"name": "no_such_tool", "arguments": {}},
+            }
+        )
+
+        result = json.loads(rate_limited_server.handle_message(call_request))
+
+        assert result["result"]["isError"] is True
+        assert "Tool not found" in result["result"]["content"][0]["text"]
+        limiter = rate_limited_server._security_engine._rate_limiter
+        assert limiter.bucket_count == 0
+
+    def test_missing_tool_name_skips_rate_limiter(self, rate_limited_server: MCPServer):
+        """Should reject a call without a tool name before rate limiting."""
+        call_request = json.dumps(
+            {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"arguments": {}}}
+        )
+
+        result = json.loads(rate_limited_server.handle_message(call_request))
+
+        assert result["result"]["isError"] is True
+        assert "Tool not found" in result["result"]["content"][0]["text"]
+        assert rate_limited_server._security_engine._rate_limiter.bucket_count == 0
+
     def test_uses_context_manager(self, rate_limited_policy_file: Path):
         """Should support context manager for cleanup."""
         with MCPServer(policy_path=rate_limited_policy_file) as server:
@@ -328,6 +425,38 @@ class TestMCPServerSecurityIntegration:
 class TestServerPluginCleanup:
     """Tests for plugin cleanup during server shutdown [A5]."""
 
+    def test_startup_calls_plugin_startup(self, tmp_path: Path):
+        """Server.startup() should call startup on all registered plugins."""
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(MINIMAL_POLICY)
+
+        startup_called = []
+
+        class StartupTrackingPlugin(PluginBase):
+            @property
+            def name(self) -> str:
+                return "startup_tracker"
+
+            @property
+            def version(self) -> str:
+                return "1.0.0"
+
+            def get_tools(self) -> list[ToolDefinition]:
+                return []
+
+            def execute(self, tool_name: str, arguments: dict) -> ToolResult:
+                return ToolResult(content=[], is_error=True)
+
+            def startup(self) -> None:
+                startup_called.append(True)
+
+        server = MCPServer(policy_path=policy)
+        server.register_plugin(StartupTrackingPlugin())
+        server.startup()
+
+        assert startup_called == [True]
+        server.close()
+
     def test_close_calls_plugin_cleanup(self, tmp_path: Path):
         """Server.close() should call cleanup on all registered plugins."""
         # Create policy file
@@ -426,3 +555,135 @@ class TestServerPluginCleanup:
 
         # Should not raise
         server.close()
+
+
+INIT_REQUEST = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "clientInfo": {"name": "test", "version": "1.0"},
+            "capabilities": {},
+        },
+    }
+)
+
+
+class TestServePersistent:
+    """Tests for the --persist Unix socket loop in main.py."""
+
+    @pytest.fixture
+    def socket_path(self):
+        """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory(prefix="mcp-") as tmp:
+            yield Path(tmp) / "s.sock"
+
+    @staticmethod
+    def _start(server: MCPServer, socket_path: Path) -> Path:
+        """Serve server on socket_path from a daemon thread once it accepts."""
+        import socket
+        import threading
+        import time
+
+        from main import serve_persistent
+
+        server.register_plugin(MockPlugin())
+        threading.Thread(target=serve_persistent, args=(server, socket_path), daemon=True).start()
+
+        deadline = time.monotonic() + 5
+        while True:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(str(socket_path))
+                    return socket_path
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+            time.sleep(0.01)
+
+    @pytest.fixture
+    def persistent(self, server: MCPServer, socket_path: Path) -> Path:
+        """Socket path of a running persistent server."""
+        return self._start(server, socket_path)
+
+    @staticmethod
+    def _session(socket_path: Path, *lines: bytes) -> list[dict]:
+        """Send lines over one connection and return the decoded responses."""
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(5)
+            client.connect(str(socket_path))
+            client.sendall(b"".join(line + b"\n" for line in lines))
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile("rb") as reader:
+                return [json.loads(line) for line in reader]
+
+    def test_round_trip_session(self, persistent: Path):
+        """Should answer a full session over the socket."""
+        call = {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"message": "hi"}},
+        }
+
+        responses = self._session(
+            persistent,
+            INIT_REQUEST.encode(),
+            b'{"jsonrpc":"2.0","method":"notifications/initialized"}',
+            json.dumps(call).encode(),
+        )
+
+        assert [r["id"] for r in responses] == [1, 2]
+        assert responses[1]["result"]["content"][0]["text"] == "hi"
+
+    def test_reconnect_starts_new_session(self, persistent: Path):
+        """Should require a new handshake from each connection."""
+        list_request = b'{"jsonrpc":"2.0","id":2,"method":"tools/list"}'
+        self._session(persistent, INIT_REQUEST.encode())
+
+        (response,) = self._session(persistent, list_request)
+        assert "error" in response
+
+        responses = self._session(
+            persistent,
+            INIT_REQUEST.encode(),
+            b'{"jsonrpc":"2.0","method":"notifications/initialized"}',
+            list_request,
+        )
+        assert "result" in responses[1]
+
+    def test_malformed_line_drops_only_that_client(self, persistent: Path):
+        """Should disconnect a client sending invalid UTF-8 and keep serving."""
+        assert self._session(persistent, b"\xff\xfe") == []
+
+        (response,) = self._session(persistent, INIT_REQUEST.encode())
+        assert "result" in response
+
+    def test_does_not_take_over_live_socket(self, server: MCPServer, persistent: Path):
+        """Should refuse to start on a socket another instance is serving."""
+        from main import serve_persistent
+
+        assert serve_persistent(server, persistent) == 1
+
+        assert persistent.is_socket()
+        (response,) = self._session(persistent, INIT_REQUEST.encode())
+        assert "result" in response
+
+    def test_replaces_stale_socket(self, server: MCPServer, socket_path: Path):
+        """Should unlink a socket nobody listens on and bind in its place."""
+        import socket
+
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        self._start(server, socket_path)
+
+        (response,) = self._session(socket_path, INIT_REQUEST.encode())
+        assert "result" in response
@@ -66,6 +66,14 @@ class TestSanitizePath:
             with pytest.raises(ValidationError, match="traversal"):
                 sanitize_path("../../../etc/passwd", base_path=tmpdir)
 
+    def test_blocks_sibling_with_shared_prefix(self):
+        """Should treat the base as a directory, not a string prefix."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = os.path.join(tmpdir, "app")
+            os.makedirs(base)
+            with pytest.raises(ValidationError, match="traversal"):
+                sanitize_path(os.path.join(tmpdir, "app-secrets", "key"), base_path=base)
+
     def test_blocks_null_bytes(self):
         """Should block null bytes in paths."""
         with pytest.raises(ValidationError, match="null"):
@@ -298,3 +306,27 @@ class TestInputValidatorEdgeCases:
             "tool", schema, {"anything": "goes", "nested": {"data": 123}}
         )
         assert result["anything"] == "goes"
+
+    def test_reuses_compiled_schema_validator(
+        self, basic_policy: SecurityPolicy, temp_workspace: str
+    ):
+        """Should compile each schema once, in the cache tool definitions use."""
+        from src.json_schema import compile_validator
+
+        validator = InputValidator(basic_policy)
+        schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+
+        validator.validate_tool_input("tool", schema, {"count": 1})
+        hits = compile_validator.cache_info().hits
+        validator.validate_tool_input("tool", dict(schema), {"count": 2})
+
+        assert compile_validator.cache_info().hits == hits + 1
+        with pytest.raises(ValidationError, match="Schema validation failed"):
+            validator.validate_tool_input("tool", schema, {"count": "two"})
+
+    def test_rejects_invalid_schema(self, basic_policy: SecurityPolicy, temp_workspace: str):
+        """Should report an invalid tool schema as a validation error."""
+        validator = InputValidator(basic_policy)
+
+        with pytest.raises(ValidationError, match="Invalid schema"):
+            validator.validate_tool_input("tool", {"type": "not-a-type"}, {})
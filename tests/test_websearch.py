@@ -99,6 +99,16 @@ class TestWebSearchPlugin:
         call_args = plugin._client.get.call_args
         assert "lite.duckduckgo.com" in call_args[0][0]
 
+    def test_search_url_matches_urlencode(self):
+        """Should encode the query exactly as urlencode would."""
+        from urllib.parse import urlencode
+
+        from src.plugins.websearch import DUCKDUCKGO_LITE_URL, _search_url
+
+        query = "c++ & rust/é?x=1"
+        expected = f"{DUCKDUCKGO_LITE_URL}?{urlencode({'q': query, 'kl': 'us-en'})}"
+        assert _search_url(query) == expected
+
     def test_respects_max_results(self):
         """Should respect max_results parameter."""
         mock_response = MagicMock()
@@ -122,6 +132,85 @@ class TestWebSearchPlugin:
 
         assert result.is_error is False
 
+    def test_parses_links_and_snippets(self):
+        """Should pair result links with snippets and clean their text."""
+        html = (
+            '<a class="result__a" href="https://a.example">One &amp;  Two</a>'
+            '<a class="result__snippet">First\n   snippet</a>'
+            '<a class="result__a" href="https://b.example">Three</a>'
+        )
+
+        results = WebSearchPlugin()._parse_results(html, 5)
+
+        assert results == [
+            {"title": "One & Two", "url": "https://a.example", "snippet": "First snippet"},
+            {"title": "Three", "url": "https://b.example", "snippet": ""},
+        ]
+
+    def test_parse_pairs_snippet_with_preceding_link(self):
+        """A link without a snippet should not shift later snippets."""
+        html = (
+            '<a class="result__a" href="1">One</a>'
+            '<a class="result__a" href="2">Two</a>'
+            '<a class="result__snippet">S2</a>'
+            '<a class="result__a" href="3">Three</a>'
+            '<a class="result__snippet">S3</a>'
+        )
+
+        results = WebSearchPlugin()._parse_results(html, 2)
+
+        assert [(r["url"], r["snippet"]) for r in results] == [("1", ""), ("2", "S2")]
+
+    def test_parse_falls_back_to_nofollow_links(self):
+        """Should use rel=nofollow links only when no result links exist."""
+        html = '<a rel="nofollow" href="https://a.example">A</a><a class="snippet">SA</a>'
+        mixed = '<a rel="nofollow" href="https://a.example">A</a>' + (
+            '<a class="result-link" href="https://b.example">B</a>'
+        )
+
+        plugin = WebSearchPlugin()
+
+        assert plugin._parse_results(html, 5) == [
+            {"title": "A", "url": "https://a.example", "snippet": "SA"}
+        ]
+        assert [r["url"] for r in plugin._parse_results(mixed, 5)] == ["https://b.example"]
+
+    def test_clean_text_collapses_whitespace(self):
+        """Should collapse any whitespace run, including non-ASCII spaces."""
+        plugin = WebSearchPlugin()
+
+        assert plugin._clean_text("  Plain title ") == "Plain title"
+        assert plugin._clean_text("a  b\tc\n d") == "a b c d"
+        assert plugin._clean_text("a\xa0b") == "a b"
+
+    def test_repeated_search_uses_cache(self):
+        """Should reuse parsed results for the same query and max_results."""
+        mock_response = MagicMock()
+        mock_response.text = '<a class="result__a" href="https://a.example">A</a>'
+
+        plugin = WebSearchPlugin()
+        plugin._client.get = MagicMock(return_value=mock_response)
+
+        first = plugin.execute("web_search", {"query": "Test"})
+        second = plugin.execute("web_search", {"query": " test "})
+        plugin.execute("web_search", {"query": "test", "max_results": 2})
+
+        assert plugin._client.get.call_count == 2
+        assert "https://a.example" in second.content[0]["text"]
+        assert second.content[0]["text"].startswith("Search results for:  test ")
+        assert first.content[0]["text"].startswith("Search results for: Test")
+
+    def test_failed_search_is_not_cached(self):
+        """Should retry a search that previously failed."""
+        mock_response = MagicMock()
+        mock_response.text = "<html></html>"
+
+        plugin = WebSearchPlugin()
+        plugin._client.get = MagicMock(side_effect=[httpx.ConnectError("down"), mock_response])
+
+        assert plugin.execute("web_search", {"query": "test"}).is_error is True
+        assert plugin.execute("web_search", {"query": "test"}).is_error is False
+
 
 class TestWebSearchPluginSchemaBounds:
     """Tests for schema bounds on WebSearchPlugin [D2]."""
@@ -178,6 +267,14 @@ class TestWebSearchPluginConnectionPooling:
         plugin = WebSearchPlugin()
         assert plugin._client.timeout is not None
 
+    def test_client_uses_per_stage_timeouts(self):
+        """Should fail fast on connect and pool waits but allow slower reads."""
+        plugin = WebSearchPlugin()
+        timeout = plugin._client.timeout
+        assert timeout.connect == 2.0
+        assert timeout.read == 8.0
+        assert timeout.pool == 1.0
+
     def test_client_has_user_agent(self):
         """Should have user agent configured on the client."""
         plugin = WebSearchPlugin()